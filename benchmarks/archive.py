@@ -0,0 +1,86 @@
+"""
+Compares fetching one game from an archive to scanning a JSON Lines file, and measures appends and compaction
+
+Run with: python -m benchmarks.archive
+"""
+
+import copy
+import json
+import os
+import random
+import tempfile
+import time
+import timeit
+
+from lol_dto.classes.sources.riot_lol_api import RiotGameSource
+from lol_dto.utilities import dump_json_lines, load_json_lines, to_dict
+from lol_dto.utilities.archive import LolGameArchive
+from benchmarks.synthetic_game import make_game
+
+
+def scan_json_lines(filename, game_id):
+    for data in load_json_lines(filename, as_dict=True):
+        if data["sources"]["riotLolApi"]["gameId"] == game_id:
+            return data
+
+
+def main(number: int = 20, games: int = 200):
+    template = make_game()
+    lol_games = []
+
+    for game_id in range(games):
+        lol_game = copy.deepcopy(template)
+        lol_game.sources.riotLolApi = RiotGameSource(gameId=game_id, platformId="EUW1")
+        lol_games.append(lol_game)
+
+    rng = random.Random(0)
+    game_ids = [rng.randrange(games) for _ in range(number)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_lines_filename = os.path.join(directory, "games.jsonl")
+        archive_filename = os.path.join(directory, "games.lolar")
+
+        dump_json_lines(lol_games, json_lines_filename)
+
+        start = time.perf_counter()
+        with LolGameArchive(archive_filename, "a") as archive:
+            archive.extend(lol_games)
+        seconds = (time.perf_counter() - start) / games
+        print(f"{'append':>10}: {seconds * 1000:.3f} ms per game")
+
+        start = time.perf_counter()
+        archive = LolGameArchive(archive_filename)
+        print(f"{'open':>10}: {(time.perf_counter() - start) * 1000:.3f} ms")
+
+        assert scan_json_lines(json_lines_filename, game_ids[0]) == json.loads(
+            archive.get_bytes(("EUW1", game_ids[0]))
+        )
+        assert to_dict(archive.get(("EUW1", game_ids[0]))) == to_dict(
+            lol_games[game_ids[0]]
+        )
+
+        for name, function in (
+            ("scan", lambda i: scan_json_lines(json_lines_filename, i)),
+            ("bytes", lambda i: archive.get_bytes(("EUW1", i))),
+            ("game", lambda i: archive.get(("EUW1", i))),
+        ):
+            seconds = timeit.timeit(lambda: [function(i) for i in game_ids], number=1)
+            print(f"{name:>10}: {seconds * 1000 / number:.3f} ms per lookup")
+
+        archive.close()
+
+        # Replacing half the games leaves their old records in the file
+        with LolGameArchive(archive_filename, "a") as archive:
+            archive.extend(lol_games[::2])
+            size = os.path.getsize(archive_filename)
+
+            start = time.perf_counter()
+            archive.compact()
+            print(
+                f"{'compact':>10}: {(time.perf_counter() - start) * 1000:.1f} ms, "
+                f"{size / 1e6:.1f} MB -> {os.path.getsize(archive_filename) / 1e6:.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
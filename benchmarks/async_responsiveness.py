@@ -0,0 +1,129 @@
+"""
+Checks that the event loop stays responsive while games are dumped and loaded, on a fake slow filesystem
+
+A ticker coroutine measures how late it wakes up while 8 games are dumped then loaded back, first with the blocking
+functions called from coroutines, then with the async functions using threads, then using processes.
+
+Run with: python -m benchmarks.async_responsiveness
+"""
+
+import os
+import time
+import asyncio
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from lol_dto.utilities import async_io, dump_json, load_json, dump_json_lines
+from benchmarks.synthetic_game import make_game
+
+# Added to every file read and write
+FILESYSTEM_LATENCY = 0.05
+
+TICK = 0.005
+
+_read_text = async_io._read_text
+_write_text = async_io._write_text
+
+
+def slow_read_text(filename):
+    time.sleep(FILESYSTEM_LATENCY)
+    return _read_text(filename)
+
+
+def slow_write_text(filename, text):
+    time.sleep(FILESYSTEM_LATENCY)
+    _write_text(filename, text)
+
+
+async def measure_lag(coroutine) -> float:
+    """
+    Runs the coroutine and returns the maximum lateness in seconds of a ticker running alongside it
+    """
+    max_lag = 0
+    done = False
+
+    async def ticker():
+        nonlocal max_lag
+
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            max_lag = max(max_lag, time.perf_counter() - start - TICK)
+
+    ticker_task = asyncio.ensure_future(ticker())
+    # Lets the ticker start before the coroutine
+    await asyncio.sleep(0)
+
+    await coroutine
+    done = True
+    await ticker_task
+
+    return max_lag
+
+
+async def blocking(games, directory):
+    for i, game in enumerate(games):
+        time.sleep(FILESYSTEM_LATENCY)
+        dump_json(game, os.path.join(directory, f"{i}.json"))
+
+    for i in range(len(games)):
+        time.sleep(FILESYSTEM_LATENCY)
+        load_json(os.path.join(directory, f"{i}.json"))
+
+
+async def non_blocking(games, directory, executor=None):
+    await asyncio.gather(
+        *(
+            async_io.dump_json_async(
+                game, os.path.join(directory, f"{i}.json"), executor=executor
+            )
+            for i, game in enumerate(games)
+        )
+    )
+
+    loaded = [
+        g
+        async for g in async_io.iter_games_async(
+            directory, concurrency=4, executor=executor
+        )
+    ]
+    assert len(loaded) == len(games)
+
+
+async def main_async(games_count: int):
+    games = [make_game(seed=i) for i in range(games_count)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        lag = await measure_lag(blocking(games, directory))
+        print(f"{'blocking':>10}: {lag * 1000:.1f} ms max event loop lag")
+
+    with tempfile.TemporaryDirectory() as directory:
+        lag = await measure_lag(non_blocking(games, directory))
+        print(f"{'threads':>10}: {lag * 1000:.1f} ms max event loop lag")
+
+    # Serialization holds the GIL, so a process pool keeps the event loop even more responsive
+    with tempfile.TemporaryDirectory() as directory, ProcessPoolExecutor(2) as executor:
+        lag = await measure_lag(non_blocking(games, directory, executor))
+        print(f"{'processes':>10}: {lag * 1000:.1f} ms max event loop lag")
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "games.jsonl")
+        dump_json_lines(games, filename)
+
+        loaded = [g async for g in async_io.iter_games_async(filename)]
+        assert [g.duration for g in loaded] == [g.duration for g in games]
+
+
+def main(games_count: int = 8):
+    async_io._read_text = slow_read_text
+    async_io._write_text = slow_write_text
+
+    try:
+        asyncio.run(main_async(games_count))
+    finally:
+        async_io._read_text = _read_text
+        async_io._write_text = _write_text
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Compares the memory footprint of games loaded with and without the compact classes
+
+Run with: python -m benchmarks.compact_memory
+"""
+
+import gc
+import tracemalloc
+
+from lol_dto.utilities import from_dict, to_dict
+from benchmarks.synthetic_game import make_game
+
+
+def measure(data: dict, compact: bool, number: int) -> float:
+    """
+    Returns the memory used per game in bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    games = [from_dict(data, compact=compact) for _ in range(number)]
+    memory, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del games
+
+    return memory / number
+
+
+def main(number: int = 20):
+    data = to_dict(make_game())
+
+    for name, compact in ("default", False), ("compact", True):
+        memory = measure(data, compact, number)
+        print(f"{name:>10}: {memory / 1024:.0f} kB per game")
+
+
+if __name__ == "__main__":
+    main()
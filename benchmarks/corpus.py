@@ -0,0 +1,93 @@
+"""
+Compares queries on a LolGameCorpus to scans over every game, player, and pick
+
+Run with: python -m benchmarks.corpus
+"""
+
+import random
+import time
+import timeit
+
+from lol_dto.classes.sources.riot_lol_api import RiotPlayerSource
+from lol_dto.utilities.corpus import LolGameCorpus
+from benchmarks.synthetic_game import make_game
+
+
+def make_games(number: int):
+    rng = random.Random(0)
+    puuids = [f"puuid-{i}" for i in range(number)]
+
+    games = []
+
+    for seed in range(number):
+        lol_game = make_game(duration_minutes=1, seed=seed)
+        lol_game.patch = rng.choice(["12.1", "12.2", "12.3", "12.4"])
+        lol_game.queue_id = rng.choice([400, 420, 440, 450])
+        lol_game.picksBans = []
+
+        for team in lol_game.teams:
+            for player in team.players:
+                player.championId = rng.randint(1, 160)
+                player.sources.riotLolApi = RiotPlayerSource(puuid=rng.choice(puuids))
+
+        games.append(lol_game)
+
+    return games
+
+
+def scan(games, patch, champion_id, puuid, queue_id):
+    return (
+        [
+            g
+            for g in games
+            if g.patch == patch
+            and any(p.championId == champion_id for t in g.teams for p in t.players)
+        ],
+        [
+            g
+            for g in games
+            if any(
+                getattr(p.sources, "riotLolApi", None) is not None
+                and p.sources.riotLolApi.puuid == puuid
+                for t in g.teams
+                for p in t.players
+            )
+        ],
+        [g for g in games if g.queue_id == queue_id],
+    )
+
+
+def query(corpus, patch, champion_id, puuid, queue_id):
+    return (
+        corpus.query(patch=patch, pick=champion_id),
+        corpus.query(puuid=puuid),
+        corpus.query(queue_id=queue_id),
+    )
+
+
+def main(number: int = 20, games: int = 2000):
+    lol_games = make_games(games)
+
+    start = time.perf_counter()
+    corpus = LolGameCorpus(lol_games)
+    print(
+        f"{'build':>10}: {(time.perf_counter() - start) * 1e6 / games:.1f} µs per game, "
+        f"{corpus.memory_usage()['total'] / 1e6:.1f} MB of indexes"
+    )
+
+    arguments = ("12.3", 157, "puuid-42", 420)
+    assert scan(lol_games, *arguments) == query(corpus, *arguments)
+
+    for name, function in ("scan", scan), ("corpus", query):
+        target = lol_games if function is scan else corpus
+        seconds = timeit.timeit(lambda: function(target, *arguments), number=number)
+        print(f"{name:>10}: {seconds * 1000 / number:.3f} ms for 3 queries")
+
+    seconds = timeit.timeit(
+        lambda: (corpus.remove(lol_games[0]), corpus.add(lol_games[0])), number=number
+    )
+    print(f"{'remove+add':>10}: {seconds * 1e6 / number:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Compares to_dict to dataclasses.asdict followed by delete_empty_fields, which dump_json used before
+
+Run with: python -m benchmarks.dump_json
+"""
+
+import dataclasses
+import timeit
+
+from lol_dto.utilities import to_dict
+from lol_dto.utilities.dump_json import delete_empty_fields
+from benchmarks.synthetic_game import make_game
+
+
+def asdict_and_delete_empty_fields(lol_game):
+    return delete_empty_fields(dataclasses.asdict(lol_game))
+
+
+def main(number: int = 20):
+    lol_game = make_game()
+
+    assert to_dict(lol_game) == asdict_and_delete_empty_fields(lol_game)
+
+    for name, function in (
+        ("asdict", asdict_and_delete_empty_fields),
+        ("to_dict", to_dict),
+    ):
+        seconds = timeit.timeit(lambda: function(lol_game), number=number) / number
+        print(f"{name:>10}: {seconds * 1000:.2f} ms per game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Compares the end of game stats aggregator to one pass over the events per player and stat, and measures incremental
+updates when kills are appended one by one
+
+Run with: python -m benchmarks.end_of_game_stats
+"""
+
+import copy
+import time
+import timeit
+
+from lol_dto.classes.game import (
+    LolGameKill,
+    LolGamePlayerEndOfGameStats,
+    LolGameTeamEndOfGameStats,
+)
+from lol_dto.utilities import to_dict
+from lol_dto.utilities.end_of_game_stats import (
+    MULTI_KILL_WINDOW,
+    MULTI_KILLS_FIELDS,
+    PENTA_KILL_WINDOW,
+    EndOfGameStatsAggregator,
+    fill_end_of_game_stats,
+)
+from benchmarks.synthetic_game import make_game
+
+
+def fill_with_passes(lol_game):
+    """
+    Computes the same stats as the aggregator, with one pass over the events per player and stat
+    """
+    sides = dict(zip(("BLUE", "RED"), lol_game.teams))
+    kills = sorted(lol_game.kills, key=lambda k: k.timestamp)
+    player_ids = {p.id for team in lol_game.teams for p in team.players}
+
+    buildings = sorted(
+        ((side, b) for side, team in sides.items() for b in team.buildingsKills),
+        key=lambda e: e[1].timestamp,
+    )
+    monsters = sorted(
+        ((side, m) for side, team in sides.items() for m in team.epicMonstersKills),
+        key=lambda e: e[1].timestamp,
+    )
+
+    def first(events, event_type):
+        return next(((s, e) for s, e in events if e.type == event_type), (None, None))
+
+    first_blood = next((k for k in kills if k.killerId in player_ids), None)
+    firsts = {
+        "firstBlood": first_blood,
+        "firstTurret": first(buildings, "TURRET")[1],
+        "firstInhibitor": first(buildings, "INHIBITOR")[1],
+    }
+
+    for side, team in sides.items():
+        stats = team.endOfGameStats
+        stats.turretKills = sum(b.type == "TURRET" for b in team.buildingsKills)
+        stats.inhibitorKills = sum(b.type == "INHIBITOR" for b in team.buildingsKills)
+        stats.dragonKills = sum(m.type == "DRAGON" for m in team.epicMonstersKills)
+        stats.baronKills = sum(m.type == "BARON" for m in team.epicMonstersKills)
+        stats.riftHeraldKills = sum(
+            m.type == "RIFT_HERALD" for m in team.epicMonstersKills
+        )
+        stats.firstTurret = first(buildings, "TURRET")[0] == side
+        stats.firstInhibitor = first(buildings, "INHIBITOR")[0] == side
+        stats.firstDragon = first(monsters, "DRAGON")[0] == side
+        stats.firstBaron = first(monsters, "BARON")[0] == side
+        stats.firstRiftHerald = first(monsters, "RIFT_HERALD")[0] == side
+
+        for player in team.players:
+            stats = player.endOfGameStats
+            stats.kills = sum(k.killerId == player.id for k in kills)
+            stats.deaths = sum(k.victimId == player.id for k in kills)
+            stats.assists = sum(player.id in (k.assistsIds or ()) for k in kills)
+
+            # Killing sprees and multi-kills
+            streak, multi_kill, last_timestamp = 0, 0, None
+            stats.killingSprees = stats.largestKillingSpree = 0
+            for name in MULTI_KILLS_FIELDS.values():
+                setattr(stats, name, 0)
+
+            for kill in kills:
+                if kill.killerId == player.id:
+                    streak += 1
+                    if streak == 2:
+                        stats.killingSprees += 1
+                    if streak >= 2:
+                        stats.largestKillingSpree = max(
+                            stats.largestKillingSpree, streak
+                        )
+
+                    window = PENTA_KILL_WINDOW if multi_kill == 4 else MULTI_KILL_WINDOW
+                    if (
+                        last_timestamp is not None
+                        and kill.timestamp - last_timestamp <= window
+                        and multi_kill < 5
+                    ):
+                        multi_kill += 1
+                    else:
+                        multi_kill = 1
+                    last_timestamp = kill.timestamp
+
+                    if multi_kill in MULTI_KILLS_FIELDS:
+                        name = MULTI_KILLS_FIELDS[multi_kill]
+                        setattr(stats, name, getattr(stats, name) + 1)
+
+                elif kill.victimId == player.id:
+                    streak, multi_kill, last_timestamp = 0, 0, None
+
+            for building_type, name in ("TURRET", "turret"), ("INHIBITOR", "inhibitor"):
+                setattr(
+                    stats,
+                    f"{name}Kills",
+                    sum(
+                        b.type == building_type and b.killerId == player.id
+                        for _, b in buildings
+                    ),
+                )
+                setattr(
+                    stats,
+                    f"{name}Takedowns",
+                    sum(
+                        b.type == building_type
+                        and player.id in (b.killerId, *(b.assistsIds or ()))
+                        for _, b in buildings
+                    ),
+                )
+
+            stats.dragonKills = sum(
+                m.type == "DRAGON" and m.killerId == player.id for _, m in monsters
+            )
+            stats.baronKills = sum(
+                m.type == "BARON" and m.killerId == player.id for _, m in monsters
+            )
+
+            for name, event in firsts.items():
+                if event is not None:
+                    setattr(stats, name, event.killerId == player.id)
+                    setattr(
+                        stats, f"{name}Assist", player.id in (event.assistsIds or ())
+                    )
+
+
+def _make_empty_stats_game(seed: int):
+    lol_game = make_game(seed=seed)
+
+    for team in lol_game.teams:
+        team.endOfGameStats = LolGameTeamEndOfGameStats()
+        for player in team.players:
+            player.endOfGameStats = LolGamePlayerEndOfGameStats()
+
+    return lol_game
+
+
+def _get_stats(lol_game) -> list:
+    return [
+        to_dict(stats)
+        for team in lol_game.teams
+        for stats in (team.endOfGameStats, *(p.endOfGameStats for p in team.players))
+    ]
+
+
+def main(number: int = 20, kills: int = 2000):
+    # Both functions need to compute the same stats for the comparison to be fair
+    for seed in range(20):
+        passes_game, aggregator_game = _make_empty_stats_game(
+            seed
+        ), _make_empty_stats_game(seed)
+        fill_with_passes(passes_game)
+        fill_end_of_game_stats(aggregator_game)
+        assert _get_stats(passes_game) == _get_stats(aggregator_game)
+
+    lol_game = make_game()
+
+    for name, function in (
+        ("passes", fill_with_passes),
+        ("aggregator", lambda g: fill_end_of_game_stats(g, overwrite=True)),
+    ):
+        seconds = timeit.timeit(lambda: function(lol_game), number=number) / number
+        print(f"{name:>10}: {seconds * 1000:.3f} ms per game")
+
+    # Live game: kills are appended one at a time, and stats are updated after each of them
+    live_game = copy.deepcopy(lol_game)
+    live_game.kills = []
+    new_kills = [
+        LolGameKill(timestamp=i, killerId=i % 10 + 1, victimId=(i + 3) % 10 + 1)
+        for i in range(kills)
+    ]
+
+    for name, incremental in ("rescan", False), ("update", True):
+        live_game.kills = []
+        aggregator = EndOfGameStatsAggregator(live_game)
+
+        start = time.perf_counter()
+
+        for kill in new_kills:
+            live_game.kills.append(kill)
+
+            if incremental:
+                aggregator.update().apply()
+            else:
+                fill_end_of_game_stats(live_game, overwrite=True)
+
+        seconds = (time.perf_counter() - start) / kills
+        print(f"{name:>10}: {seconds * 1000:.3f} ms per appended kill")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures the import time of lol_dto modules with python -X importtime, and fails if it goes over a budget
+
+Run with: python -m benchmarks.import_time [--max-ms 50]
+"""
+
+import argparse
+import subprocess
+import sys
+
+MODULES = [
+    "lol_dto",
+    "lol_dto.classes.game.position",
+    "lol_dto.classes.game.lol_game",
+    "lol_dto.utilities",
+]
+
+
+def import_time(module: str, number: int = 5) -> float:
+    """
+    Returns the best import time of the module in ms, measured in fresh interpreters
+
+    Parent packages are imported first and appear as separate top-level entries, so the cumulative times of all
+    top-level lol_dto entries are added.
+    """
+    times = []
+
+    for _ in range(number):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Lines look like "import time:       834 |      26101 | lol_dto.classes.game.position", nested imports
+        #   having their name indented
+        times.append(
+            sum(
+                int(cumulative) / 1000
+                for _, cumulative, name in (
+                    line.split("|") for line in process.stderr.splitlines()[1:]
+                )
+                if name.startswith(" lol_dto")
+            )
+        )
+
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    over_budget = False
+
+    for module in MODULES:
+        milliseconds = import_time(module)
+        print(f"{module:>32}: {milliseconds:.1f} ms")
+
+        if args.max_ms is not None and milliseconds > args.max_ms:
+            over_budget = True
+
+    if over_budget:
+        sys.exit(f"Import time over the {args.max_ms} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Compares eager loading to lazy loading, when only reading the last snapshot of each player
+
+Run with: python -m benchmarks.lazy_loading
+"""
+
+import timeit
+import tracemalloc
+
+from lol_dto.utilities import to_dict, from_dict
+from benchmarks.synthetic_game import make_game
+
+
+def last_snapshots_gold(data: dict, lazy: bool) -> list:
+    lol_game = from_dict(data, lazy=lazy)
+
+    return [
+        player.snapshots[-1].totalGold
+        for team in lol_game.teams
+        for player in team.players
+    ]
+
+
+def main(number: int = 20):
+    data = to_dict(make_game())
+
+    assert last_snapshots_gold(data, True) == last_snapshots_gold(data, False)
+
+    for name, lazy in ("eager", False), ("lazy", True):
+        seconds = (
+            timeit.timeit(lambda: last_snapshots_gold(data, lazy), number=number)
+            / number
+        )
+
+        # The dictionaries are shared with the lazy lists, so only created objects are counted
+        tracemalloc.start()
+        lol_game = from_dict(data, lazy=lazy)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{name:>10}: {seconds * 1000:.2f} ms to load and read, {size / 1000:.0f} kB of objects"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares LiveLolGameBuilder snapshots to deep copies of the game being built, while events are appended
+
+Run with: python -m benchmarks.live_builder
+"""
+
+import copy
+import timeit
+
+from lol_dto.utilities import to_dict
+from lol_dto.utilities.live import LiveLolGameBuilder, PLAYER_LISTS, TEAM_LISTS
+from benchmarks.synthetic_game import make_game
+
+
+def make_feed(lol_game):
+    """
+    Returns the game without its events, and its events sorted by timestamp as (side or player id, event) tuples
+    """
+    events = [(k.timestamp, None, k) for k in lol_game.kills]
+    lol_game.kills = []
+
+    for side, team in zip(("BLUE", "RED"), lol_game.teams):
+        for list_name in TEAM_LISTS.values():
+            events.extend((e.timestamp, side, e) for e in getattr(team, list_name))
+            setattr(team, list_name, [])
+
+        for player in team.players:
+            for list_name in PLAYER_LISTS.values():
+                events.extend(
+                    (e.timestamp, player.id, e) for e in getattr(player, list_name)
+                )
+                setattr(player, list_name, [])
+
+    events.sort(key=lambda e: e[0])
+
+    return lol_game, [(target, event) for _, target, event in events]
+
+
+def main(number: int = 20):
+    full_game = make_game()
+
+    # Events are fed in chronological order, so the reference game needs sorted lists
+    full_game.kills.sort(key=lambda e: e.timestamp)
+    for team in full_game.teams:
+        for list_name in TEAM_LISTS.values():
+            getattr(team, list_name).sort(key=lambda e: e.timestamp)
+
+        for player in team.players:
+            for list_name in PLAYER_LISTS.values():
+                getattr(player, list_name).sort(key=lambda e: e.timestamp)
+
+    lol_game, feed = make_feed(copy.deepcopy(full_game))
+
+    builder = LiveLolGameBuilder(lol_game)
+
+    for target, event in feed:
+        if target is None:
+            builder.add_kill(event)
+        elif isinstance(target, str):
+            builder.add_team_event(target, event)
+        else:
+            builder.add_player_event(target, event)
+
+    # Snapshots are cached until the next addition, so one is made after each append
+    def snapshot():
+        builder.set_fields(duration=full_game.duration)
+        return builder.snapshot()
+
+    assert to_dict(snapshot()) == to_dict(full_game)
+
+    for name, function in (
+        ("deepcopy", lambda: copy.deepcopy(builder.lol_game)),
+        ("snapshot", snapshot),
+    ):
+        seconds = timeit.timeit(function, number=number) / number
+        print(f"{name:>10}: {seconds * 1000:.3f} ms per consistent view")
+
+    seconds = (
+        timeit.timeit(
+            lambda: builder.delta_since(full_game.duration - 60), number=number
+        )
+        / number
+    )
+    print(f"{'delta':>10}: {seconds * 1000:.3f} ms for the last minute delta")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Compares from_dict to a naive loader walking dataclasses.fields() for every object
+
+Run with: python -m benchmarks.load_json
+"""
+
+import dataclasses
+import timeit
+import typing
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities import from_dict
+from lol_dto.utilities.dump_json import delete_empty_fields
+from benchmarks.synthetic_game import make_game
+
+
+def naive_from_dict(data, cls=LolGame):
+    type_hints = typing.get_type_hints(cls)
+    kwargs = {}
+
+    for f in dataclasses.fields(cls):
+        if f.name not in data:
+            continue
+
+        value = data[f.name]
+        type_hint = type_hints[f.name]
+
+        if dataclasses.is_dataclass(type_hint) and isinstance(value, dict):
+            value = naive_from_dict(value, type_hint)
+        elif getattr(type_hint, "__origin__", None) is list and value:
+            item_type = type_hint.__args__[0]
+            if dataclasses.is_dataclass(item_type):
+                value = [naive_from_dict(v, item_type) for v in value]
+
+        kwargs[f.name] = value
+
+    return cls(**kwargs)
+
+
+def main(number: int = 20):
+    data = delete_empty_fields(dataclasses.asdict(make_game()))
+
+    for name, function in ("naive", naive_from_dict), ("from_dict", from_dict):
+        seconds = timeit.timeit(lambda: function(data), number=number) / number
+        print(f"{name:>10}: {seconds * 1000:.2f} ms per game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Merges two full-timeline games of the same match, comparing merge_games to a quadratic events matching
+
+Run with: python -m benchmarks.merge_games
+"""
+
+import copy
+import random
+import time
+
+from lol_dto.classes.game import LolGamePlayerSpellUseEvent
+from lol_dto.utilities.merge import merge_games, EVENTS_KEYS, _fill_missing
+from benchmarks.synthetic_game import make_game
+
+
+def make_second_source(lol_game, seed: int = 1):
+    """
+    Returns a copy of the game with jittered timestamps and no positions, like a second data source would
+    """
+    rng = random.Random(seed)
+    other = copy.deepcopy(lol_game)
+
+    for team in other.teams:
+        for player in team.players:
+            for event in player.itemsEvents + player.wardsEvents + player.spellsUses:
+                event.timestamp += rng.uniform(-0.5, 0.5)
+
+    for kill in other.kills:
+        kill.timestamp += rng.uniform(-0.5, 0.5)
+        kill.position = None
+
+    return other
+
+
+def naive_merge_events(events, other_events, key_fields, tolerance):
+    merged = list(events)
+
+    for other_event in other_events:
+        for event in merged:
+            if abs(event.timestamp - other_event.timestamp) <= tolerance and all(
+                getattr(event, f) == getattr(other_event, f) for f in key_fields
+            ):
+                _fill_missing(event, other_event)
+                break
+        else:
+            merged.append(other_event)
+
+    return merged
+
+
+def naive_merge_games(lol_game, other, tolerance=1.0, copy_games=True):
+    if copy_games:
+        lol_game, other = copy.deepcopy(lol_game), copy.deepcopy(other)
+
+    for team, other_team in zip(lol_game.teams, other.teams):
+        for player, other_player in zip(team.players, other_team.players):
+            for list_name in (
+                "itemsEvents",
+                "wardsEvents",
+                "skillsLevelUpEvents",
+                "spellsUses",
+            ):
+                setattr(
+                    player,
+                    list_name,
+                    naive_merge_events(
+                        getattr(player, list_name),
+                        getattr(other_player, list_name),
+                        EVENTS_KEYS[list_name],
+                        tolerance,
+                    ),
+                )
+
+    lol_game.kills = naive_merge_events(
+        lol_game.kills, other.kills, EVENTS_KEYS["kills"], tolerance
+    )
+
+    return lol_game
+
+
+def main(number: int = 3, spells_uses: int = 2000):
+    lol_game = make_game(duration_minutes=45)
+
+    # Spectator-derived data has many spells uses, which makes quadratic matching slow
+    rng = random.Random(0)
+    for team in lol_game.teams:
+        for player in team.players:
+            player.spellsUses = sorted(
+                (
+                    LolGamePlayerSpellUseEvent(
+                        timestamp=rng.uniform(0, lol_game.duration),
+                        key=rng.choice("QWER"),
+                    )
+                    for _ in range(spells_uses)
+                ),
+                key=lambda e: e.timestamp,
+            )
+
+    other = make_second_source(lol_game)
+
+    merged = merge_games(lol_game, other)
+    assert len(merged.kills) == len(lol_game.kills)
+
+    for name, function in ("naive", naive_merge_games), ("merge_games", merge_games):
+        # Inputs are copied outside of the timed section
+        inputs = [copy.deepcopy((lol_game, other)) for _ in range(number)]
+
+        start = time.perf_counter()
+        for game, other_game in inputs:
+            function(game, other_game, copy_games=False)
+        seconds = (time.perf_counter() - start) / number
+
+        print(f"{name:>12}: {seconds * 1000:.2f} ms per merge")
+
+
+if __name__ == "__main__":
+    main()
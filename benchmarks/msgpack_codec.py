@@ -0,0 +1,48 @@
+"""
+Compares the size and speed of the MessagePack codec to the JSON output of dump_json
+
+Run with: python -m benchmarks.msgpack_codec
+"""
+
+import json
+import timeit
+import zlib
+
+from lol_dto.utilities import to_dict, from_dict
+from lol_dto.utilities.msgpack_codec import to_msgpack, from_msgpack
+from benchmarks.synthetic_game import make_game
+
+
+def to_json(lol_game) -> bytes:
+    return json.dumps(to_dict(lol_game)).encode()
+
+
+def from_json(data: bytes):
+    return from_dict(json.loads(data))
+
+
+def main(number: int = 20):
+    lol_game = make_game()
+
+    codecs = (
+        ("json", to_json, from_json),
+        ("msgpack", to_msgpack, from_msgpack),
+        ("delta", lambda g: to_msgpack(g, delta=True), from_msgpack),
+    )
+
+    for name, encode, decode in codecs:
+        data = encode(lol_game)
+
+        assert to_dict(decode(data)) == to_dict(lol_game)
+
+        encode_seconds = timeit.timeit(lambda: encode(lol_game), number=number)
+        decode_seconds = timeit.timeit(lambda: decode(data), number=number)
+
+        print(
+            f"{name:>10}: {len(data) / 1000:.1f} kB, {len(zlib.compress(data)) / 1000:.1f} kB compressed, "
+            f"{encode_seconds / number * 1000:.2f} ms to encode, {decode_seconds / number * 1000:.2f} ms to decode"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Compares replaying items and skills events from the start of the game for every query to checkpointed state_at()
+queries, and sampling all players with state_at() to the vectorized sampler
+
+Run with: python -m benchmarks.player_state
+"""
+
+import random
+import timeit
+
+from lol_dto.classes.game import LolGamePlayerItemEvent
+from lol_dto.utilities.player_state import (
+    SKILL_SLOTS,
+    UNDOABLE_ITEM_TYPES,
+    _Inventory,
+    _sorted_events,
+    sample_players_states,
+)
+from benchmarks.synthetic_game import make_game
+
+
+def replay_state(player, timestamp):
+    inventory = _Inventory()
+    for event in _sorted_events(player.itemsEvents):
+        if event.timestamp > timestamp:
+            break
+        inventory.apply(event)
+
+    skills = {slot: 0 for slot in SKILL_SLOTS}
+    for event in _sorted_events(player.skillsLevelUpEvents):
+        if event.timestamp > timestamp:
+            break
+        if event.type == "NORMAL" and event.slot in skills:
+            skills[event.slot] += 1
+
+    return inventory.items, skills
+
+
+def main(number: int = 5, queries: int = 2000):
+    lol_game = make_game()
+    rng = random.Random(0)
+
+    players = [player for team in lol_game.teams for player in team.players]
+
+    # Undo events make the replay order-dependent
+    for player in players:
+        player.itemsEvents.extend(
+            LolGamePlayerItemEvent(
+                timestamp=e.timestamp + 1,
+                type="UNDO",
+                id=e.id if e.type == "SOLD" else 0,
+                beforeUndoId=e.id if e.type == "PURCHASED" else 0,
+            )
+            for e in player.itemsEvents[::10]
+            if e.type in UNDOABLE_ITEM_TYPES
+        )
+
+    queries = [
+        (rng.choice(players), rng.uniform(0, lol_game.duration)) for _ in range(queries)
+    ]
+
+    for player, timestamp in queries[:200]:
+        state = player.state_at(timestamp)
+        assert (state.items, state.skillsLevels) == replay_state(player, timestamp)
+
+    for name, function in (
+        ("replay", replay_state),
+        ("state_at", lambda p, t: p.state_at(t)),
+    ):
+        seconds = (
+            timeit.timeit(lambda: [function(p, t) for p, t in queries], number=number)
+            / number
+            / len(queries)
+        )
+        print(f"{name:>10}: {seconds * 1e6:.1f} µs per query")
+
+    def sample_with_state_at():
+        return [
+            [player.state_at(t) for t in range(0, lol_game.duration + 1, 10)]
+            for player in players
+        ]
+
+    sampled = sample_players_states(lol_game, interval=10)
+    states = sample_with_state_at()
+    assert all(
+        list(sampled.items[row, column][: len(state.items)]) == state.items
+        for row, player_states in enumerate(states)
+        for column, state in enumerate(player_states)
+    )
+
+    for name, function in (
+        ("state_at", sample_with_state_at),
+        ("sampler", lambda: sample_players_states(lol_game, interval=10)),
+    ):
+        seconds = timeit.timeit(function, number=number) / number
+        print(f"{name:>10}: {seconds * 1000:.2f} ms to sample all players every 10s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Compares loading a full game to loading only the fields needed for draft analysis
+
+Run with: python -m benchmarks.projection
+"""
+
+import json
+import timeit
+import tracemalloc
+
+from lol_dto.utilities import to_dict, from_dict
+from benchmarks.synthetic_game import make_game
+
+DRAFT_FIELDS = [
+    "winner",
+    "picksBans",
+    "teams.*.players.*.championId",
+    "teams.*.players.*.endOfGameStats",
+]
+
+
+def main(number: int = 20):
+    text = json.dumps(to_dict(make_game()))
+    data = json.loads(text)
+
+    for name, fields in ("full", None), ("draft", DRAFT_FIELDS):
+        from_dict_seconds = (
+            timeit.timeit(lambda: from_dict(data, fields=fields), number=number)
+            / number
+        )
+        total_seconds = (
+            timeit.timeit(
+                lambda: from_dict(json.loads(text), fields=fields), number=number
+            )
+            / number
+        )
+
+        tracemalloc.start()
+        lol_game = from_dict(data, fields=fields)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert lol_game.winner == data["winner"]
+
+        print(
+            f"{name:>10}: {from_dict_seconds * 1000:.2f} ms to create, "
+            f"{total_seconds * 1000:.2f} ms with JSON parsing, {size / 1000:.0f} kB"
+        )
+
+
+if __name__ == "__main__":
+    main()
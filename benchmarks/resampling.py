@@ -0,0 +1,79 @@
+"""
+Compares resampling snapshots every 15 seconds with a loop over players and fields to the vectorized resampling of a
+batch of games
+
+Run with: python -m benchmarks.resampling
+"""
+
+import timeit
+
+import numpy
+
+from lol_dto.utilities.resampling import (
+    CARRIED_FIELDS,
+    INTERPOLATED_FIELDS,
+    resample,
+    resample_games,
+)
+from lol_dto.utilities.timeline import snapshots_array, timeline_arrays
+from benchmarks.synthetic_game import make_game
+
+
+def resample_with_loop(lol_games, interval):
+    results = []
+
+    for lol_game in lol_games:
+        for team in lol_game.teams:
+            for player in team.players:
+                array = snapshots_array(player)
+                timestamps = numpy.arange(0, array["timestamp"][-1] + 1, interval)
+                result = {}
+
+                for name in INTERPOLATED_FIELDS:
+                    valid = ~numpy.isnan(array[name])
+                    result[name] = (
+                        numpy.interp(
+                            timestamps,
+                            array["timestamp"][valid],
+                            array[name][valid],
+                            left=numpy.nan,
+                            right=numpy.nan,
+                        )
+                        if valid.any()
+                        else numpy.full(len(timestamps), numpy.nan)
+                    )
+
+                for name in CARRIED_FIELDS:
+                    valid = ~numpy.isnan(array[name])
+                    index = numpy.searchsorted(
+                        array["timestamp"][valid], timestamps, side="right"
+                    )
+                    result[name] = numpy.append(numpy.nan, array[name][valid])[index]
+
+                results.append(result)
+
+    return results
+
+
+def main(number: int = 5, games: int = 50, interval: int = 15):
+    lol_games = [make_game(seed=seed) for seed in range(games)]
+
+    resampled = resample_games(lol_games, interval)
+    resampled = resampled.reshape(-1, resampled.shape[-1])
+    for row, result in zip(resampled, resample_with_loop(lol_games, interval)):
+        for name, values in result.items():
+            assert numpy.allclose(row[name], values, equal_nan=True)
+
+    stacked = numpy.stack([timeline_arrays(lol_game) for lol_game in lol_games])
+
+    for name, function in (
+        ("loop", lambda: resample_with_loop(lol_games, interval)),
+        ("resample_games", lambda: resample_games(lol_games, interval)),
+        ("resample (arrays)", lambda: resample(stacked, interval)),
+    ):
+        seconds = timeit.timeit(function, number=number) / number
+        print(f"{name:>20}: {seconds * 1000 / games:.3f} ms per game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Compares the generated schema codec to to_dict and from_dict, and its cold and warm creation times
+
+Run with: python -m benchmarks.schema_codec
+"""
+
+import time
+import timeit
+import tempfile
+
+from lol_dto.utilities import to_dict, from_dict
+from lol_dto.utilities import schema
+from benchmarks.synthetic_game import make_game
+
+
+def main(number: int = 20):
+    lol_game = make_game()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for name in "cold", "warm":
+            schema._codecs.clear()
+
+            start = time.perf_counter()
+            codec = schema.get_codec(cache_dir=cache_dir)
+            print(
+                f"{name:>10}: {(time.perf_counter() - start) * 1000:.2f} ms to get the codec"
+            )
+
+    data = to_dict(lol_game)
+    assert codec.encode(lol_game) == data
+    assert to_dict(codec.decode(data)) == data
+
+    for name, function, argument in (
+        ("to_dict", to_dict, lol_game),
+        ("encode", codec.encode, lol_game),
+        ("from_dict", from_dict, data),
+        ("decode", codec.decode, data),
+    ):
+        seconds = timeit.timeit(lambda: function(argument), number=number) / number
+        print(f"{name:>10}: {seconds * 1000:.2f} ms per game")
+
+
+if __name__ == "__main__":
+    main()
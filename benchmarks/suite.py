@@ -0,0 +1,372 @@
+"""
+Runs a set of benchmarks on the synthetic game and saves machine-readable results, to compare them across commits
+
+Timings are the time per call in ms, repeated to get their min, median, mean, and stdev. Memory results are measured
+once, in kB per game.
+
+Run with:
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --output after.json
+    python -m benchmarks.suite --compare before.json after.json
+"""
+
+import argparse
+import copy
+import dataclasses
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from lol_dto.names_helper.name_resolver import (
+    StaticDataBackend,
+    resolve_names,
+    set_backend,
+)
+from lol_dto.utilities import dump_json, from_dict, to_dict
+from lol_dto.utilities.dump_json import delete_empty_fields
+from lol_dto.utilities.validation import validate_game
+from benchmarks.synthetic_game import make_game
+
+# Benchmark name -> function creating (run, prepare) from a game and its dictionary
+# run is called with the result of prepare, which runs right before each call and is not timed
+TIMINGS: Dict[str, Callable] = {}
+
+# Benchmark name -> function returning a value from a game and its dictionary
+MEMORY: Dict[str, Callable] = {}
+
+
+def timing(name: str):
+    def decorator(function: Callable):
+        TIMINGS[name] = function
+        return function
+
+    return decorator
+
+
+def memory(name: str):
+    def decorator(function: Callable):
+        MEMORY[name] = function
+        return function
+
+    return decorator
+
+
+@timing("make_game")
+def _make_game(lol_game, data):
+    return lambda _: make_game(), None
+
+
+@timing("from_dict")
+def _from_dict(lol_game, data):
+    return lambda _: from_dict(data), None
+
+
+@timing("from_dict_compact")
+def _from_dict_compact(lol_game, data):
+    return lambda _: from_dict(data, compact=True), None
+
+
+@timing("to_dict")
+def _to_dict(lol_game, data):
+    return lambda _: to_dict(lol_game), None
+
+
+@timing("dump_json")
+def _dump_json(lol_game, data):
+    # Writing to the null device measures serialization without disk writes
+    return lambda _: dump_json(lol_game, os.devnull), None
+
+
+@timing("asdict")
+def _asdict(lol_game, data):
+    return lambda _: dataclasses.asdict(lol_game), None
+
+
+@timing("delete_empty_fields")
+def _delete_empty_fields(lol_game, data):
+    # delete_empty_fields modifies the dictionary, so each call gets a new one
+    full_data = dataclasses.asdict(lol_game)
+
+    return delete_empty_fields, lambda: copy.deepcopy(full_data)
+
+
+@timing("validate_game")
+def _validate_game(lol_game, data):
+    return lambda _: validate_game(lol_game), None
+
+
+def _get_names(lol_game) -> List[str]:
+    names = []
+
+    for team in lol_game.teams:
+        names.extend(team.bansNames)
+
+        for player in team.players:
+            names.append(player.championName)
+            names.append(player.primaryRuneTreeName)
+            names.append(player.secondaryRuneTreeName)
+            names.extend(rune.name for rune in player.runes)
+            names.extend(spell.name for spell in player.summonerSpells)
+            names.extend(event.name for event in player.itemsEvents)
+
+    return names
+
+
+class _PlaceholderNamesBackend:
+    def get_name(self, object_type: str, object_id: int, patch: str = None) -> str:
+        return f"{object_type} {object_id}"
+
+
+def _set_static_data_backend(lol_game):
+    # Static data is built from the ids of the game, so that every name is found
+    set_backend(_PlaceholderNamesBackend())
+
+    names = {}
+    for (object_type, object_id), name in resolve_names(lol_game).items():
+        names.setdefault(object_type, {})[object_id] = name
+
+    set_backend(StaticDataBackend(names))
+
+
+@timing("names_cold")
+def _names_cold(lol_game, data):
+    # Setting the backend clears the names cache
+    return lambda _: _get_names(lol_game), lambda: _set_static_data_backend(lol_game)
+
+
+@timing("names_warm")
+def _names_warm(lol_game, data):
+    _set_static_data_backend(lol_game)
+    _get_names(lol_game)
+
+    return lambda _: _get_names(lol_game), None
+
+
+@timing("resolve_names")
+def _resolve_names(lol_game, data):
+    return lambda _: resolve_names(lol_game), lambda: _set_static_data_backend(lol_game)
+
+
+def _measure_memory(create: Callable, number: int = 10) -> float:
+    gc.collect()
+    tracemalloc.start()
+
+    objects = [create() for _ in range(number)]
+    size, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del objects
+
+    return size / number / 1024
+
+
+@memory("memory")
+def _memory(lol_game, data):
+    return _measure_memory(lambda: from_dict(data))
+
+
+@memory("memory_compact")
+def _memory_compact(lol_game, data):
+    return _measure_memory(lambda: from_dict(data, compact=True))
+
+
+@memory("json_size")
+def _json_size(lol_game, data):
+    return len(json.dumps(data, separators=(",", ":")).encode()) / 1024
+
+
+def measure(
+    function: Callable, prepare: Optional[Callable], repeat: int, number: int
+) -> Dict[str, float]:
+    """
+    Returns statistics of the time per call of function in ms, over repeat rounds of number calls
+    """
+    times = []
+
+    for _ in range(repeat):
+        total = 0.0
+
+        # prepare runs right before each call, so that cold benchmarks do not get warmed up by other calls
+        for _ in range(number):
+            argument = prepare() if prepare else None
+
+            start = time.perf_counter()
+            function(argument)
+            total += time.perf_counter() - start
+
+        times.append(total * 1000 / number)
+
+    return {
+        "unit": "ms",
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def get_metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
+
+
+def run(
+    names: List[str] = None,
+    repeat: int = 7,
+    number: int = 5,
+    duration_minutes: int = 35,
+    seed: int = 0,
+) -> dict:
+    """
+    Runs the benchmarks and returns their results
+
+    Args:
+        names: names of the benchmarks to run, all of them by default
+        repeat: the number of rounds of each timing
+        number: the number of calls in each round
+        duration_minutes: the duration of the synthetic game
+        seed: the seed of the synthetic game
+
+    Returns:
+        A dictionary with 'metadata' and 'results', which maps benchmark names to their statistics
+    """
+    lol_game = make_game(duration_minutes, seed)
+    data = to_dict(lol_game)
+
+    results = {}
+
+    for name, create in TIMINGS.items():
+        if names and name not in names:
+            continue
+
+        function, prepare = create(lol_game, data)
+        results[name] = measure(function, prepare, repeat, number)
+        print(f"{name:>20}: {results[name]['median']:.3f} ms", file=sys.stderr)
+
+    for name, create in MEMORY.items():
+        if names and name not in names:
+            continue
+
+        results[name] = {"unit": "kB", "value": create(lol_game, data)}
+        print(f"{name:>20}: {results[name]['value']:.0f} kB", file=sys.stderr)
+
+    return {
+        "metadata": {
+            **get_metadata(),
+            "duration_minutes": duration_minutes,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(before: dict, after: dict, threshold: float = 0.1) -> List[str]:
+    """
+    Prints the change of each benchmark between two results, and returns the benchmarks slower or larger by more than
+    threshold
+
+    Timings are compared on their median.
+    """
+    regressions = []
+
+    print(
+        f"{'benchmark':>20} {'before':>10} {'after':>10} {'change':>8}   "
+        f"({(before['metadata'].get('commit') or '?')[:8]} -> {(after['metadata'].get('commit') or '?')[:8]})"
+    )
+
+    for name, result in after["results"].items():
+        if name not in before["results"]:
+            continue
+
+        key = "median" if result["unit"] == "ms" else "value"
+        old, new = before["results"][name][key], result[key]
+        change = new / old - 1 if old else 0.0
+
+        if change > threshold:
+            regressions.append(name)
+
+        print(
+            f"{name:>20} {old:>10.3f} {new:>10.3f} {change:>+8.1%} {result['unit']}"
+            + ("  <- regression" if change > threshold else "")
+        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--output", help="JSON file to save results to")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="results to compare"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative change counted as a regression when comparing, 0.1 by default",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=[*TIMINGS, *MEMORY],
+        help="benchmarks to run, all by default",
+    )
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--duration", type=int, default=35, help="in minutes")
+    parser.add_argument("--seed", type=int, default=0)
+
+    arguments = parser.parse_args()
+
+    if arguments.compare:
+        results = []
+        for filename in arguments.compare:
+            with open(filename) as file:
+                results.append(json.load(file))
+
+        # A non-zero exit code allows failing CI jobs on regressions
+        sys.exit(1 if compare(*results, arguments.threshold) else 0)
+
+    results = run(
+        arguments.only,
+        arguments.repeat,
+        arguments.number,
+        arguments.duration,
+        arguments.seed,
+    )
+
+    output = json.dumps(results, indent=4)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,675 @@
+"""
+Deterministic generator of realistic games with a full timeline, used by all benchmarks
+
+Games have ten players with runes, summoner spells, and end of game stats, one snapshot per minute, item purchases
+with their components being destroyed and undone purchases, wards, skill and level ups, kills with damage instances,
+epic monsters, jungle camps, and buildings kills. The same seed always gives the same game.
+"""
+
+import random
+from typing import Dict, List
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGameKill,
+    LolGameKillDamageInstance,
+    LolGamePlayer,
+    LolGamePlayerEndOfGameStats,
+    LolGamePlayerItem,
+    LolGamePlayerItemEvent,
+    LolGamePlayerLargeMonsterKill,
+    LolGamePlayerRune,
+    LolGamePlayerSkillLevelUpEvent,
+    LolGamePlayerSnapshot,
+    LolGamePlayerSnapshotChampionStats,
+    LolGamePlayerSnapshotDamageStats,
+    LolGamePlayerSpecialKill,
+    LolGamePlayerSummonerSpell,
+    LolGamePlayerWardEvent,
+    LolGameTeamBuildingKill,
+    LolGameTeamEpicMonsterKill,
+    LolGameTeams,
+    LolPickBan,
+    Position,
+)
+from lol_dto.utilities.end_of_game_stats import fill_end_of_game_stats
+
+ROLES = ("TOP", "JGL", "MID", "BOT", "SUP")
+SIDES = ("BLUE", "RED")
+LANES = ("TOP", "MID", "BOT")
+
+# Total xp needed to reach each level, starting at level 1
+LEVELS_XP = [
+    0,
+    280,
+    660,
+    1140,
+    1720,
+    2400,
+    3180,
+    4060,
+    5040,
+    6120,
+    7300,
+    8580,
+    9960,
+    11440,
+    13020,
+    14700,
+    16480,
+    18360,
+]
+
+STARTING_ITEMS = {"TOP": 1055, "JGL": 1101, "MID": 1056, "BOT": 1055, "SUP": 3850}
+POTION = 2003
+CONTROL_WARD = 2055
+TRINKETS = (3340, 3364)
+BOOTS = 1001
+COMPONENTS = (1036, 1037, 1038, 1026, 1052, 1058, 1028, 1029, 1031, 1033, 1042, 1043)
+LEGENDARY_ITEMS = (3031, 3089, 3071, 3157, 3153, 6672, 3068, 3075, 3065, 3046, 6653)
+TIER_2_BOOTS = (3006, 3020, 3047, 3111, 3158)
+
+SUMMONER_SPELLS = {"TOP": 12, "JGL": 11, "MID": 14, "BOT": 7, "SUP": 3}
+FLASH = 4
+
+RUNE_TREES = (8000, 8100, 8200, 8300, 8400)
+STAT_PERKS = (5001, 5002, 5003, 5005, 5007, 5008)
+
+DRAGONS = ("CLOUD", "INFERNAL", "MOUNTAIN", "OCEAN")
+CAMPS = ("BLUE_BUFF", "RED_BUFF", "RAPTOR", "WOLF", "KRUG", "GROMP", "SCUTTLE")
+
+# Order in which skills are maxed, R being leveled at 6, 11, and 16
+SKILL_ORDERS = ((1, 2, 3), (1, 3, 2), (2, 1, 3), (3, 1, 2))
+
+MAP_SIZE = 14870
+
+
+def _position(rng: random.Random) -> Position:
+    return Position(x=rng.randint(-120, MAP_SIZE), y=rng.randint(-120, MAP_SIZE))
+
+
+def _level(xp: float) -> int:
+    return sum(xp >= threshold for threshold in LEVELS_XP)
+
+
+def _skill_slots(rng: random.Random) -> List[int]:
+    """
+    Returns the skill slot leveled at each level, from level 1 to 18
+    """
+    order = rng.choice(SKILL_ORDERS)
+    levels = {slot: 0 for slot in (1, 2, 3, 4)}
+    slots = []
+
+    for level in range(1, 19):
+        if level in (6, 11, 16):
+            slot = 4
+        elif level <= 3:
+            slot = order[level - 1]
+        else:
+            slot = next(s for s in order if levels[s] < 5)
+
+        levels[slot] += 1
+        slots.append(slot)
+
+    return slots
+
+
+def _make_player(
+    rng: random.Random, player_id: int, role: str, champion_id: int, duration: int
+) -> LolGamePlayer:
+    minutes = duration // 60
+
+    # Supports and junglers earn less gold and xp than laners
+    gold_rate = {"SUP": 260, "JGL": 340}.get(role, 400) * rng.uniform(0.85, 1.15)
+    xp_rate = {"SUP": 380, "JGL": 480}.get(role, 520) * rng.uniform(0.85, 1.15)
+    cs_rate = {"SUP": 1, "JGL": 5.5}.get(role, 8) * rng.uniform(0.8, 1.2)
+
+    primary_tree, secondary_tree = rng.sample(RUNE_TREES, 2)
+
+    player = LolGamePlayer(
+        id=player_id,
+        inGameName=f"Player {player_id}",
+        role=role,
+        championId=champion_id,
+        profileIconId=rng.randint(1, 5000),
+        primaryRuneTreeId=primary_tree,
+        secondaryRuneTreeId=secondary_tree,
+        runes=[
+            LolGamePlayerRune(
+                slot=slot,
+                id=(primary_tree if slot < 4 else secondary_tree) + rng.randint(1, 30),
+                stats=[rng.randint(0, 2000), rng.randint(0, 50), 0],
+            )
+            for slot in range(6)
+        ]
+        + [LolGamePlayerRune(slot=6 + i, id=rng.choice(STAT_PERKS)) for i in range(3)],
+        summonerSpells=[
+            LolGamePlayerSummonerSpell(id=FLASH, slot=0, casts=rng.randint(2, 12)),
+            LolGamePlayerSummonerSpell(
+                id=SUMMONER_SPELLS[role], slot=1, casts=rng.randint(2, 20)
+            ),
+        ],
+    )
+
+    # Snapshots, with a position moving around the map
+    x, y = rng.randint(0, MAP_SIZE), rng.randint(0, MAP_SIZE)
+    total_gold = 500
+
+    for minute in range(minutes + 1):
+        xp = int(xp_rate * minute * (1 + minute / 60))
+        total_gold = 500 + int(gold_rate * minute * (1 + minute / 80))
+        x = min(max(x + rng.randint(-3000, 3000), -120), MAP_SIZE)
+        y = min(max(y + rng.randint(-3000, 3000), -120), MAP_SIZE)
+
+        player.snapshots.append(
+            LolGamePlayerSnapshot(
+                timestamp=minute * 60,
+                position=Position(x=x, y=y),
+                currentGold=rng.randint(0, 1500),
+                totalGold=total_gold,
+                xp=xp,
+                level=_level(xp),
+                cs=int(cs_rate * max(minute - 1.5, 0)),
+                monstersKilled=int(cs_rate * minute) if role == "JGL" else 0,
+                isAlive=True,
+                timeEnemySpentControlled=rng.randint(0, 40) * minute,
+                championStats=LolGamePlayerSnapshotChampionStats(
+                    abilityHaste=rng.randint(0, 60),
+                    abilityPower=rng.randint(0, 40 * minute),
+                    armor=30 + rng.randint(0, 5 * minute),
+                    attackDamage=60 + rng.randint(0, 8 * minute),
+                    attackSpeed=100 + rng.randint(0, 3 * minute),
+                    health=600 + 90 * _level(xp) + rng.randint(0, 30 * minute),
+                    healthMax=600 + 90 * _level(xp) + 30 * minute,
+                    magicResist=30 + rng.randint(0, 2 * minute),
+                    movementSpeed=rng.randint(330, 450),
+                    power=rng.randint(0, 1500),
+                    powerMax=1500,
+                ),
+                damageStats=LolGamePlayerSnapshotDamageStats(
+                    magicDamageDone=rng.randint(0, 2000) * minute,
+                    physicalDamageDone=rng.randint(0, 2000) * minute,
+                    totalDamageDone=rng.randint(2000, 4000) * minute,
+                    totalDamageDoneToChampions=rng.randint(200, 900) * minute,
+                    totalDamageTaken=rng.randint(400, 1200) * minute,
+                    trueDamageDone=rng.randint(0, 200) * minute,
+                ),
+            )
+        )
+
+    # Level ups, interpolating xp between snapshots, followed by a skill level up
+    skill_slots = _skill_slots(rng)
+
+    for threshold in LEVELS_XP[1:]:
+        for before, after in zip(player.snapshots, player.snapshots[1:]):
+            if before.xp < threshold <= after.xp:
+                timestamp = before.timestamp + 60 * (threshold - before.xp) / (
+                    after.xp - before.xp
+                )
+                player.levelUpEvents.append(int(timestamp))
+                break
+
+    for level, timestamp in enumerate([0.0] + player.levelUpEvents, start=1):
+        player.skillsLevelUpEvents.append(
+            LolGamePlayerSkillLevelUpEvent(
+                timestamp=round(min(timestamp + rng.uniform(0.5, 20), duration), 3),
+                type="NORMAL",
+                slot=skill_slots[level - 1],
+            )
+        )
+
+    _add_items_events(rng, player, role, duration)
+    _add_wards_events(rng, player, role, duration)
+
+    if role == "JGL":
+        timestamp = 90.0
+        while timestamp < duration:
+            player.largeMonstersKills.append(
+                LolGamePlayerLargeMonsterKill(
+                    timestamp=round(timestamp, 3),
+                    position=_position(rng),
+                    type=rng.choice(CAMPS),
+                )
+            )
+            timestamp += rng.uniform(20, 60)
+
+    return player
+
+
+def _add_items_events(
+    rng: random.Random, player: LolGamePlayer, role: str, duration: int
+):
+    inventory = []
+    events = player.itemsEvents
+
+    def add(timestamp: float, event_type: str, item_id: int):
+        events.append(
+            LolGamePlayerItemEvent(
+                timestamp=round(timestamp, 3), type=event_type, id=item_id
+            )
+        )
+
+        if event_type in ("PURCHASED", "PICKED_UP"):
+            inventory.append(item_id)
+        elif item_id in inventory:
+            inventory.remove(item_id)
+
+    # Starting items, bought in the first seconds
+    timestamp = rng.uniform(1, 10)
+    add(timestamp, "PURCHASED", STARTING_ITEMS[role])
+    for _ in range(2 if role != "JGL" else 1):
+        timestamp += rng.uniform(0.3, 2)
+        add(timestamp, "PURCHASED", POTION)
+    add(timestamp + rng.uniform(0.3, 2), "PURCHASED", TRINKETS[0])
+
+    potions_used = 0
+    timestamp = rng.uniform(150, 300)
+
+    while timestamp < duration - 30:
+        # Potions are used between shopping trips
+        if POTION in inventory and potions_used < 2:
+            add(timestamp - rng.uniform(30, 120), "DESTROYED", POTION)
+            potions_used += 1
+
+        # A shopping trip buys components, and builds an item when enough components are owned
+        components = [i for i in inventory if i in COMPONENTS]
+
+        if len(components) >= 2 and rng.random() < 0.7:
+            for component in components[:2]:
+                add(timestamp, "DESTROYED", component)
+            add(timestamp, "PURCHASED", rng.choice(LEGENDARY_ITEMS))
+
+        if BOOTS not in inventory and not any(b in inventory for b in TIER_2_BOOTS):
+            timestamp += rng.uniform(0.3, 2)
+            add(timestamp, "PURCHASED", BOOTS)
+        elif BOOTS in inventory and rng.random() < 0.5:
+            timestamp += rng.uniform(0.3, 2)
+            add(timestamp, "DESTROYED", BOOTS)
+            add(timestamp, "PURCHASED", rng.choice(TIER_2_BOOTS))
+
+        for _ in range(rng.randint(1, 3)):
+            timestamp += rng.uniform(0.3, 2)
+            add(timestamp, "PURCHASED", rng.choice(COMPONENTS))
+
+            # Some purchases are undone right away
+            if rng.random() < 0.1:
+                timestamp += rng.uniform(0.3, 2)
+                undone_id = events[-1].id
+                events.append(
+                    LolGamePlayerItemEvent(
+                        timestamp=round(timestamp, 3),
+                        type="UNDO",
+                        id=0,
+                        beforeUndoId=undone_id,
+                    )
+                )
+                inventory.remove(undone_id)
+
+        if rng.random() < 0.5:
+            timestamp += rng.uniform(0.3, 2)
+            add(timestamp, "PURCHASED", CONTROL_WARD)
+
+        # Starting items are sold when the inventory gets full
+        if STARTING_ITEMS[role] in inventory and len(inventory) >= 6:
+            timestamp += rng.uniform(0.3, 2)
+            add(timestamp, "SOLD", STARTING_ITEMS[role])
+
+        timestamp += rng.uniform(150, 300)
+
+    # Potions are used before the shopping trip in which they are logged
+    events.sort(key=lambda e: e.timestamp)
+
+
+def _add_wards_events(
+    rng: random.Random, player: LolGamePlayer, role: str, duration: int
+):
+    interval = 50 if role == "SUP" else 110
+    timestamp = rng.uniform(60, 120)
+
+    while timestamp < duration:
+        ward_type = rng.choices(
+            ("YELLOW_TRINKET", "CONTROL_WARD", "SIGHT_WARD", "BLUE_TRINKET"),
+            weights=(6, 2, 2 if role == "SUP" else 0, 1),
+        )[0]
+        player.wardsEvents.append(
+            LolGamePlayerWardEvent(
+                timestamp=round(timestamp, 3),
+                type="PLACED",
+                wardType=ward_type,
+                deathTimestamp=int(timestamp + rng.uniform(30, 180)),
+            )
+        )
+
+        kill_timestamp = timestamp + rng.uniform(1, 40)
+        if rng.random() < 0.4 and kill_timestamp < duration:
+            player.wardsEvents.append(
+                LolGamePlayerWardEvent(
+                    timestamp=round(kill_timestamp, 3),
+                    type="KILLED",
+                    wardType=rng.choice(("YELLOW_TRINKET", "CONTROL_WARD")),
+                )
+            )
+
+        timestamp += rng.uniform(interval / 2, interval * 1.5)
+
+    # Killed wards can come after the next placed ward
+    player.wardsEvents.sort(key=lambda e: e.timestamp)
+
+
+def _damage_instances(
+    rng: random.Random, participants: List[int]
+) -> List[LolGameKillDamageInstance]:
+    return [
+        LolGameKillDamageInstance(
+            basic=basic,
+            physicalDamage=rng.randint(0, 400),
+            magicDamage=0 if basic else rng.randint(0, 500),
+            trueDamage=rng.choice((0, 0, rng.randint(0, 100))),
+            type="OTHER",
+            participantId=rng.choice(participants),
+            name=rng.randint(1, 900),
+            spellName="basicattack" if basic else f"spell{rng.randint(1, 4)}",
+            spellSlot=-1 if basic else rng.randint(0, 3),
+        )
+        for basic in (rng.random() < 0.4 for _ in range(rng.randint(3, 10)))
+    ]
+
+
+def _add_kills(rng: random.Random, lol_game: LolGame, teams_ids: Dict[str, list]):
+    duration = lol_game.duration
+    winner_weight = 1.4
+
+    timestamps = sorted(
+        t
+        for t in (
+            rng.uniform(150, duration)
+            for _ in range(rng.randint(20, 45) * duration // 2100)
+        )
+        if t < duration
+    )
+    death_ends: Dict[int, float] = {}
+
+    for timestamp in timestamps:
+        side = rng.choices(
+            SIDES,
+            weights=[winner_weight if s == lol_game.winner else 1 for s in SIDES],
+        )[0]
+        allies, enemies = teams_ids[side], teams_ids[SIDES[side == "BLUE"]]
+
+        alive_enemies = [p for p in enemies if death_ends.get(p, 0) < timestamp]
+        alive_allies = [p for p in allies if death_ends.get(p, 0) < timestamp]
+        if not alive_enemies or not alive_allies:
+            continue
+
+        killer_id = rng.choice(alive_allies)
+        victim_id = rng.choice(alive_enemies)
+        others = [p for p in alive_allies if p != killer_id]
+        assists_ids = rng.sample(others, rng.randint(0, min(3, len(others))))
+
+        death_ends[victim_id] = timestamp + 6 + timestamp / 60
+
+        lol_game.kills.append(
+            LolGameKill(
+                timestamp=round(timestamp, 3),
+                position=_position(rng),
+                killerId=killer_id,
+                victimId=victim_id,
+                assistsIds=assists_ids,
+                bounty=rng.choice((300, 300, 274, 400, 500)),
+                killStreakLength=rng.randint(0, 3),
+                victimDamageDealt=_damage_instances(rng, [victim_id]),
+                victimDamageReceived=_damage_instances(rng, [killer_id, *assists_ids]),
+            )
+        )
+
+    # Players are not alive in snapshots taken while they are dead
+    deaths = [(k.victimId, k.timestamp) for k in lol_game.kills]
+    for team in lol_game.teams:
+        for player in team.players:
+            for snapshot in player.snapshots:
+                snapshot.isAlive = not any(
+                    victim_id == player.id
+                    and timestamp <= snapshot.timestamp < timestamp + 6 + timestamp / 60
+                    for victim_id, timestamp in deaths
+                )
+
+    if lol_game.kills:
+        first_kill = lol_game.kills[0]
+        for team in lol_game.teams:
+            for player in team.players:
+                if player.id == first_kill.killerId:
+                    player.specialKills.append(
+                        LolGamePlayerSpecialKill(
+                            timestamp=first_kill.timestamp,
+                            position=first_kill.position,
+                            type="FIRST_BLOOD",
+                        )
+                    )
+
+
+def _add_objectives(rng: random.Random, lol_game: LolGame, teams_ids: Dict[str, list]):
+    duration = lol_game.duration
+    teams = dict(zip(SIDES, lol_game.teams))
+
+    def pick_side() -> str:
+        return rng.choices(
+            SIDES, weights=[1.5 if s == lol_game.winner else 1 for s in SIDES]
+        )[0]
+
+    def add_monster(
+        timestamp: float, monster_type: str, sub_type: str = None, side: str = None
+    ) -> str:
+        side = side or pick_side()
+        jungler_id = teams_ids[side][ROLES.index("JGL")]
+
+        teams[side].epicMonstersKills.append(
+            LolGameTeamEpicMonsterKill(
+                timestamp=round(timestamp, 3),
+                position=_position(rng),
+                killerId=jungler_id,
+                assistsIds=rng.sample(
+                    [p for p in teams_ids[side] if p != jungler_id], rng.randint(0, 3)
+                ),
+                type=monster_type,
+                subType=sub_type,
+            )
+        )
+
+        return side
+
+    # Dragons spawn at 5:00 and 5 minutes after being killed, a team with 4 dragons gets the soul
+    dragons = {side: 0 for side in SIDES}
+    timestamp = 300 + rng.uniform(0, 90)
+
+    while timestamp < duration:
+        sub_type = rng.choice(DRAGONS) if max(dragons.values()) < 4 else "ELDER"
+        side = add_monster(timestamp, "DRAGON", sub_type)
+
+        if sub_type != "ELDER":
+            dragons[side] += 1
+            if dragons[side] == 4:
+                add_monster(timestamp, "DRAGON_SOUL", sub_type, side)
+
+        timestamp += 300 + rng.uniform(0, 120)
+
+    for timestamp in (480, 840):
+        if timestamp + 60 < duration:
+            add_monster(timestamp + rng.uniform(0, 120), "RIFT_HERALD")
+
+    timestamp = 1200 + rng.uniform(60, 300)
+    while timestamp < duration:
+        add_monster(timestamp, "BARON")
+        timestamp += 360 + rng.uniform(60, 300)
+
+    # The winner destroys the nexus at the end of the game, after the two nexus turrets and at least one lane up to
+    #   its inhibitor, and buildings of both teams fall before it
+    nexus_timestamp = duration - rng.uniform(0, min(20, duration / 10))
+    nexus_turrets_timestamps = sorted(
+        nexus_timestamp - rng.uniform(0, min(90, duration / 10)) for _ in range(2)
+    )
+    open_lane = rng.choice(LANES)
+
+    # Turret plates fall before 14:00, then turrets lane by lane, then inhibitors
+    for side in SIDES:
+        enemy_side = SIDES[side == "BLUE"]
+        is_winner = side == lol_game.winner
+        strength = 1.2 if is_winner else 0.8
+        end = nexus_turrets_timestamps[0]
+
+        def add_building(timestamp: float, building_type: str, lane: str, location):
+            killer_id = rng.choice(teams_ids[side])
+            teams[side].buildingsKills.append(
+                LolGameTeamBuildingKill(
+                    timestamp=round(timestamp, 3),
+                    position=_position(rng),
+                    type=building_type,
+                    lane=lane,
+                    side=enemy_side,
+                    killerId=killer_id,
+                    assistsIds=rng.sample(
+                        [p for p in teams_ids[side] if p != killer_id],
+                        rng.randint(0, 2),
+                    ),
+                    turretLocation=location,
+                )
+            )
+
+        for lane in LANES:
+            for _ in range(rng.randint(0, 3)):
+                timestamp = rng.uniform(300, 840)
+                if timestamp < end:
+                    add_building(timestamp, "TURRET_PLATE", lane, "OUTER")
+
+            if is_winner and lane == open_lane:
+                # Spread over the game, so that the inhibitor falls before the nexus turrets
+                timestamps = sorted(rng.uniform(end * 0.3, end) for _ in range(4))
+                for timestamp, location in zip(
+                    timestamps, ("OUTER", "INNER", "INHIBITOR")
+                ):
+                    add_building(timestamp, "TURRET", lane, location)
+                add_building(timestamps[-1], "INHIBITOR", lane, None)
+                continue
+
+            timestamp = rng.uniform(600, 1300) / strength
+            for location in ("OUTER", "INNER", "INHIBITOR"):
+                if timestamp >= end or rng.random() > strength * 0.7:
+                    break
+                add_building(timestamp, "TURRET", lane, location)
+                timestamp += rng.uniform(240, 600) / strength
+            else:
+                if timestamp < end:
+                    add_building(timestamp, "INHIBITOR", lane, None)
+
+        if is_winner:
+            for timestamp in nexus_turrets_timestamps:
+                add_building(timestamp, "TURRET", None, "NEXUS")
+            add_building(nexus_timestamp, "NEXUS", None, None)
+
+        teams[side].buildingsKills.sort(key=lambda b: b.timestamp)
+
+    for team in lol_game.teams:
+        team.epicMonstersKills.sort(key=lambda e: e.timestamp)
+
+
+def _fill_end_of_game_stats(rng: random.Random, lol_game: LolGame):
+    for team in lol_game.teams:
+        for player in team.players:
+            last_snapshot = player.snapshots[-1]
+
+            inventory = []
+            for event in player.itemsEvents:
+                if event.type == "PURCHASED":
+                    inventory.append(event.id)
+                elif event.type == "UNDO":
+                    if event.beforeUndoId in inventory:
+                        inventory.remove(event.beforeUndoId)
+                elif event.id in inventory:
+                    inventory.remove(event.id)
+
+            player.endOfGameStats = LolGamePlayerEndOfGameStats(
+                gold=last_snapshot.totalGold,
+                cs=last_snapshot.cs,
+                level=last_snapshot.level,
+                xp=last_snapshot.xp,
+                wardsPlaced=sum(e.type == "PLACED" for e in player.wardsEvents),
+                wardsKilled=sum(e.type == "KILLED" for e in player.wardsEvents),
+                visionWardsBought=sum(
+                    e.id == CONTROL_WARD and e.type == "PURCHASED"
+                    for e in player.itemsEvents
+                ),
+                visionScore=rng.randint(5, 100),
+                totalDamageDealt=last_snapshot.damageStats.totalDamageDone,
+                totalDamageDealtToChampions=last_snapshot.damageStats.totalDamageDoneToChampions,
+                totalDamageTaken=last_snapshot.damageStats.totalDamageTaken,
+                goldSpent=last_snapshot.totalGold - last_snapshot.currentGold,
+                items=[
+                    LolGamePlayerItem(id=item_id, slot=slot)
+                    for slot, item_id in enumerate(inventory[-6:])
+                ]
+                + [LolGamePlayerItem(id=TRINKETS[0], slot=6)],
+            )
+
+    fill_end_of_game_stats(lol_game)
+
+
+def make_game(duration_minutes: int = 35, seed: int = 0) -> LolGame:
+    """
+    Creates a deterministic LolGame with a full timeline, to be used in benchmarks
+
+    Args:
+        duration_minutes: the duration of the game, with one snapshot per minute
+        seed: the seed of the random generator, the same seed always giving the same game
+
+    Returns:
+        A LolGame with ten players, their timelines, kills, and objectives
+    """
+    rng = random.Random(seed)
+    duration = duration_minutes * 60
+
+    champions = rng.sample(range(1, 900), 20)
+    picks, bans = champions[:10], champions[10:]
+
+    teams = LolGameTeams()
+    teams_ids = {}
+
+    for side_index, (side, team) in enumerate(zip(SIDES, teams)):
+        team.bans = bans[side_index * 5 : side_index * 5 + 5]
+        teams_ids[side] = [side_index * 5 + i + 1 for i in range(5)]
+
+        for role_index, role in enumerate(ROLES):
+            team.players.append(
+                _make_player(
+                    rng,
+                    player_id=side_index * 5 + role_index + 1,
+                    role=role,
+                    champion_id=picks[side_index * 5 + role_index],
+                    duration=duration,
+                )
+            )
+
+    # Bans then picks, alternating between teams
+    picks_bans = [
+        LolPickBan(championId=champion_id, isBan=True, team=SIDES[i // 5])
+        for i, champion_id in enumerate(bans)
+    ] + [
+        LolPickBan(championId=champion_id, isBan=False, team=SIDES[i // 5])
+        for i, champion_id in enumerate(picks)
+    ]
+
+    lol_game = LolGame(
+        duration=duration,
+        start="2022-02-10T18:00:00+00:00",
+        type="MATCHED_GAME",
+        queue_id=420,
+        patch="12.3",
+        gameVersion="12.3.421.3967",
+        winner=rng.choice(SIDES),
+        teams=teams,
+        picksBans=picks_bans,
+    )
+
+    _add_kills(rng, lol_game, teams_ids)
+    _add_objectives(rng, lol_game, teams_ids)
+    _fill_end_of_game_stats(rng, lol_game)
+
+    return lol_game
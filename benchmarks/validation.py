@@ -0,0 +1,89 @@
+"""
+Compares the generated validator to a validator walking the fields of every object with reflection
+
+Run with: python -m benchmarks.validation
+"""
+
+import dataclasses
+import time
+import timeit
+import typing
+
+from lol_dto.utilities.validation import (
+    ENUMS,
+    REFERENCE_FIELDS,
+    get_validator,
+    validate_game,
+    validate_games,
+)
+from benchmarks.synthetic_game import make_game
+
+
+def reflection_validate(obj, path: str, player_ids: set, issues: list):
+    """
+    Checks types, allowed values, and references, reading type hints for every object
+    """
+    type_hints = typing.get_type_hints(type(obj))
+    enums = ENUMS.get(type(obj), {})
+
+    for f in dataclasses.fields(obj):
+        value = getattr(obj, f.name)
+        if value is None or f.name == "sources":
+            continue
+
+        field_path = f"{path}.{f.name}"
+        type_hint = type_hints[f.name]
+
+        if getattr(type_hint, "__origin__", None) is typing.Union:
+            type_hint = type_hint.__args__[0]
+
+        if dataclasses.is_dataclass(type_hint):
+            reflection_validate(value, field_path, player_ids, issues)
+        elif getattr(type_hint, "__origin__", None) is list:
+            for index, item in enumerate(value):
+                if dataclasses.is_dataclass(item):
+                    reflection_validate(
+                        item, f"{field_path}[{index}]", player_ids, issues
+                    )
+                elif f.name in REFERENCE_FIELDS and item not in player_ids:
+                    issues.append((f"{field_path}[{index}]", "reference"))
+        elif not isinstance(value, (int, float) if type_hint is float else type_hint):
+            issues.append((field_path, "type"))
+        elif f.name in enums and value not in enums[f.name]:
+            issues.append((field_path, "value"))
+        elif f.name in REFERENCE_FIELDS and value not in player_ids:
+            issues.append((field_path, "reference"))
+
+    return issues
+
+
+def main(number: int = 20, games: int = 200):
+    lol_game = make_game()
+    player_ids = {p.id for team in lol_game.teams for p in team.players}
+
+    start = time.perf_counter()
+    get_validator()
+    print(f"{'generate':>10}: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    assert reflection_validate(lol_game, "", player_ids, []) == []
+    assert validate_game(lol_game) == []
+
+    for name, function in (
+        ("reflection", lambda: reflection_validate(lol_game, "", player_ids, [])),
+        ("generated", lambda: validate_game(lol_game)),
+    ):
+        seconds = timeit.timeit(function, number=number) / number
+        print(f"{name:>10}: {seconds * 1000:.2f} ms per game")
+
+    lol_games = [make_game(seed=seed) for seed in range(games)]
+
+    start = time.perf_counter()
+    invalid = list(validate_games(lol_games, only_invalid=True))
+    seconds = time.perf_counter() - start
+    assert not invalid
+
+    print(f"{'batch':>10}: {games / seconds:.0f} games per second")
+
+
+if __name__ == "__main__":
+    main()
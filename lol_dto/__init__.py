@@ -1,2 +1,15 @@
-import lol_dto.classes
-import lol_dto.utilities
+import importlib
+
+# Submodules are imported lazily on first access to keep "import lol_dto" fast
+_SUBMODULES = {"classes", "utilities", "names_helper"}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBMODULES))
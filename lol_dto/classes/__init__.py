@@ -1,2 +1,15 @@
-import lol_dto.classes.game
-import lol_dto.classes.sources
+import importlib
+
+# Submodules are imported lazily on first access, see lol_dto/__init__.py
+_SUBMODULES = {"game", "sources"}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBMODULES))
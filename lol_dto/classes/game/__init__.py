@@ -1,30 +1,104 @@
-from lol_dto.classes.game.lol_game import (
-    LolGame,
-    LolGameTeams,
-    LolPickBan,
-    LolGamePause,
-)
-from lol_dto.classes.game.lol_game_team import LolGameTeam, LolGameTeamEndOfGameStats
-from lol_dto.classes.game.lol_game_player import (
-    LolGamePlayer,
-    LolGamePlayerRune,
-    LolGamePlayerItem,
-    LolGamePlayerSnapshot,
-    LolGamePlayerSummonerSpell,
-    LolGamePlayerEndOfGameStats,
-    LolGamePlayerLargeMonsterKill,
-    LolGamePlayerSnapshotDamageStats,
-    LolGamePlayerSnapshotChampionStats,
-)
-from lol_dto.classes.game.lol_game_event import (
-    LolEvent,
-    LolGameKill,
-    LolGamePlayerSpecialKill,
-    LolGameKillDamageInstance,
-    LolGameTeamEpicMonsterKill,
-    LolGameTeamBuildingKill,
-    LolGamePlayerWardEvent,
-    LolGamePlayerItemEvent,
-    LolGamePlayerSkillLevelUpEvent,
-)
-from lol_dto.classes.game.position import Position
+import importlib
+from typing import TYPE_CHECKING
+
+# Classes are imported lazily on first access, so importing a single class does not import the whole class tree
+_CLASSES_MODULES = {
+    "LolGame": "lol_dto.classes.game.lol_game",
+    "LolGameTeams": "lol_dto.classes.game.lol_game",
+    "LolPickBan": "lol_dto.classes.game.lol_game",
+    "LolGamePause": "lol_dto.classes.game.lol_game",
+    "LolGameTeam": "lol_dto.classes.game.lol_game_team",
+    "LolGameTeamEndOfGameStats": "lol_dto.classes.game.lol_game_team",
+    "LolGamePlayer": "lol_dto.classes.game.lol_game_player",
+    "LolGamePlayerRune": "lol_dto.classes.game.lol_game_player",
+    "LolGamePlayerItem": "lol_dto.classes.game.lol_game_player",
+    "LolGamePlayerSnapshot": "lol_dto.classes.game.lol_game_player",
+    "LolGamePlayerSummonerSpell": "lol_dto.classes.game.lol_game_player",
+    "LolGamePlayerEndOfGameStats": "lol_dto.classes.game.lol_game_player",
+    "LolGamePlayerLargeMonsterKill": "lol_dto.classes.game.lol_game_player",
+    "LolGamePlayerSnapshotDamageStats": "lol_dto.classes.game.lol_game_player",
+    "LolGamePlayerSnapshotChampionStats": "lol_dto.classes.game.lol_game_player",
+    "LolEvent": "lol_dto.classes.game.lol_game_event",
+    "LolGameKill": "lol_dto.classes.game.lol_game_event",
+    "LolGamePlayerSpecialKill": "lol_dto.classes.game.lol_game_event",
+    "LolGameKillDamageInstance": "lol_dto.classes.game.lol_game_event",
+    "LolGameTeamEpicMonsterKill": "lol_dto.classes.game.lol_game_event",
+    "LolGameTeamBuildingKill": "lol_dto.classes.game.lol_game_event",
+    "LolGamePlayerWardEvent": "lol_dto.classes.game.lol_game_event",
+    "LolGamePlayerItemEvent": "lol_dto.classes.game.lol_game_event",
+    "LolGamePlayerSkillLevelUpEvent": "lol_dto.classes.game.lol_game_event",
+    "LolGamePlayerCooldownEvent": "lol_dto.classes.game.lol_game_event",
+    "LolGamePlayerSpellUseEvent": "lol_dto.classes.game.lol_game_event",
+    "Position": "lol_dto.classes.game.position",
+    "EventIndex": "lol_dto.classes.game.lol_game_event_index",
+}
+
+__all__ = list(_CLASSES_MODULES)
+
+_SUBMODULES = {
+    "compact",
+    "lol_game",
+    "lol_game_event",
+    "lol_game_event_index",
+    "lol_game_player",
+    "lol_game_team",
+    "position",
+}
+
+if TYPE_CHECKING:
+    # Eager imports for type checkers and IDEs
+    from lol_dto.classes.game.lol_game import (
+        LolGame,
+        LolGameTeams,
+        LolPickBan,
+        LolGamePause,
+    )
+    from lol_dto.classes.game.lol_game_team import (
+        LolGameTeam,
+        LolGameTeamEndOfGameStats,
+    )
+    from lol_dto.classes.game.lol_game_player import (
+        LolGamePlayer,
+        LolGamePlayerRune,
+        LolGamePlayerItem,
+        LolGamePlayerSnapshot,
+        LolGamePlayerSummonerSpell,
+        LolGamePlayerEndOfGameStats,
+        LolGamePlayerLargeMonsterKill,
+        LolGamePlayerSnapshotDamageStats,
+        LolGamePlayerSnapshotChampionStats,
+    )
+    from lol_dto.classes.game.lol_game_event import (
+        LolEvent,
+        LolGameKill,
+        LolGamePlayerSpecialKill,
+        LolGameKillDamageInstance,
+        LolGameTeamEpicMonsterKill,
+        LolGameTeamBuildingKill,
+        LolGamePlayerWardEvent,
+        LolGamePlayerItemEvent,
+        LolGamePlayerSkillLevelUpEvent,
+        LolGamePlayerCooldownEvent,
+        LolGamePlayerSpellUseEvent,
+    )
+    from lol_dto.classes.game.position import Position
+    from lol_dto.classes.game.lol_game_event_index import EventIndex
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    try:
+        module_name = _CLASSES_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__ + list(_SUBMODULES))
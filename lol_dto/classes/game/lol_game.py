@@ -96,8 +96,59 @@ class LolGame:
         """
         Post init function to define a backref in children needing access to the patch to find object names
         """
+        # Imported here as lol_dto.utilities imports the game classes
+        from lol_dto.utilities.lazy_list import LazyList
+
         for team in self.teams:
             setattr(team, "game", self)
 
+            for player in team.players:
+                setattr(player, "game", self)
+
+                for child in (
+                    *player.runes,
+                    *player.summonerSpells,
+                    *(player.endOfGameStats.items if player.endOfGameStats else ()),
+                ):
+                    setattr(child, "game", self)
+
+                if isinstance(player.itemsEvents, LazyList):
+                    # Lazy lists from from_dict(lazy=True) set the backref on events when creating them
+                    player.itemsEvents.set_items_attribute("game", self)
+                else:
+                    for item_event in player.itemsEvents:
+                        setattr(item_event, "game", self)
+
         for pb in self.picksBans:
             setattr(pb, "game", self)
+
+    @property
+    def event_index(self):
+        """
+        All events of the game sorted by timestamp, with secondary indexes, see lol_game_event_index.EventIndex
+
+        The index is built on first access and rebuilt when events lists are replaced or change length.
+        """
+        from lol_dto.classes.game.lol_game_event_index import EventIndex
+
+        index = self.__dict__.get("_event_index")
+
+        if index is None or not index.is_up_to_date(self):
+            index = self._event_index = EventIndex(self)
+
+        return index
+
+    def invalidate_event_index(self):
+        """
+        Forces the event index to be rebuilt on next access, needed after changing events in place
+        """
+        self.__dict__.pop("_event_index", None)
+
+    def timeline_arrays(self):
+        """
+        Returns the snapshots of all players as a structured NumPy array aligned on timestamps, see
+        lol_dto.utilities.timeline
+        """
+        from lol_dto.utilities.timeline import timeline_arrays
+
+        return timeline_arrays(self)
@@ -12,6 +12,9 @@ class LolEvent(ABC):
     A single event that took place during a LoL game
     """
 
+    # Empty slots allow compact events inheriting from this class to not have a __dict__
+    __slots__ = ()
+
     # Timestamp of the event expressed in seconds from the game start, with possible ms precision
     timestamp: float = None
 
@@ -89,7 +92,7 @@ class LolGameTeamBuildingKill(LolEvent):
     A building kill for a team
     """
 
-    type: str = None  # 'TURRET', 'TURRET_PLATE', 'INHIBITOR'
+    type: str = None  # 'TURRET', 'TURRET_PLATE', 'INHIBITOR', 'NEXUS'
     lane: str = None  # 'TOP', 'MID', 'BOT'
     side: str = None  # 'BLUE', 'RED' (the side it got killed in, technically redundant with team side)
 
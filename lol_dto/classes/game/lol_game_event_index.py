@@ -0,0 +1,267 @@
+import heapq
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from lol_dto.classes.game.compact import with_compact_classes
+from lol_dto.classes.game.lol_game_event import LolEvent
+
+# Events lists of the different objects, in the order they are indexed
+GAME_EVENTS_LISTS = ("kills",)
+TEAM_EVENTS_LISTS = ("epicMonstersKills", "buildingsKills")
+PLAYER_EVENTS_LISTS = (
+    "itemsEvents",
+    "wardsEvents",
+    "skillsLevelUpEvents",
+    "largeMonstersKills",
+    "spellsUses",
+    "specialKills",
+)
+
+
+class IndexedEvent(NamedTuple):
+    timestamp: float
+    event: LolEvent
+    # The player owning the event, None for kills and team events
+    playerId: Optional[int]
+    # 'BLUE' or 'RED', None for kills
+    side: Optional[str]
+
+
+class _SortedEvents:
+    """
+    A list of events sorted by timestamp, with the timestamps kept apart for bisect
+    """
+
+    def __init__(self, events: List[IndexedEvent]):
+        self.events = events
+        self.timestamps = [e.timestamp for e in events]
+
+    def between(self, start: float = None, end: float = None) -> List[IndexedEvent]:
+        low = 0 if start is None else bisect_left(self.timestamps, start)
+        high = len(self.events) if end is None else bisect_left(self.timestamps, end)
+        return self.events[low:high]
+
+
+class EventIndex:
+    """
+    An index of all the events of a LolGame, sorted by timestamp
+
+    Kills, team epic monsters and buildings kills, and all player events are merged in a single sorted sequence, with
+    secondary indexes by player id, event class, and event type. All queries use bisect on timestamps.
+
+    It is built lazily and cached by LolGame.event_index, and rebuilt when an events list is replaced or changes
+    length. Changing an event in place requires calling LolGame.invalidate_event_index().
+    """
+
+    def __init__(self, lol_game):
+        self.fingerprint = self.get_fingerprint(lol_game)
+
+        events = []
+        # Players involved in each event, used for the player index
+        players_ids = []
+
+        for list_name in GAME_EVENTS_LISTS:
+            for event in getattr(lol_game, list_name):
+                events.append(IndexedEvent(event.timestamp, event, None, None))
+                players_ids.append(_get_involved_players(event))
+
+        for side, team in zip(("BLUE", "RED"), lol_game.teams):
+            for list_name in TEAM_EVENTS_LISTS:
+                for event in getattr(team, list_name):
+                    events.append(IndexedEvent(event.timestamp, event, None, side))
+                    players_ids.append(_get_involved_players(event))
+
+            for player in team.players:
+                for list_name in PLAYER_EVENTS_LISTS:
+                    for event in getattr(player, list_name):
+                        events.append(
+                            IndexedEvent(event.timestamp, event, player.id, side)
+                        )
+                        players_ids.append((player.id,))
+
+        order = sorted(
+            (i for i, e in enumerate(events) if e.timestamp is not None),
+            key=lambda i: events[i].timestamp,
+        )
+
+        # Events without timestamp cannot be sorted and are only accessible here
+        self.untimed: List[IndexedEvent] = [e for e in events if e.timestamp is None]
+
+        self._all = _SortedEvents([events[i] for i in order])
+
+        by_player: Dict[int, List[IndexedEvent]] = {}
+        by_class: Dict[type, List[IndexedEvent]] = {}
+        by_type: Dict[str, List[IndexedEvent]] = {}
+
+        for i in order:
+            event = events[i]
+
+            for player_id in players_ids[i]:
+                by_player.setdefault(player_id, []).append(event)
+
+            by_class.setdefault(type(event.event), []).append(event)
+
+            event_type = getattr(event.event, "type", None)
+            if event_type is not None:
+                by_type.setdefault(event_type, []).append(event)
+
+        self._by_player = {k: _SortedEvents(v) for k, v in by_player.items()}
+        self._by_class = {k: _SortedEvents(v) for k, v in by_class.items()}
+        self._by_type = {k: _SortedEvents(v) for k, v in by_type.items()}
+
+        # Merged indexes for parent classes, like LolEvent, are built when first queried
+        self._by_parent_class: Dict[type, _SortedEvents] = {}
+
+    def __len__(self):
+        return len(self._all.events)
+
+    def __iter__(self):
+        return iter(self._all.events)
+
+    @property
+    def events(self) -> List[IndexedEvent]:
+        """
+        All events with a timestamp, sorted by timestamp
+        """
+        return self._all.events
+
+    def between(
+        self,
+        start: float = None,
+        end: float = None,
+        player_id: int = None,
+        event_class: type = None,
+        event_type: str = None,
+    ) -> List[IndexedEvent]:
+        """
+        Returns events with start <= timestamp < end, sorted by timestamp
+
+        Args:
+            start: the start of the time range in seconds, None for the start of the game
+            end: the end of the time range in seconds, excluded, None for the end of the game
+            player_id: only returns events involving this player, including kills and assists
+            event_class: only returns events of this class or its subclasses, for example LolGamePlayerWardEvent
+            event_type: only returns events with this type, for example 'PURCHASED' or 'DRAGON'
+
+        Returns:
+            A list of IndexedEvent
+        """
+        candidates = []
+
+        if player_id is not None:
+            candidates.append(self._by_player.get(player_id))
+        if event_type is not None:
+            candidates.append(self._by_type.get(event_type))
+        if event_class is not None:
+            candidates.append(self._get_class_events(event_class))
+
+        if not candidates:
+            return self._all.between(start, end)
+
+        if any(c is None for c in candidates):
+            return []
+
+        # The smallest secondary index is used and the other filters are applied on its events
+        candidates.sort(key=lambda c: len(c.events))
+        events = candidates[0].between(start, end)
+
+        if len(candidates) == 1:
+            return events
+
+        return [
+            e
+            for e in events
+            if (player_id is None or player_id in _get_involved_players(e))
+            and (event_type is None or getattr(e.event, "type", None) == event_type)
+            and (
+                event_class is None
+                or isinstance(e.event, with_compact_classes(event_class))
+            )
+        ]
+
+    def for_player(self, player_id: int) -> List[IndexedEvent]:
+        """
+        Returns all events involving the player, sorted by timestamp
+        """
+        return self.between(player_id=player_id)
+
+    def for_class(self, event_class: type) -> List[IndexedEvent]:
+        """
+        Returns all events of the given class or its subclasses, sorted by timestamp
+        """
+        return self.between(event_class=event_class)
+
+    def for_type(self, event_type: str) -> List[IndexedEvent]:
+        """
+        Returns all events of the given type, sorted by timestamp
+        """
+        return self.between(event_type=event_type)
+
+    def _get_class_events(self, event_class: type) -> Optional[_SortedEvents]:
+        if event_class in self._by_parent_class:
+            return self._by_parent_class[event_class]
+
+        event_classes = with_compact_classes(event_class)
+        classes = [c for c in self._by_class if issubclass(c, event_classes)]
+
+        if not classes:
+            return None
+        if len(classes) == 1:
+            return self._by_class[classes[0]]
+
+        merged = _SortedEvents(
+            list(
+                heapq.merge(
+                    *(self._by_class[c].events for c in classes),
+                    key=lambda e: e.timestamp,
+                )
+            )
+        )
+        self._by_parent_class[event_class] = merged
+
+        return merged
+
+    @staticmethod
+    def get_fingerprint(lol_game) -> Tuple[list, Tuple[int, ...]]:
+        """
+        Returns all events lists of the game with their lengths, used to know if the index needs to be rebuilt
+        """
+        lists = [getattr(lol_game, n) for n in GAME_EVENTS_LISTS]
+
+        for team in lol_game.teams:
+            lists.append(team.players)
+            lists.extend(getattr(team, n) for n in TEAM_EVENTS_LISTS)
+
+            for player in team.players:
+                lists.extend(getattr(player, n) for n in PLAYER_EVENTS_LISTS)
+
+        return lists, tuple(len(lst) for lst in lists)
+
+    def is_up_to_date(self, lol_game) -> bool:
+        """
+        Returns True if no events list of the game was replaced or changed length since the index was built
+        """
+        lists, lengths = self.get_fingerprint(lol_game)
+        indexed_lists, indexed_lengths = self.fingerprint
+
+        return lengths == indexed_lengths and all(
+            a is b for a, b in zip(lists, indexed_lists)
+        )
+
+
+def _get_involved_players(event) -> tuple:
+    """
+    Returns the ids of the players involved in an event, through killerId, victimId, and assistsIds
+    """
+    if isinstance(event, IndexedEvent):
+        if event.playerId is not None:
+            return (event.playerId,)
+        event = event.event
+
+    players_ids = (
+        getattr(event, "killerId", None),
+        getattr(event, "victimId", None),
+        *(getattr(event, "assistsIds", None) or ()),
+    )
+
+    return tuple(dict.fromkeys(p for p in players_ids if p is not None))
@@ -339,3 +339,28 @@ class LolGamePlayer(ChampionNameClass, RuneTreeNameClass):
 
     # Special kills are linked to players and represent first bloods, multi-kills, and ace
     specialKills: List[LolGamePlayerSpecialKill] = field(default_factory=list)
+
+    def snapshots_array(self):
+        """
+        Returns the snapshots as a structured NumPy array sorted by timestamp, see lol_dto.utilities.timeline
+        """
+        from lol_dto.utilities.timeline import snapshots_array
+
+        return snapshots_array(self)
+
+    def state_at(self, timestamp: float):
+        """
+        Returns the inventory, skill levels, and level of the player at the given timestamp, see
+        lol_dto.utilities.player_state
+
+        Checkpoints are built on first call and rebuilt when events lists are replaced or change length.
+        """
+        from lol_dto.utilities.player_state import get_state_index
+
+        return get_state_index(self).state_at(timestamp)
+
+    def invalidate_state_index(self):
+        """
+        Forces the state checkpoints to be rebuilt on next state_at() call, needed after changing events in place
+        """
+        self.__dict__.pop("_state_index", None)
@@ -1,70 +1,81 @@
 from dataclasses import dataclass
 from typing import List
 
-try:
-    # TODO Make the optional import have a better syntax and a proper extra
-    import lol_id_tools
-except ImportError:
-    pass
+from lol_dto.names_helper.name_resolver import get_name, get_patch
 
-# TODO Currently, this is relying on lol_id_tools and far from perfect
-#   Ideally, move it to using cassiopeia and using the right patch information through self.game backrefs
+# Names are resolved through lol_dto.names_helper.name_resolver, which caches them and uses the patch of the game
+#   when the object has a 'game' backref
+
+# Mixins define empty __slots__ so the compact classes inheriting from them do not get a __dict__
 
 
 @dataclass
 class ChampionNameClass:
+    __slots__ = ()
+
     championId: int
 
     @property
     def championName(self) -> str:
-        return lol_id_tools.get_name(self.championId, object_type="champion")
+        return get_name(self.championId, "champion", get_patch(self))
 
 
 @dataclass
 class BanNamesClass:
+    __slots__ = ()
+
     bans: List[int]
 
     @property
     def bansNames(self) -> List[str]:
-        return [lol_id_tools.get_name(b, object_type="champion") for b in self.bans]
+        patch = get_patch(self)
+        return [get_name(b, "champion", patch) for b in self.bans]
 
 
 @dataclass
 class RuneNameClass:
+    __slots__ = ()
+
     id: int
 
     @property
     def name(self) -> str:
-        return lol_id_tools.get_name(self.id, object_type="rune")
+        return get_name(self.id, "rune", get_patch(self))
 
 
 @dataclass
 class RuneTreeNameClass:
+    __slots__ = ()
+
     primaryRuneTreeId: int
     secondaryRuneTreeId: int
 
     @property
     def primaryRuneTreeName(self) -> str:
-        return lol_id_tools.get_name(self.primaryRuneTreeId, object_type="rune")
+        return get_name(self.primaryRuneTreeId, "rune", get_patch(self))
 
     @property
     def secondaryRuneTreeName(self) -> str:
-        return lol_id_tools.get_name(self.secondaryRuneTreeId, object_type="rune")
+        return get_name(self.secondaryRuneTreeId, "rune", get_patch(self))
 
 
 @dataclass
 class ItemNameClass:
+    __slots__ = ()
+
     id: int
 
     @property
     def name(self) -> str:
-        return lol_id_tools.get_name(self.id, object_type="item")
+        return get_name(self.id, "item", get_patch(self))
 
 
 @dataclass
 class SummonerNameClass:
+    __slots__ = ()
+
     id: int
 
     @property
     def name(self) -> str:
-        return lol_id_tools.get_name(self.id, object_type="summoner_spell")
+        return get_name(self.id, "summoner_spell", get_patch(self))
@@ -0,0 +1,156 @@
+import functools
+from typing import Dict, Optional, Tuple
+
+
+class LolIdToolsBackend:
+    """
+    Names backend relying on lol_id_tools, which only knows the latest names and therefore ignores the patch
+
+    lol_id_tools is slow to import and is therefore only imported on the first name lookup.
+    """
+
+    def __init__(self):
+        self._lol_id_tools = None
+
+    def get_name(self, object_type: str, object_id: int, patch: str = None) -> str:
+        if self._lol_id_tools is None:
+            try:
+                import lol_id_tools
+            except ImportError:
+                raise ImportError(
+                    "Names resolution requires lol_id_tools: pip install lol_dto[names]"
+                )
+
+            self._lol_id_tools = lol_id_tools
+
+        return self._lol_id_tools.get_name(object_id, object_type=object_type)
+
+
+class StaticDataBackend:
+    """
+    Names backend relying on local static data, for example to work offline
+
+    Names are defined per object type, for example {'champion': {157: 'Yasuo'}, 'item': {3031: 'Infinity Edge'}},
+    and can optionally be overridden per patch with {'12.3': {'item': {...}}}.
+    """
+
+    def __init__(
+        self,
+        names: Dict[str, Dict[int, str]],
+        patches: Optional[Dict[str, Dict[str, Dict[int, str]]]] = None,
+    ):
+        self.names = names
+        self.patches = patches or {}
+
+    @classmethod
+    def from_json(cls, filename: str) -> "StaticDataBackend":
+        """
+        Loads static data from a JSON file with 'names' and optional 'patches' keys
+
+        As JSON keys are strings, ids are cast back to integers.
+        """
+        import json
+
+        with open(filename) as file:
+            data = json.load(file)
+
+        def cast_ids(names: dict) -> dict:
+            return {
+                object_type: {int(k): v for k, v in ids.items()}
+                for object_type, ids in names.items()
+            }
+
+        return cls(
+            names=cast_ids(data.get("names", {})),
+            patches={p: cast_ids(n) for p, n in data.get("patches", {}).items()},
+        )
+
+    def get_name(self, object_type: str, object_id: int, patch: str = None) -> str:
+        if patch in self.patches:
+            name = self.patches[patch].get(object_type, {}).get(object_id)
+            if name is not None:
+                return name
+
+        return self.names.get(object_type, {}).get(object_id)
+
+
+_backend = LolIdToolsBackend()
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_name(object_type: str, object_id: int, patch: Optional[str]) -> str:
+    return _backend.get_name(object_type, object_id, patch)
+
+
+def get_name(object_id: int, object_type: str, patch: str = None) -> str:
+    """
+    Returns the name of the given object, cached on (object_type, object_id, patch)
+
+    Args:
+        object_id: the Riot API id of the object
+        object_type: 'champion', 'item', 'rune', or 'summoner_spell'
+        patch: the patch of the game, None for the latest names
+
+    Returns:
+        The name of the object
+    """
+    return _get_name(object_type, object_id, patch)
+
+
+def set_backend(backend, cache_size: int = 4096):
+    """
+    Sets the backend used to resolve names, which needs to define get_name(object_type, object_id, patch)
+
+    Args:
+        backend: the backend to use, for example StaticDataBackend.from_json('names.json')
+        cache_size: the maximum number of names kept in the LRU cache
+    """
+    global _backend, _get_name
+
+    _backend = backend
+    _get_name = functools.lru_cache(maxsize=cache_size)(_get_name.__wrapped__)
+
+
+def resolve_names(lol_game) -> Dict[Tuple[str, int], str]:
+    """
+    Resolves every champion, item, rune, and summoner spell name of a game in one pass
+
+    Resolved names are kept in the cache, so names properties of the game objects will not trigger new lookups.
+
+    Args:
+        lol_game: the LolGame to resolve names for
+
+    Returns:
+        A dictionary of (object_type, object_id) -> name
+    """
+    ids = set()
+
+    for pick_ban in lol_game.picksBans:
+        ids.add(("champion", pick_ban.championId))
+
+    for team in lol_game.teams:
+        ids.update(("champion", ban) for ban in team.bans or [])
+
+        for player in team.players:
+            ids.add(("champion", player.championId))
+            ids.add(("rune", player.primaryRuneTreeId))
+            ids.add(("rune", player.secondaryRuneTreeId))
+            ids.update(("rune", rune.id) for rune in player.runes)
+            ids.update(("summoner_spell", s.id) for s in player.summonerSpells)
+            ids.update(("item", event.id) for event in player.itemsEvents)
+
+            if player.endOfGameStats is not None:
+                ids.update(("item", item.id) for item in player.endOfGameStats.items)
+
+    return {
+        (object_type, object_id): get_name(object_id, object_type, lol_game.patch)
+        for object_type, object_id in ids
+        if object_id is not None
+    }
+
+
+def get_patch(obj) -> Optional[str]:
+    """
+    Returns the patch of the game an object belongs to through its 'game' backref, or None
+    """
+    return getattr(getattr(obj, "game", None), "patch", None)
@@ -1 +1,3 @@
-from lol_dto.utilities.dump_json import dump_json
+from lol_dto.utilities.dump_json import dump_json, to_dict
+from lol_dto.utilities.load_json import load_json, from_dict
+from lol_dto.utilities.json_lines import dump_json_lines, load_json_lines
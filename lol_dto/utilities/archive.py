@@ -0,0 +1,413 @@
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities.dump_json import to_dict
+from lol_dto.utilities.load_json import from_dict
+
+# Header: magic, format version, codec id, padding to 16 bytes
+HEADER = struct.Struct("<8sHH4x")
+MAGIC = b"LOLDTOAR"
+FORMAT_VERSION = 1
+
+# Trailer written after each footer: footer offset, footer length, magic
+TRAILER = struct.Struct("<QQ8s")
+TRAILER_MAGIC = b"LOLDTOIX"
+
+CODECS = {"json": 0, "msgpack": 1}
+
+# A game key is a (platformId, gameId) tuple or a gameHash string
+GameKey = Union[Tuple[str, int], str]
+
+
+class LolGameArchive:
+    """
+    A single file holding many serialized games, with a footer index for random access
+
+    The file starts with a header, followed by serialized games, and ends with a JSON footer mapping game keys to the
+    offset and length of their record. Keys are (platformId, gameId) tuples and gameHash strings from the game sources,
+    like RiotGameSource, and a game with both is indexed under both keys.
+
+    The file is read through mmap, so getting a game only reads its own bytes. The footer is read once when the
+    archive is opened.
+
+    Writes are append-only: new games are written at the end of the file, and a new footer is written after them by
+    flush() or close(). Replaced games and old footers stay in the file until compact() rewrites it. If the process
+    stops before a flush, the archive is opened from its last complete footer.
+
+    Example:
+        with LolGameArchive("games.lolar", "a") as archive:
+            archive.append(lol_game)
+
+        with LolGameArchive("games.lolar") as archive:
+            lol_game = archive.get(("EUW1", 5346312088))
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "r",
+        codec: str = "json",
+        cls: Type = LolGame,
+        compact: bool = False,
+    ):
+        """
+        Args:
+            filename: the archive file
+            mode: 'r' to read, 'a' to read and append, creating the file if needed
+            codec: 'json' or 'msgpack', only used when creating the file, see lol_dto.utilities.msgpack_codec
+            cls: the dataclass to load, LolGame by default
+            compact: whether or not to use the compact classes from lol_dto.classes.game.compact for snapshots and events
+        """
+        if mode not in ("r", "a"):
+            raise ValueError(f"Invalid mode {mode}, 'r' or 'a' expected")
+        if codec not in CODECS:
+            raise ValueError(f"Invalid codec {codec}, expected one of {list(CODECS)}")
+
+        self.filename = filename
+        self.mode = mode
+        self.cls = cls
+        self._compact = compact
+
+        # Records as (offset, length), and game keys -> record index
+        self._records: List[Tuple[int, int]] = []
+        self._keys: Dict[GameKey, int] = {}
+        # Size of the footer and trailer of the file, 0 if it has none
+        self._footer_size = 0
+        self._dirty = False
+
+        if mode == "a" and not os.path.exists(filename):
+            with open(filename, "wb") as file:
+                file.write(HEADER.pack(MAGIC, FORMAT_VERSION, CODECS[codec]))
+            self._dirty = True
+
+        self._file = open(filename, "r+b" if mode == "a" else "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, codec_id = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{filename} is not a lol_dto archive")
+
+        self.codec = {v: k for k, v in CODECS.items()}[codec_id]
+        self._read_footer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(set(self._keys.values()))
+
+    def __contains__(self, key: GameKey):
+        return _normalize_key(key) in self._keys
+
+    def __getitem__(self, key: GameKey):
+        return self.get(key)
+
+    def __iter__(self) -> Iterator:
+        """
+        Iterates over all games of the archive, in file order
+        """
+        for record_index in sorted(set(self._keys.values())):
+            yield self._decode(self._read_record(record_index))
+
+    def keys(self) -> List[GameKey]:
+        return list(self._keys)
+
+    def get_bytes(self, key: GameKey) -> bytes:
+        """
+        Returns the serialized game, in the archive codec
+
+        Raises:
+            KeyError: if the key is not in the archive
+        """
+        return self._read_record(self._keys[_normalize_key(key)])
+
+    def get(self, key: GameKey):
+        """
+        Returns the game with the given key
+
+        Args:
+            key: a (platformId, gameId) tuple, or a gameHash
+
+        Returns:
+            The LolGame object
+
+        Raises:
+            KeyError: if the key is not in the archive
+        """
+        return self._decode(self.get_bytes(key))
+
+    def append(self, lol_game, key: GameKey = None) -> List[GameKey]:
+        """
+        Writes a game at the end of the archive, replacing games with the same keys in the index
+
+        The game is only visible to other readers of the file after flush() or close().
+
+        Args:
+            lol_game: the LolGame to write, a similar dataclass, or a dictionary
+            key: the key of the game, read from its sources by default, see get_game_keys
+
+        Returns:
+            The keys of the game
+
+        Raises:
+            ValueError: if the key is not given and the game sources have no key
+        """
+        self._check_writable()
+
+        keys = [_normalize_key(key)] if key is not None else get_game_keys(lol_game)
+        if not keys:
+            raise ValueError(
+                "The game sources have neither platformId and gameId nor gameHash, a key is required"
+            )
+
+        data = self._encode(lol_game)
+
+        self._file.seek(0, os.SEEK_END)
+        offset = self._file.tell()
+        self._file.write(data)
+
+        self._records.append((offset, len(data)))
+        for game_key in keys:
+            self._keys[game_key] = len(self._records) - 1
+
+        self._dirty = True
+
+        return keys
+
+    def extend(self, lol_games) -> int:
+        """
+        Appends all the given games, see append()
+
+        Returns:
+            The number of games written
+        """
+        count = 0
+
+        for lol_game in lol_games:
+            self.append(lol_game)
+            count += 1
+
+        return count
+
+    def flush(self):
+        """
+        Writes the footer index after the appended games, making them visible to new readers
+        """
+        if not self._dirty:
+            return
+
+        self._check_writable()
+
+        live = sorted(set(self._keys.values()))
+        new_indexes = {old: new for new, old in enumerate(live)}
+
+        footer = json.dumps(
+            {
+                "records": [self._records[i] for i in live],
+                "keys": [
+                    [list(k) if isinstance(k, tuple) else k, new_indexes[i]]
+                    for k, i in self._keys.items()
+                ],
+            },
+            separators=(",", ":"),
+        ).encode()
+
+        self._file.seek(0, os.SEEK_END)
+        footer_offset = self._file.tell()
+        self._file.write(footer)
+        self._file.write(TRAILER.pack(footer_offset, len(footer), TRAILER_MAGIC))
+        self._file.flush()
+        self._footer_size = len(footer) + TRAILER.size
+
+        self._records = [self._records[i] for i in live]
+        self._keys = {k: new_indexes[i] for k, i in self._keys.items()}
+        self._dirty = False
+
+        self._remap()
+
+    def close(self):
+        """
+        Flushes the archive if it was modified and closes the file
+        """
+        if self._file.closed:
+            return
+
+        if self.mode == "a":
+            self.flush()
+
+        self._mmap.close()
+        self._file.close()
+
+    @property
+    def garbage_size(self) -> int:
+        """
+        The number of bytes of replaced games, old footers, and interrupted appends, which compact() removes
+        """
+        live_size = sum(self._records[i][1] for i in set(self._keys.values()))
+        file_size = os.fstat(self._file.fileno()).st_size
+
+        return file_size - HEADER.size - live_size - self._footer_size
+
+    def compact(self):
+        """
+        Rewrites the archive with only the games in the index, removing replaced games and old footers
+        """
+        self._check_writable()
+
+        temporary_filename = f"{self.filename}.compact"
+
+        with open(temporary_filename, "wb") as file:
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION, CODECS[self.codec]))
+
+            records = []
+            new_indexes = {}
+
+            for record_index in sorted(set(self._keys.values())):
+                data = self._read_record(record_index)
+                new_indexes[record_index] = len(records)
+                records.append((file.tell(), len(data)))
+                file.write(data)
+
+        self._mmap.close()
+        self._file.close()
+        os.replace(temporary_filename, self.filename)
+
+        self._records = records
+        self._keys = {k: new_indexes[i] for k, i in self._keys.items()}
+        self._dirty = True
+
+        self._file = open(self.filename, "r+b")
+        self.flush()
+
+    def _read_record(self, record_index: int) -> bytes:
+        offset, length = self._records[record_index]
+
+        if offset + length > len(self._mmap):
+            # Appended since the last flush, not mapped yet
+            self._remap()
+
+        return self._mmap[offset : offset + length]
+
+    def _encode(self, lol_game) -> bytes:
+        if self.codec == "msgpack":
+            from lol_dto.utilities.msgpack_codec import to_msgpack
+
+            # The key table depends on the class, so dictionaries are loaded as the archive class first
+            if isinstance(lol_game, dict):
+                lol_game = from_dict(lol_game, self.cls)
+
+            return to_msgpack(lol_game)
+
+        data = lol_game if isinstance(lol_game, dict) else to_dict(lol_game)
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def _decode(self, data: bytes):
+        if self.codec == "msgpack":
+            from lol_dto.utilities.msgpack_codec import from_msgpack
+
+            return from_msgpack(data, self.cls, self._compact)
+
+        return from_dict(json.loads(data), self.cls, self._compact)
+
+    def _read_footer(self):
+        """
+        Reads the last complete footer of the file, ignoring data written after it by an interrupted append
+        """
+        end = len(self._mmap)
+
+        while end > HEADER.size:
+            position = self._mmap.rfind(TRAILER_MAGIC, HEADER.size, end)
+
+            if position < 0:
+                break
+
+            trailer_offset = position + len(TRAILER_MAGIC) - TRAILER.size
+            if trailer_offset >= HEADER.size:
+                footer_offset, footer_length, _ = TRAILER.unpack_from(
+                    self._mmap, trailer_offset
+                )
+
+                if footer_offset + footer_length == trailer_offset:
+                    try:
+                        footer = json.loads(
+                            self._mmap[footer_offset:trailer_offset].decode()
+                        )
+                    except ValueError:
+                        footer = None
+
+                    if footer is not None:
+                        self._footer_size = footer_length + TRAILER.size
+                        self._records = [tuple(r) for r in footer["records"]]
+                        self._keys = {_normalize_key(k): i for k, i in footer["keys"]}
+                        return
+
+            # The magic bytes were part of a game, or of an incomplete footer
+            end = position + len(TRAILER_MAGIC) - 1
+
+    def _remap(self):
+        self._mmap.close()
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _check_writable(self):
+        if self.mode != "a":
+            raise ValueError(
+                "The archive is opened in read mode, use mode='a' to write"
+            )
+
+
+def get_game_keys(lol_game) -> List[GameKey]:
+    """
+    Returns the keys of a game, from all its sources with platformId and gameId or with gameHash
+
+    Args:
+        lol_game: a LolGame, a similar dataclass, or a dictionary
+
+    Returns:
+        A list of (platformId, gameId) tuples and gameHash strings
+    """
+    if isinstance(lol_game, dict):
+        sources = (lol_game.get("sources") or {}).values()
+    else:
+        sources = vars(lol_game.sources).values()
+
+    keys = []
+
+    for source in sources:
+        # Sources can be dataclasses, dictionaries for unregistered sources, or any other value
+        get = dict.get if isinstance(source, dict) else getattr
+
+        platform_id, game_id = get(source, "platformId", None), get(
+            source, "gameId", None
+        )
+        if platform_id is not None and game_id is not None:
+            keys.append((platform_id, game_id))
+
+        game_hash = get(source, "gameHash", None)
+        if game_hash is not None:
+            keys.append(game_hash)
+
+    return list(dict.fromkeys(keys))
+
+
+def compact_archive(filename: str):
+    """
+    Rewrites an archive with only the games in its index, see LolGameArchive.compact
+    """
+    with LolGameArchive(filename, "a") as archive:
+        archive.compact()
+
+
+def _normalize_key(key) -> GameKey:
+    # JSON stores tuples as lists
+    if isinstance(key, (list, tuple)):
+        platform_id, game_id = key
+        return platform_id, game_id
+
+    return key
@@ -0,0 +1,220 @@
+import os
+import json
+import asyncio
+import dataclasses
+from collections import deque
+from concurrent.futures import Executor
+from typing import IO, AsyncIterator, Iterable, List, Optional, Type, Union
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities.dump_json import to_dict
+from lol_dto.utilities.load_json import from_dict
+from lol_dto.utilities.json_lines import open_file
+
+# Number of lines read from a JSON Lines file in a single blocking call
+LINES_CHUNK_SIZE = 16
+
+
+async def dump_json_async(
+    lol_game: Union[LolGame, dataclasses.dataclass],
+    filename: str,
+    remove_empty: bool = True,
+    executor: Executor = None,
+):
+    """
+    Dumps the given LolGame to a local file in JSON format without blocking the event loop, see dump_json
+
+    Serialization runs in the executor and the file is written in the event loop default executor.
+
+    Args:
+        lol_game: the LolGame object to dump or a similar dataclass
+        filename: the file to dump to
+        remove_empty: whether or not to dump None fields in the JSON. True by default to heavily lighten the object
+        executor: the executor used for serialization, the event loop default thread pool by default. A
+            ProcessPoolExecutor avoids holding the GIL in the event loop process but requires pickling the game
+
+    Returns:
+        Nothing
+
+    """
+    loop = asyncio.get_running_loop()
+
+    text = await loop.run_in_executor(executor, _serialize, lol_game, remove_empty)
+
+    await loop.run_in_executor(None, _write_text, filename, text)
+
+
+async def load_json_async(
+    filename: str,
+    cls: Type = LolGame,
+    compact: bool = False,
+    executor: Executor = None,
+    fields: Iterable[str] = None,
+    lazy: Union[bool, str] = False,
+):
+    """
+    Loads a LolGame from a local JSON file without blocking the event loop, see load_json
+
+    The file is read in the event loop default executor and the game is created in the executor.
+
+    Args:
+        filename: the file to load from
+        cls: the dataclass to load, LolGame by default
+        compact: whether or not to use the compact classes from lol_dto.classes.game.compact for snapshots and events
+        executor: the executor used for deserialization, the event loop default thread pool by default
+        fields: only loads those fields paths, see from_dict
+        lazy: whether or not to load snapshots and events lists as LazyList objects, see from_dict
+
+    Returns:
+        The LolGame object, with all its children and backrefs
+
+    """
+    # Fields are sent to executors, so single-use iterables are consumed once and made picklable
+    if fields is not None and not isinstance(fields, str):
+        fields = tuple(fields)
+
+    loop = asyncio.get_running_loop()
+
+    text = await loop.run_in_executor(None, _read_text, filename)
+
+    return await loop.run_in_executor(
+        executor, _deserialize, text, cls, compact, fields, lazy
+    )
+
+
+async def iter_games_async(
+    path: str,
+    cls: Type = LolGame,
+    concurrency: int = 4,
+    compact: bool = False,
+    executor: Executor = None,
+    compression: Optional[str] = "infer",
+    fields: Iterable[str] = None,
+    lazy: Union[bool, str] = False,
+) -> AsyncIterator:
+    """
+    Asynchronously iterates on the games of a directory of JSON files or of a JSON Lines file
+
+    At most concurrency games are being read or created at any time, and games are yielded in order: sorted file
+    names for a directory, lines order for a JSON Lines file.
+
+    Args:
+        path: a directory containing .json files, or a JSON Lines file, optionally compressed
+        cls: the dataclass to load, LolGame by default
+        concurrency: the maximum number of games loaded concurrently
+        compact: whether or not to use the compact classes from lol_dto.classes.game.compact for snapshots and events
+        executor: the executor used for deserialization, the event loop default thread pool by default
+        compression: 'gzip', 'zstd', None, or 'infer' to use the file extension, only used for JSON Lines files
+        fields: only loads those fields paths, see from_dict
+        lazy: whether or not to load snapshots and events lists as LazyList objects, see from_dict
+
+    Returns:
+        An asynchronous generator of LolGame objects
+
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency needs to be at least 1")
+
+    # Fields are sent to executors, so single-use iterables are consumed once and made picklable
+    if fields is not None and not isinstance(fields, str):
+        fields = tuple(fields)
+
+    loop = asyncio.get_running_loop()
+
+    if os.path.isdir(path):
+        filenames = await loop.run_in_executor(None, _list_json_files, path)
+
+        async def make_tasks():
+            for filename in filenames:
+                yield load_json_async(filename, cls, compact, executor, fields, lazy)
+
+    else:
+
+        async def make_tasks():
+            async for line in _iter_lines_async(path, compression):
+                yield loop.run_in_executor(
+                    executor, _deserialize, line, cls, compact, fields, lazy
+                )
+
+    # Tasks are started in order and awaited in order, keeping at most concurrency of them pending
+    pending = deque()
+
+    try:
+        async for task in make_tasks():
+            pending.append(asyncio.ensure_future(task))
+
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+
+        while pending:
+            yield await pending.popleft()
+
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _iter_lines_async(
+    filename: str, compression: Optional[str]
+) -> AsyncIterator[str]:
+    loop = asyncio.get_running_loop()
+
+    file = await loop.run_in_executor(None, open_file, filename, "rt", compression)
+
+    try:
+        while True:
+            lines = await loop.run_in_executor(
+                None, _read_lines, file, LINES_CHUNK_SIZE
+            )
+            if not lines:
+                break
+
+            for line in lines:
+                if line.strip():
+                    yield line
+    finally:
+        await loop.run_in_executor(None, file.close)
+
+
+# Blocking functions run in executors, defined at the module level to be picklable
+def _serialize(lol_game, remove_empty: bool) -> str:
+    return json.dumps(to_dict(lol_game, remove_empty))
+
+
+def _deserialize(
+    text: str,
+    cls: type,
+    compact: bool,
+    fields: Iterable[str] = None,
+    lazy: Union[bool, str] = False,
+):
+    return from_dict(json.loads(text), cls, compact, fields, lazy)
+
+
+def _write_text(filename: str, text: str):
+    with open(filename, "w+") as file:
+        file.write(text)
+
+
+def _read_text(filename: str) -> str:
+    with open(filename) as file:
+        return file.read()
+
+
+def _read_lines(file: IO, size: int) -> List[str]:
+    lines = []
+
+    for line in file:
+        lines.append(line)
+        if len(lines) >= size:
+            break
+
+    return lines
+
+
+def _list_json_files(directory: str) -> List[str]:
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(".json")
+    )
@@ -0,0 +1,229 @@
+import os
+import json
+import itertools
+import traceback
+from concurrent.futures import (
+    Executor,
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, Type
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities.dump_json import dump_json, to_dict
+from lol_dto.utilities.load_json import load_json, from_dict
+
+
+@dataclass
+class BatchResult:
+    """
+    The result of processing a single item in a batch
+    """
+
+    index: int  # Position of the item in the input iterable
+    value: Any = None  # Result of the function, None if it failed
+    # Formatted exception and traceback if the function failed
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def map_batch(
+    function: Callable,
+    items: Iterable,
+    max_workers: int = None,
+    max_in_flight: int = None,
+    ordered: bool = True,
+    executor: Executor = None,
+) -> Iterator[BatchResult]:
+    """
+    Applies a function to all items across a process pool, capturing errors per item
+
+    Only max_in_flight items are submitted at any time, so items can come from a generator over a large archive
+    without being all loaded in memory.
+
+    Errors of the pool itself, like items or results that cannot be pickled or a worker process dying, are also
+    captured in the BatchResult of the items they affect.
+
+    Args:
+        function: the function to apply, which needs to be picklable (defined at the top level of a module)
+        items: the items to process
+        max_workers: the number of processes, os.cpu_count() by default, ignored if executor is given
+        max_in_flight: the maximum number of submitted items not yielded yet, 4 * max_workers by default
+        ordered: whether or not to yield results in the order of the input, or as soon as they are done
+        executor: an existing executor to use instead of creating a process pool
+
+    Returns:
+        A generator of BatchResult, one per item
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_in_flight is None:
+        max_in_flight = 4 * max_workers
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers)
+
+    items = iter(enumerate(items))
+    # Submitted futures by input index
+    in_flight = {}
+    next_index = 0
+
+    try:
+        for index, item in itertools.islice(items, max_in_flight):
+            in_flight[index] = _submit(executor, function, item)
+
+        while in_flight:
+            if ordered:
+                done_indexes = [next_index]
+                next_index += 1
+            else:
+                index_by_future = {f: i for i, f in in_flight.items()}
+                done, _ = wait(in_flight.values(), return_when=FIRST_COMPLETED)
+                done_indexes = [index_by_future[f] for f in done]
+
+            for index in done_indexes:
+                try:
+                    value, error = in_flight.pop(index).result()
+                except Exception:
+                    # Raised by the pool and not by the function, for example BrokenProcessPool or a PicklingError
+                    value, error = None, traceback.format_exc()
+
+                yield BatchResult(index, value, error)
+
+                for new_index, item in itertools.islice(items, 1):
+                    in_flight[new_index] = _submit(executor, function, item)
+
+    finally:
+        for future in in_flight.values():
+            future.cancel()
+
+        if own_executor:
+            executor.shutdown()
+
+
+def dump_json_batch(
+    games_and_filenames: Iterable[Tuple[LolGame, str]],
+    remove_empty: bool = True,
+    **kwargs,
+) -> Iterator[BatchResult]:
+    """
+    Dumps (game, filename) pairs to JSON files across a process pool, see map_batch for the other arguments
+
+    Returns:
+        A generator of BatchResult with the filename as value
+    """
+    return map_batch(
+        _dump_json,
+        ((game, filename, remove_empty) for game, filename in games_and_filenames),
+        **kwargs,
+    )
+
+
+def load_json_batch(
+    filenames: Iterable[str],
+    cls: Type = LolGame,
+    compact: bool = False,
+    fields: Iterable[str] = None,
+    **kwargs,
+) -> Iterator[BatchResult]:
+    """
+    Loads JSON files across a process pool, see load_json for compact and fields and map_batch for the other arguments
+
+    Games are built in the workers and sent back pickled, which keeps the JSON parsing and objects creation off the
+    main process. Lazy loading is not available as LazyList objects are pickled as regular lists, which creates all
+    their objects in the workers anyway.
+
+    Returns:
+        A generator of BatchResult with the loaded game as value
+    """
+    # Fields are sent with every item, so single-use iterables are consumed once and made picklable
+    if fields is not None and not isinstance(fields, str):
+        fields = tuple(fields)
+
+    return map_batch(
+        _load_json, ((f, cls, compact, fields) for f in filenames), **kwargs
+    )
+
+
+def to_json_batch(
+    lol_games: Iterable[LolGame], remove_empty: bool = True, **kwargs
+) -> Iterator[BatchResult]:
+    """
+    Serializes games to JSON strings across a process pool, see map_batch for the other arguments
+
+    Returns:
+        A generator of BatchResult with the JSON string as value
+    """
+    return map_batch(_to_json, ((g, remove_empty) for g in lol_games), **kwargs)
+
+
+def from_json_batch(
+    json_strings: Iterable[str],
+    cls: Type = LolGame,
+    compact: bool = False,
+    fields: Iterable[str] = None,
+    **kwargs,
+) -> Iterator[BatchResult]:
+    """
+    Deserializes JSON strings to games across a process pool, see from_dict for compact and fields and map_batch for
+    the other arguments
+
+    Like for load_json_batch, lazy loading is not available as games are pickled back from the workers.
+
+    Returns:
+        A generator of BatchResult with the loaded game as value
+    """
+    # Fields are sent with every item, so single-use iterables are consumed once and made picklable
+    if fields is not None and not isinstance(fields, str):
+        fields = tuple(fields)
+
+    return map_batch(
+        _from_json, ((s, cls, compact, fields) for s in json_strings), **kwargs
+    )
+
+
+def _submit(executor: Executor, function: Callable, item) -> Future:
+    try:
+        return executor.submit(_capture, function, item)
+    except Exception as e:
+        # A broken pool refuses new items, which get the error like the items already submitted
+        future = Future()
+        future.set_exception(e)
+        return future
+
+
+# Workers functions need to be defined at the module level to be picklable
+def _capture(function: Callable, item) -> Tuple[Any, Optional[str]]:
+    try:
+        return function(item), None
+    except Exception:
+        return None, traceback.format_exc()
+
+
+def _dump_json(args) -> str:
+    lol_game, filename, remove_empty = args
+    dump_json(lol_game, filename, remove_empty)
+    return filename
+
+
+def _load_json(args) -> LolGame:
+    filename, cls, compact, fields = args
+    return load_json(filename, cls, compact, fields)
+
+
+def _to_json(args) -> str:
+    lol_game, remove_empty = args
+    return json.dumps(to_dict(lol_game, remove_empty))
+
+
+def _from_json(args) -> LolGame:
+    json_string, cls, compact, fields = args
+    return from_dict(json.loads(json_string), cls, compact, fields)
@@ -0,0 +1,59 @@
+import typing
+import dataclasses
+from typing import Dict, List
+
+
+def get_classes(
+    cls: type, sources_classes: Dict[type, Dict[str, type]] = None
+) -> List[type]:
+    """
+    Returns the class and all the dataclasses it contains, in a deterministic order
+
+    Args:
+        cls: the root dataclass
+        sources_classes: source dataclasses by class and source name, like load_json.SOURCES_CLASSES, to include them
+
+    Returns:
+        The list of dataclasses, starting with cls
+    """
+    classes = []
+    to_visit = [cls]
+
+    while to_visit:
+        current = to_visit.pop(0)
+        if current in classes:
+            continue
+        classes.append(current)
+
+        if sources_classes:
+            to_visit.extend(sources_classes.get(current, {}).values())
+
+        type_hints = typing.get_type_hints(current)
+        for f in dataclasses.fields(current):
+            to_visit.extend(get_dataclasses(type_hints[f.name]))
+
+    return classes
+
+
+def get_dataclasses(type_hint) -> List[type]:
+    """
+    Returns the dataclasses appearing in a type hint, like LolGameKill in List[LolGameKill]
+    """
+    if dataclasses.is_dataclass(type_hint) and isinstance(type_hint, type):
+        return [type_hint]
+
+    return [
+        c for arg in getattr(type_hint, "__args__", ()) for c in get_dataclasses(arg)
+    ]
+
+
+def unwrap_optional(type_hint):
+    """
+    Returns X for Optional[X], and the type itself otherwise
+    """
+    if getattr(type_hint, "__origin__", None) is typing.Union:
+        args = [a for a in type_hint.__args__ if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+
+    return type_hint
@@ -0,0 +1,197 @@
+import os
+import dataclasses
+from typing import Dict, Iterable, List, Tuple
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGameKill,
+    LolGamePlayerSnapshot,
+    LolGamePlayerItemEvent,
+    LolGamePlayerWardEvent,
+    LolGamePlayerSkillLevelUpEvent,
+)
+from lol_dto.utilities.dump_json import to_dict
+
+# Tables created from player lists: table name -> (player attribute, class of the rows)
+PLAYER_TABLES = {
+    "snapshots": LolGamePlayerSnapshot,
+    "itemsEvents": LolGamePlayerItemEvent,
+    "wardsEvents": LolGamePlayerWardEvent,
+    "skillsLevelUpEvents": LolGamePlayerSkillLevelUpEvent,
+}
+
+# Tables created from game lists
+GAME_TABLES = {
+    "kills": LolGameKill,
+}
+
+# Flattened columns are computed once per class, as (attributes path, whether values need to be serialized)
+_columns_paths: Dict[type, List[Tuple[Tuple[str, ...], bool]]] = {}
+
+
+def games_to_columns(lol_games: Iterable[LolGame]) -> Dict[str, Dict[str, list]]:
+    """
+    Flattens player snapshots, player events, and kills of the given games to columns
+
+    Nested dataclasses are flattened with dotted column names, like 'championStats.armor' or 'position.x'.
+    Every row has a 'gameIndex' column referring to the game position in the input, and columns for the game sources,
+    like 'sources.riotLolApi.gameId'. Rows of player tables also have a 'playerId' column.
+
+    Args:
+        lol_games: the LolGame objects to flatten
+
+    Returns:
+        A dictionary of tables, each table being a dictionary of column name -> list of values
+
+    """
+    rows = {table: [] for table in (*PLAYER_TABLES, *GAME_TABLES)}
+    keys = {table: [] for table in rows}
+    games_sources = []
+
+    for game_index, lol_game in enumerate(lol_games):
+        games_sources.append(_flatten(to_dict(lol_game.sources), "sources"))
+
+        for table in PLAYER_TABLES:
+            for team in lol_game.teams:
+                for player in team.players:
+                    objects = getattr(player, table)
+                    rows[table].extend(objects)
+                    keys[table].extend([(game_index, player.id)] * len(objects))
+
+        for table in GAME_TABLES:
+            objects = getattr(lol_game, table)
+            rows[table].extend(objects)
+            keys[table].extend([(game_index, None)] * len(objects))
+
+    sources_columns = sorted({column for s in games_sources for column in s})
+
+    tables = {}
+    for table, row_class in {**PLAYER_TABLES, **GAME_TABLES}.items():
+        columns = {"gameIndex": [game_index for game_index, _ in keys[table]]}
+
+        for column in sources_columns:
+            columns[column] = [
+                games_sources[game_index].get(column) for game_index, _ in keys[table]
+            ]
+
+        if table in PLAYER_TABLES:
+            columns["playerId"] = [player_id for _, player_id in keys[table]]
+
+        columns.update(_objects_to_columns(rows[table], row_class))
+
+        tables[table] = columns
+
+    return tables
+
+
+def games_to_tables(lol_games: Iterable[LolGame]) -> Dict[str, "pyarrow.Table"]:
+    """
+    Transforms the given games to Arrow tables, one per entity type
+
+    See games_to_columns for the tables and columns definition.
+
+    Args:
+        lol_games: the LolGame objects to transform
+
+    Returns:
+        A dictionary of table name -> pyarrow.Table
+
+    """
+    pyarrow = _import_pyarrow()
+
+    return {
+        table: pyarrow.Table.from_pydict(columns)
+        for table, columns in games_to_columns(lol_games).items()
+    }
+
+
+def dump_parquet(lol_games: Iterable[LolGame], directory: str) -> Dict[str, str]:
+    """
+    Writes the given games as Parquet files, one per entity type, like 'snapshots.parquet'
+
+    Args:
+        lol_games: the LolGame objects to write
+        directory: the directory to write the files in, created if needed
+
+    Returns:
+        A dictionary of table name -> file path
+
+    """
+    pyarrow = _import_pyarrow()
+
+    os.makedirs(directory, exist_ok=True)
+
+    paths = {}
+    for table_name, table in games_to_tables(lol_games).items():
+        paths[table_name] = os.path.join(directory, f"{table_name}.parquet")
+        pyarrow.parquet.write_table(table, paths[table_name])
+
+    return paths
+
+
+def _objects_to_columns(objects: list, cls: type) -> Dict[str, list]:
+    try:
+        paths = _columns_paths[cls]
+    except KeyError:
+        paths = _columns_paths[cls] = list(_get_columns_paths(cls))
+
+    columns = {}
+    # Intermediate objects lists, like all 'championStats' objects, are only built once
+    parents = {(): objects}
+
+    for path, serialize in paths:
+        for depth in range(1, len(path)):
+            if path[:depth] not in parents:
+                parents[path[:depth]] = [
+                    None if o is None else getattr(o, path[depth - 1], None)
+                    for o in parents[path[: depth - 1]]
+                ]
+
+        columns[".".join(path)] = [
+            None if o is None else getattr(o, path[-1], None)
+            for o in parents[path[:-1]]
+        ]
+
+        if serialize:
+            # Lists of dataclasses, like kills damage instances, become lists of structs
+            columns[".".join(path)] = [
+                None if v is None else to_dict(v) for v in columns[".".join(path)]
+            ]
+
+    return columns
+
+
+def _get_columns_paths(cls: type, prefix: Tuple[str, ...] = ()):
+    for f in dataclasses.fields(cls):
+        if isinstance(f.type, type) and dataclasses.is_dataclass(f.type):
+            yield from _get_columns_paths(f.type, prefix + (f.name,))
+        else:
+            item_type = (getattr(f.type, "__args__", None) or [None])[0]
+            yield prefix + (f.name,), dataclasses.is_dataclass(item_type)
+
+
+def _flatten(d: dict, prefix: str) -> dict:
+    output = {}
+
+    for key, value in d.items():
+        if isinstance(value, dict):
+            output.update(_flatten(value, f"{prefix}.{key}"))
+        else:
+            output[f"{prefix}.{key}"] = value
+
+    return output
+
+
+def _import_pyarrow():
+    """
+    Returns the pyarrow module with its parquet submodule, imported on first use as they are slow to import
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "Columnar export requires the pyarrow package: pip install lol_dto[arrow]"
+        )
+
+    return pyarrow
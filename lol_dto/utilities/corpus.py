@@ -0,0 +1,250 @@
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+from lol_dto.classes.game import LolGame
+
+# RiotPlayerSource fields identifying a player across games
+PLAYER_IDENTITY_FIELDS = ("puuid", "accountId", "summonerId")
+
+
+def _get_picks(lol_game: LolGame) -> Iterable[int]:
+    yield from (pb.championId for pb in lol_game.picksBans if not pb.isBan)
+    yield from (p.championId for team in lol_game.teams for p in team.players)
+
+
+def _get_bans(lol_game: LolGame) -> Iterable[int]:
+    yield from (pb.championId for pb in lol_game.picksBans if pb.isBan)
+    yield from (ban for team in lol_game.teams for ban in team.bans or ())
+
+
+def _get_player_identity(field_name: str) -> Callable[[LolGame], Iterable]:
+    def get_identity(lol_game: LolGame) -> Iterable:
+        # Player sources are set as attributes of player.sources, like player.sources.riotLolApi
+        for team in lol_game.teams:
+            for player in team.players:
+                for source in vars(player.sources).values():
+                    yield getattr(source, field_name, None)
+
+    return get_identity
+
+
+# Index name -> function returning the values of a game for this index
+DEFAULT_INDEXES: Dict[str, Callable[[LolGame], Iterable]] = {
+    "patch": lambda g: (g.patch,),
+    "queue_id": lambda g: (g.queue_id,),
+    "winner": lambda g: (g.winner,),
+    "pick": _get_picks,
+    "ban": _get_bans,
+    **{name: _get_player_identity(name) for name in PLAYER_IDENTITY_FIELDS},
+}
+
+
+class LolGameCorpus:
+    """
+    An in-memory collection of games with inverted indexes
+
+    Each index maps a value, like a patch or a champion id, to the keys of the games having it. By default, games are
+    indexed by patch, queue_id, winner, picked and banned champions from picksBans and players, and players puuid,
+    accountId, and summonerId from their sources. Other indexes can be given as functions returning the values of a
+    game.
+
+    Queries intersect the keys of all criteria, starting with the smallest set. Indexed values are saved when a game is
+    added, so a game changed in place needs to be updated with update() for its indexes to be correct.
+
+    Example:
+        corpus = LolGameCorpus(games)
+        corpus.query(patch="12.3", pick=157)
+        corpus.query(puuid="...", queue_id=[420, 440])
+    """
+
+    def __init__(
+        self,
+        lol_games: Iterable[LolGame] = (),
+        indexes: Dict[str, Callable[[LolGame], Iterable]] = None,
+    ):
+        """
+        Args:
+            lol_games: games to add to the corpus
+            indexes: index name -> function returning the values of a game for this index, DEFAULT_INDEXES by default
+        """
+        self.indexes_functions = DEFAULT_INDEXES if indexes is None else indexes
+
+        self._games: Dict[int, LolGame] = {}
+        # id(game) -> key, as games are not hashable
+        self._keys: Dict[int, int] = {}
+        # Indexed values of each game, used to remove it from the indexes
+        self._values: Dict[int, Tuple[Tuple[str, tuple], ...]] = {}
+        self._indexes: Dict[str, Dict[object, Set[int]]] = {
+            name: {} for name in self.indexes_functions
+        }
+        self._next_key = 0
+
+        for lol_game in lol_games:
+            self.add(lol_game)
+
+    def __len__(self):
+        return len(self._games)
+
+    def __iter__(self) -> Iterator[LolGame]:
+        return iter(self._games.values())
+
+    def __contains__(self, lol_game: LolGame):
+        return id(lol_game) in self._keys
+
+    def add(self, lol_game: LolGame) -> int:
+        """
+        Adds a game to the corpus and its indexes, doing nothing if it is already in the corpus
+
+        Returns:
+            The key of the game in the corpus
+        """
+        if id(lol_game) in self._keys:
+            return self._keys[id(lol_game)]
+
+        key = self._next_key
+        self._next_key += 1
+
+        self._games[key] = lol_game
+        self._keys[id(lol_game)] = key
+        self._index(key, lol_game)
+
+        return key
+
+    def remove(self, lol_game: LolGame):
+        """
+        Removes a game from the corpus and its indexes
+
+        Raises:
+            KeyError: if the game is not in the corpus
+        """
+        key = self._keys.pop(id(lol_game))
+        del self._games[key]
+        self._unindex(key)
+
+    def update(self, lol_game: LolGame):
+        """
+        Indexes the game again, needed after changing indexed fields of a game of the corpus
+
+        Raises:
+            KeyError: if the game is not in the corpus
+        """
+        key = self._keys[id(lol_game)]
+        self._unindex(key)
+        self._index(key, lol_game)
+
+    def query_keys(self, **criteria) -> Set[int]:
+        """
+        Returns the keys of the games matching all criteria, see query()
+        """
+        candidates = []
+
+        for name, value in criteria.items():
+            if name not in self._indexes:
+                raise KeyError(f"No index named {name}")
+
+            index = self._indexes[name]
+
+            if isinstance(value, (list, tuple, set, frozenset)):
+                # Any of the values can match
+                keys = set().union(*(index.get(v, ()) for v in value))
+            else:
+                keys = index.get(value, ())
+
+            if not keys:
+                return set()
+
+            candidates.append(keys)
+
+        if not candidates:
+            return set(self._games)
+
+        # Keys of the smallest set are looked up in the other ones, from the smallest to the largest
+        candidates.sort(key=len)
+        smallest, others = candidates[0], candidates[1:]
+
+        return {k for k in smallest if all(k in keys for keys in others)}
+
+    def query(self, **criteria) -> List[LolGame]:
+        """
+        Returns the games matching all criteria, in the order they were added
+
+        Criteria are index names with a value, or a list of values of which any can match.
+
+        Args:
+            **criteria: index name -> value, like patch='12.3', pick=157, or queue_id=[420, 440]
+
+        Returns:
+            A list of LolGame
+
+        Raises:
+            KeyError: if a criterion does not match an index name
+        """
+        return [self._games[k] for k in sorted(self.query_keys(**criteria))]
+
+    def count(self, **criteria) -> int:
+        """
+        Returns the number of games matching all criteria, see query()
+        """
+        return len(self.query_keys(**criteria))
+
+    def values(self, index_name: str) -> List:
+        """
+        Returns the distinct values of an index, like all patches of the corpus
+        """
+        return list(self._indexes[index_name])
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Returns the memory used by the corpus structures in bytes, by index, without the memory of the games themselves
+
+        Sizes are shallow sizes of the containers, keys, and values, from sys.getsizeof. Small integers and strings
+        shared with the games are counted as well, so this is an upper bound.
+        """
+        usage = {
+            name: sys.getsizeof(index)
+            + sum(
+                sys.getsizeof(value) + sys.getsizeof(keys)
+                for value, keys in index.items()
+            )
+            for name, index in self._indexes.items()
+        }
+
+        usage["games"] = (
+            sys.getsizeof(self._games)
+            + sys.getsizeof(self._keys)
+            + sys.getsizeof(self._values)
+            + sum(
+                sys.getsizeof(values) + sum(sys.getsizeof(v) for _, v in values)
+                for values in self._values.values()
+            )
+        )
+        usage["total"] = sum(usage.values())
+
+        return usage
+
+    def _index(self, key: int, lol_game: LolGame):
+        values = []
+
+        for name, function in self.indexes_functions.items():
+            index_values = tuple(
+                dict.fromkeys(v for v in function(lol_game) if v is not None)
+            )
+            if index_values:
+                values.append((name, index_values))
+
+            index = self._indexes[name]
+            for value in index_values:
+                index.setdefault(value, set()).add(key)
+
+        self._values[key] = tuple(values)
+
+    def _unindex(self, key: int):
+        for name, index_values in self._values.pop(key):
+            index = self._indexes[name]
+
+            for value in index_values:
+                keys = index[value]
+                keys.discard(key)
+
+                if not keys:
+                    del index[value]
@@ -0,0 +1,334 @@
+from typing import Dict, Optional, Tuple
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGameKill,
+    LolGamePlayerEndOfGameStats,
+    LolGameTeamEndOfGameStats,
+)
+
+# Maximum time in seconds between two kills of a multi-kill, and before the fifth kill of a penta kill
+MULTI_KILL_WINDOW = 10
+PENTA_KILL_WINDOW = 30
+
+MULTI_KILLS_FIELDS = {
+    2: "doubleKills",
+    3: "tripleKills",
+    4: "quadraKills",
+    5: "pentaKills",
+}
+
+# Team end of game stats fields counting epic monsters kills, by monster type
+EPIC_MONSTERS_FIELDS = {
+    "DRAGON": ("dragonKills", "firstDragon"),
+    "BARON": ("baronKills", "firstBaron"),
+    "RIFT_HERALD": ("riftHeraldKills", "firstRiftHerald"),
+}
+
+
+class _PlayerState:
+    __slots__ = (
+        "stats",
+        "streak",
+        "multiKillLength",
+        "lastKillTimestamp",
+        "largestKillingSpree",
+        "killingSprees",
+    )
+
+    def __init__(self):
+        self.stats: Dict[str, int] = {}
+        # Kills since last death
+        self.streak = 0
+        self.multiKillLength = 0
+        self.lastKillTimestamp = None
+        self.largestKillingSpree = 0
+        self.killingSprees = 0
+
+
+class EndOfGameStatsAggregator:
+    """
+    Computes end of game stats from kills, epic monsters kills, and buildings kills, in a single pass
+
+    Calling update() again only processes events appended to the game lists since the last call, which makes it usable
+    on live games. Events are expected to be appended in chronological order, and if a list is replaced or gets
+    shorter, all events are processed again.
+
+    Stats are only computed from events lists that are not empty, so a source without buildings kills does not get its
+    turret kills set to 0.
+    """
+
+    def __init__(self, lol_game: LolGame):
+        self.lol_game = lol_game
+        self._reset()
+
+    def _reset(self):
+        self._players: Dict[int, _PlayerState] = {}
+        self._teams: Dict[str, Dict[str, int]] = {"BLUE": {}, "RED": {}}
+        # First events by name, like 'blood' or 'turret', with the side of the team that got them
+        self._firsts: Dict[str, Tuple[Optional[str], object]] = {}
+        self._has_kills = False
+        self._has_buildings_kills = False
+        self._has_epic_monsters_kills = False
+        # Processed events lists, as (list, number of processed events)
+        self._processed: Dict[Tuple[str, str], Tuple[list, int]] = {}
+        # Objects and fields written by apply(), which it can overwrite later
+        self._owned: Dict[int, Tuple[object, set]] = {}
+
+    def update(self) -> "EndOfGameStatsAggregator":
+        """
+        Processes the events appended since the last update
+
+        Returns:
+            The aggregator itself, to chain with apply()
+        """
+        for team in self.lol_game.teams:
+            for player in team.players:
+                if player.id not in self._players:
+                    self._players[player.id] = _PlayerState()
+
+        lists = [("kills", None, self.lol_game.kills)]
+        for side, team in zip(("BLUE", "RED"), self.lol_game.teams):
+            lists.append(("epicMonstersKills", side, team.epicMonstersKills))
+            lists.append(("buildingsKills", side, team.buildingsKills))
+
+        if any(self._is_rewritten(name, side, lst) for name, side, lst in lists):
+            self._reset()
+            return self.update()
+
+        new_events = []
+
+        for name, side, lst in lists:
+            _, count = self._processed.get((name, side), (lst, 0))
+            new_events.extend((e.timestamp, name, side, e) for e in lst[count:])
+            self._processed[name, side] = lst, len(lst)
+
+        # Python's sort is stable, so events without timestamp are processed in their lists order
+        new_events.sort(key=lambda e: (e[0] is None, e[0] or 0))
+
+        for _, name, side, event in new_events:
+            if name == "kills":
+                self._add_kill(event)
+            elif name == "epicMonstersKills":
+                self._add_epic_monster_kill(side, event)
+            else:
+                self._add_building_kill(side, event)
+
+        return self
+
+    def player_stats(self, player_id: int) -> dict:
+        """
+        Returns the computed stats of a player, with the names of LolGamePlayerEndOfGameStats fields
+        """
+        state = self._players[player_id]
+        stats = dict(state.stats)
+
+        if self._has_kills:
+            for name in "kills", "deaths", "assists", *MULTI_KILLS_FIELDS.values():
+                stats.setdefault(name, 0)
+
+            stats["killingSprees"] = state.killingSprees
+            stats["largestKillingSpree"] = state.largestKillingSpree
+
+        if self._has_buildings_kills:
+            for name in (
+                "turretKills",
+                "inhibitorKills",
+                "turretTakedowns",
+                "inhibitorTakedowns",
+            ):
+                stats.setdefault(name, 0)
+
+        if self._has_epic_monsters_kills:
+            stats.setdefault("dragonKills", 0)
+            stats.setdefault("baronKills", 0)
+
+        for first_name, field_name in (
+            ("blood", "firstBlood"),
+            ("turret", "firstTurret"),
+            ("inhibitor", "firstInhibitor"),
+        ):
+            _, first = self._firsts.get(first_name, (None, None))
+
+            if first is not None:
+                stats[field_name] = first.killerId == player_id
+                stats[f"{field_name}Assist"] = player_id in (first.assistsIds or ())
+
+        return stats
+
+    def team_stats(self, side: str) -> dict:
+        """
+        Returns the computed stats of a team, with the names of LolGameTeamEndOfGameStats fields
+        """
+        stats = dict(self._teams[side])
+
+        if self._has_buildings_kills:
+            stats.setdefault("turretKills", 0)
+            stats.setdefault("inhibitorKills", 0)
+
+        if self._has_epic_monsters_kills:
+            for count_field, _ in EPIC_MONSTERS_FIELDS.values():
+                stats.setdefault(count_field, 0)
+
+        for first_name, field_name in (
+            ("turret", "firstTurret"),
+            ("inhibitor", "firstInhibitor"),
+            *((t, first_field) for t, (_, first_field) in EPIC_MONSTERS_FIELDS.items()),
+        ):
+            if first_name in self._firsts:
+                stats[field_name] = self._firsts[first_name][0] == side
+
+        return stats
+
+    def apply(self, overwrite: bool = False):
+        """
+        Writes the computed stats to the endOfGameStats of players and teams, creating them if needed
+
+        Args:
+            overwrite: whether or not to overwrite fields that already have a value. Fields written by a previous call
+                to apply() are always updated
+        """
+        for side, team in zip(("BLUE", "RED"), self.lol_game.teams):
+            if team.endOfGameStats is None:
+                team.endOfGameStats = LolGameTeamEndOfGameStats()
+
+            self._write(team.endOfGameStats, self.team_stats(side), overwrite)
+
+            for player in team.players:
+                if player.endOfGameStats is None:
+                    player.endOfGameStats = LolGamePlayerEndOfGameStats()
+
+                self._write(
+                    player.endOfGameStats, self.player_stats(player.id), overwrite
+                )
+
+    def _write(self, obj, stats: dict, overwrite: bool):
+        _, owned = self._owned.setdefault(id(obj), (obj, set()))
+
+        for name, value in stats.items():
+            if overwrite or name in owned or getattr(obj, name) is None:
+                setattr(obj, name, value)
+                owned.add(name)
+
+    def _is_rewritten(self, name: str, side: Optional[str], lst: list) -> bool:
+        processed = self._processed.get((name, side))
+        return processed is not None and (
+            processed[0] is not lst or len(lst) < processed[1]
+        )
+
+    def _add_kill(self, kill: LolGameKill):
+        self._has_kills = True
+
+        if "blood" not in self._firsts and kill.killerId in self._players:
+            self._firsts["blood"] = None, kill
+
+        killer = self._players.get(kill.killerId)
+
+        if killer is not None:
+            _increment(killer.stats, "kills")
+            killer.streak += 1
+
+            if killer.streak == 2:
+                killer.killingSprees += 1
+            if killer.streak >= 2:
+                killer.largestKillingSpree = max(
+                    killer.largestKillingSpree, killer.streak
+                )
+
+            window = (
+                PENTA_KILL_WINDOW if killer.multiKillLength == 4 else MULTI_KILL_WINDOW
+            )
+            if (
+                killer.lastKillTimestamp is not None
+                and kill.timestamp is not None
+                and kill.timestamp - killer.lastKillTimestamp <= window
+                and killer.multiKillLength < 5
+            ):
+                killer.multiKillLength += 1
+            else:
+                killer.multiKillLength = 1
+
+            killer.lastKillTimestamp = kill.timestamp
+
+            if killer.multiKillLength in MULTI_KILLS_FIELDS:
+                _increment(killer.stats, MULTI_KILLS_FIELDS[killer.multiKillLength])
+
+        victim = self._players.get(kill.victimId)
+
+        if victim is not None:
+            _increment(victim.stats, "deaths")
+            victim.streak = 0
+            victim.multiKillLength = 0
+            victim.lastKillTimestamp = None
+
+        for assist_id in kill.assistsIds or ():
+            if assist_id in self._players:
+                _increment(self._players[assist_id].stats, "assists")
+
+    def _add_epic_monster_kill(self, side: str, event):
+        if event.type not in EPIC_MONSTERS_FIELDS:
+            # Dragon souls are not kills
+            return
+
+        self._has_epic_monsters_kills = True
+
+        count_field, _ = EPIC_MONSTERS_FIELDS[event.type]
+        _increment(self._teams[side], count_field)
+        self._set_first(event.type, side, event)
+
+        if event.type in ("DRAGON", "BARON") and event.killerId in self._players:
+            _increment(self._players[event.killerId].stats, count_field)
+
+    def _add_building_kill(self, side: str, event):
+        if event.type == "TURRET":
+            first_name, kills_field, takedowns_field = (
+                "turret",
+                "turretKills",
+                "turretTakedowns",
+            )
+        elif event.type == "INHIBITOR":
+            first_name, kills_field, takedowns_field = (
+                "inhibitor",
+                "inhibitorKills",
+                "inhibitorTakedowns",
+            )
+        else:
+            # Turret plates are not building kills
+            return
+
+        self._has_buildings_kills = True
+
+        _increment(self._teams[side], kills_field)
+        self._set_first(first_name, side, event)
+
+        killer = self._players.get(event.killerId)
+        if killer is not None:
+            _increment(killer.stats, kills_field)
+
+        for player_id in {event.killerId, *(event.assistsIds or ())}:
+            if player_id in self._players:
+                _increment(self._players[player_id].stats, takedowns_field)
+
+    def _set_first(self, name: str, side: str, event):
+        if name not in self._firsts:
+            self._firsts[name] = side, event
+
+
+def fill_end_of_game_stats(lol_game: LolGame, overwrite: bool = False) -> LolGame:
+    """
+    Fills players and teams end of game stats computed from the game events, see EndOfGameStatsAggregator
+
+    Args:
+        lol_game: the game to fill, modified in place
+        overwrite: whether or not to overwrite fields that already have a value
+
+    Returns:
+        The game
+    """
+    EndOfGameStatsAggregator(lol_game).update().apply(overwrite)
+
+    return lol_game
+
+
+def _increment(stats: Dict[str, int], name: str):
+    stats[name] = stats.get(name, 0) + 1
@@ -0,0 +1,128 @@
+import json
+import dataclasses
+from typing import IO, Iterable, Iterator, Optional, Type, Union
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities.dump_json import to_dict
+from lol_dto.utilities.load_json import from_dict
+
+COMPRESSIONS = {".gz": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+
+
+def dump_json_lines(
+    lol_games: Iterable[Union[LolGame, dataclasses.dataclass, dict]],
+    filename: str,
+    remove_empty: bool = True,
+    compression: Optional[str] = "infer",
+) -> int:
+    """
+    Dumps LolGame objects to a local file in JSON Lines format, one game per line
+
+    Games are written one at a time, so any iterable can be used, including generators.
+
+    Args:
+        lol_games: the LolGame objects to dump, similar dataclasses or dictionaries
+        filename: the file to dump to
+        remove_empty: whether or not to dump None fields in the JSON. True by default to heavily lighten the objects
+        compression: 'gzip', 'zstd', None, or 'infer' to use the file extension (.gz, .zst)
+
+    Returns:
+        The number of games written
+
+    """
+    count = 0
+
+    with open_file(filename, "wt", compression) as file:
+        for lol_game in lol_games:
+            if isinstance(lol_game, dict) and not remove_empty:
+                output_dict = lol_game
+            else:
+                # Dictionaries get copied without their None fields, so the caller's dictionaries are left unchanged
+                output_dict = to_dict(lol_game, remove_empty)
+
+            file.write(json.dumps(output_dict, separators=(",", ":")))
+            file.write("\n")
+            count += 1
+
+    return count
+
+
+def load_json_lines(
+    filename: str,
+    cls: Type = LolGame,
+    compression: Optional[str] = "infer",
+    as_dict: bool = False,
+    compact: bool = False,
+    fields: Iterable[str] = None,
+    lazy: Union[bool, str] = False,
+) -> Iterator:
+    """
+    Loads LolGame objects from a local JSON Lines file, one game at a time
+
+    Only one game is held in memory at a time, whatever the size of the file.
+
+    Args:
+        filename: the file to load from
+        cls: the dataclass to load, LolGame by default
+        compression: 'gzip', 'zstd', None, or 'infer' to use the file extension (.gz, .zst)
+        as_dict: whether or not to yield the raw dictionaries instead of LolGame objects
+        compact: whether or not to use the compact classes from lol_dto.classes.game.compact for snapshots and events
+        fields: only loads those fields paths, see from_dict
+        lazy: whether or not to load snapshots and events lists as LazyList objects, see from_dict
+
+    Returns:
+        A generator of LolGame objects
+
+    """
+    # Fields are used for every line, so single-use iterables are consumed once
+    if fields is not None and not isinstance(fields, str):
+        fields = tuple(fields)
+
+    with open_file(filename, "rt", compression) as file:
+        for line in file:
+            if not line.strip():
+                continue
+
+            data = json.loads(line)
+
+            yield data if as_dict else from_dict(data, cls, compact, fields, lazy)
+
+
+def open_file(filename: str, mode: str, compression: Optional[str] = "infer") -> IO:
+    """
+    Opens a local text file, optionally compressed
+
+    Args:
+        filename: the file to open
+        mode: the text mode to open the file with, like 'rt' or 'wt'
+        compression: 'gzip', 'zstd', None, or 'infer' to use the file extension (.gz, .zst)
+
+    Returns:
+        The file object
+
+    """
+    if compression == "infer":
+        compression = next(
+            (c for ext, c in COMPRESSIONS.items() if filename.endswith(ext)), None
+        )
+
+    if compression is None:
+        return open(filename, mode, encoding="utf-8")
+
+    # Compression modules are imported lazily as they are not always needed
+    if compression == "gzip":
+        import gzip
+
+        return gzip.open(filename, mode, encoding="utf-8")
+
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstd compression requires the zstandard package: pip install lol_dto[zstd]"
+            )
+
+        return zstandard.open(filename, mode, encoding="utf-8")
+
+    raise ValueError(f"Unknown compression: {compression}")
@@ -0,0 +1,130 @@
+from collections.abc import MutableSequence
+from typing import Any, Callable, Iterator, List
+
+# Marks items that were not created yet
+_NOT_BUILT = object()
+
+
+class LazyList(MutableSequence):
+    """
+    A list holding raw dictionaries, creating the corresponding objects only when they are accessed
+
+    It is used by from_dict(lazy=True) for snapshots and events lists, and behaves like a list for iteration, len(),
+    indexing, and comparisons. Any modification of the list first creates all its objects, after which it behaves
+    like a regular list.
+
+    With cache=False, used by from_dict(lazy='uncached'), objects are created again at every access, which keeps memory
+    low when iterating once over large lists, but means changes made to the objects are lost.
+    """
+
+    __slots__ = ("_raw", "_items", "_converter", "_cache", "_attributes")
+
+    def __init__(self, raw: list, converter: Callable[[Any], Any], cache: bool = True):
+        self._raw = raw
+        self._items = [_NOT_BUILT] * len(raw) if cache else None
+        self._converter = converter
+        self._cache = cache
+        # Attributes set on all objects when they are created, like the 'game' backref
+        self._attributes = {}
+
+    def __len__(self):
+        if self._raw is None:
+            return len(self._items)
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LazyList index out of range")
+
+        return self._get(index)
+
+    def __iter__(self) -> Iterator:
+        for i in range(len(self)):
+            yield self._get(i)
+
+    def __setitem__(self, index, value):
+        self.materialize()[index] = value
+
+    def __delitem__(self, index):
+        del self.materialize()[index]
+
+    def insert(self, index: int, value):
+        self.materialize().insert(index, value)
+
+    def sort(self, *args, **kwargs):
+        self.materialize().sort(*args, **kwargs)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        # Converters cannot be pickled, so lazy lists are copied and pickled as regular lists
+        return list, (list(self),)
+
+    @property
+    def built_count(self) -> int:
+        """
+        The number of objects already created and cached
+        """
+        if self._items is None:
+            return 0
+        return sum(item is not _NOT_BUILT for item in self._items)
+
+    def materialize(self) -> List:
+        """
+        Creates all objects and returns the underlying list, after which the raw data is released
+        """
+        if self._raw is not None:
+            self._items = [self._get(i) for i in range(len(self._raw))]
+            self._raw = None
+            self._cache = True
+
+        return self._items
+
+    def set_items_attribute(self, name: str, value):
+        """
+        Sets an attribute on all objects, including the ones created later, without creating them
+        """
+        self._attributes[name] = value
+
+        for item in self._items or ():
+            if item is not _NOT_BUILT:
+                setattr(item, name, value)
+
+    def iter_raw(self) -> Iterator:
+        """
+        Yields the raw data of objects not created yet and the created objects otherwise, used when dumping
+        """
+        if self._raw is None:
+            yield from self._items
+            return
+
+        for i, raw in enumerate(self._raw):
+            item = _NOT_BUILT if self._items is None else self._items[i]
+            yield raw if item is _NOT_BUILT else item
+
+    def _get(self, index: int):
+        if self._items is not None:
+            item = self._items[index]
+            if item is not _NOT_BUILT:
+                return item
+
+        item = self._converter(self._raw[index])
+
+        for name, value in self._attributes.items():
+            setattr(item, name, value)
+
+        if self._cache:
+            self._items[index] = item
+
+        return item
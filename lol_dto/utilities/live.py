@@ -0,0 +1,362 @@
+import copy
+import dataclasses
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Dict, List, Optional, Tuple
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGameKill,
+    LolGamePlayer,
+    LolGamePlayerItemEvent,
+    LolGamePlayerLargeMonsterKill,
+    LolGamePlayerSkillLevelUpEvent,
+    LolGamePlayerSnapshot,
+    LolGamePlayerSpecialKill,
+    LolGamePlayerSpellUseEvent,
+    LolGamePlayerWardEvent,
+    LolGameTeamBuildingKill,
+    LolGameTeamEpicMonsterKill,
+    LolGameTeams,
+)
+from lol_dto.classes.game.compact import get_original_class
+from lol_dto.utilities.dump_json import to_dict
+from lol_dto.utilities.end_of_game_stats import EndOfGameStatsAggregator
+
+# Lists of a player receiving each class, used when no list name is given
+PLAYER_LISTS = {
+    LolGamePlayerSnapshot: "snapshots",
+    LolGamePlayerItemEvent: "itemsEvents",
+    LolGamePlayerWardEvent: "wardsEvents",
+    LolGamePlayerSkillLevelUpEvent: "skillsLevelUpEvents",
+    LolGamePlayerLargeMonsterKill: "largeMonstersKills",
+    LolGamePlayerSpellUseEvent: "spellsUses",
+    LolGamePlayerSpecialKill: "specialKills",
+}
+
+TEAM_LISTS = {
+    LolGameTeamEpicMonsterKill: "epicMonstersKills",
+    LolGameTeamBuildingKill: "buildingsKills",
+}
+
+# Lists that are not events lists but can still be appended to, which snapshots also need to freeze
+PLAYER_OTHER_LISTS = ("levelUpEvents", "runes", "summonerSpells")
+TEAM_OTHER_LISTS = ("bans",)
+
+# Lists of timestamps, which are part of deltas like events lists
+TIMESTAMPS_LISTS = ("levelUpEvents",)
+
+_ATOMIC_TYPES = (str, int, float, bool)
+
+
+class PrefixView(Sequence):
+    """
+    A read-only view of the first items of an append-only list, which is not affected by later appends
+    """
+
+    __slots__ = ("_buffer", "_length")
+
+    def __init__(self, buffer: list, length: int = None):
+        self._buffer = buffer
+        self._length = len(buffer) if length is None else length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._buffer[i] for i in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("PrefixView index out of range")
+
+        return self._buffer[index]
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield self._buffer[i]
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class LiveLolGameBuilder:
+    """
+    Builds a LolGame from a live feed, with append-only events lists
+
+    The lists of the builder game are used as append-only buffers: events and snapshots are only appended to them, and
+    never removed. This makes snapshot() cheap, as its lists are PrefixView objects sharing the buffers, and only the
+    game, teams, and players objects are copied.
+
+    Events do not need to be appended in chronological order, but delta_since() is faster when they are.
+    """
+
+    def __init__(self, lol_game: LolGame = None, end_of_game_stats: bool = False):
+        """
+        Args:
+            lol_game: the game to build upon, with its teams and players, a new LolGame by default
+            end_of_game_stats: whether or not to compute end of game stats from events, see EndOfGameStatsAggregator
+        """
+        self.lol_game = LolGame() if lol_game is None else lol_game
+
+        self._players: Dict[int, LolGamePlayer] = {
+            p.id: p for team in self.lol_game.teams for p in team.players
+        }
+
+        self._aggregator = (
+            EndOfGameStatsAggregator(self.lol_game) if end_of_game_stats else None
+        )
+
+        # Timestamps of the buffers, used by delta_since: id(list) -> (list, timestamps, sorted)
+        self._timestamps: Dict[int, Tuple[list, List[float], bool]] = {}
+
+        self._version = 0
+        self._snapshot: Optional[Tuple[int, LolGame]] = None
+
+    def add_player(self, side: str, player: LolGamePlayer):
+        """
+        Adds a player to the team of the given side, 'BLUE' or 'RED'
+        """
+        getattr(self.lol_game.teams, side).players.append(player)
+        player.game = self.lol_game
+        self._players[player.id] = player
+        self._version += 1
+
+    def add_kill(self, kill: LolGameKill):
+        self.lol_game.kills.append(kill)
+        self._version += 1
+
+    def add_team_event(self, side: str, event, list_name: str = None):
+        """
+        Appends an event to a team list, chosen from the event class if list_name is not given
+
+        Args:
+            side: 'BLUE' or 'RED'
+            event: the event, like a LolGameTeamBuildingKill
+            list_name: the team list to append to, like 'buildingsKills'
+        """
+        list_name = list_name or _get_list_name(TEAM_LISTS, event)
+        getattr(getattr(self.lol_game.teams, side), list_name).append(event)
+        self._version += 1
+
+    def add_player_event(self, player_id: int, event, list_name: str = None):
+        """
+        Appends an event or a snapshot to a player list, chosen from the event class if list_name is not given
+
+        Args:
+            player_id: the id of the player
+            event: the event or snapshot, like a LolGamePlayerWardEvent
+            list_name: the player list to append to, like 'wardsEvents', or 'levelUpEvents' for a level up timestamp
+        """
+        list_name = list_name or _get_list_name(PLAYER_LISTS, event)
+        player = self._players[player_id]
+
+        if list_name == "itemsEvents":
+            event.game = self.lol_game
+
+        getattr(player, list_name).append(event)
+        self._version += 1
+
+    def set_fields(self, **fields):
+        """
+        Sets fields of the game, like duration or winner
+        """
+        for name, value in fields.items():
+            setattr(self.lol_game, name, value)
+
+        self._version += 1
+
+    def snapshot(self) -> LolGame:
+        """
+        Returns the game as it is now, unaffected by later additions
+
+        Events and snapshots objects are shared with the builder and should not be modified. Game, teams, players, and
+        end of game stats objects are copied, and lists are PrefixView objects over the builder lists.
+        """
+        if self._snapshot is not None and self._snapshot[0] == self._version:
+            return self._snapshot[1]
+
+        if self._aggregator is not None:
+            self._aggregator.update().apply()
+
+        lol_game = copy.copy(self.lol_game)
+        lol_game.__dict__.pop("_event_index", None)
+
+        lol_game.kills = PrefixView(self.lol_game.kills)
+        lol_game.picksBans = PrefixView(self.lol_game.picksBans)
+        lol_game.pauses = PrefixView(self.lol_game.pauses)
+        lol_game.teams = LolGameTeams(
+            *(self._snapshot_team(team, lol_game) for team in self.lol_game.teams)
+        )
+
+        self._snapshot = self._version, lol_game
+
+        return lol_game
+
+    def delta_since(self, timestamp: float, remove_empty: bool = True) -> dict:
+        """
+        Returns a dictionary with the game fields and the events and snapshots with a timestamp strictly above the
+        given one, to send updates to clients
+
+        Events without timestamp are never part of deltas.
+
+        The dictionary has the same structure as to_dict(lol_game), with players only identified by their id, and lists
+        only holding new items. End of game stats are included when computed by the builder.
+
+        Args:
+            timestamp: the timestamp of the last update, in seconds
+            remove_empty: whether or not to remove None fields
+
+        Returns:
+            The delta as a dictionary
+        """
+        if self._aggregator is not None:
+            self._aggregator.update().apply()
+
+        delta = {
+            f.name: value
+            for f in dataclasses.fields(self.lol_game)
+            for value in (getattr(self.lol_game, f.name),)
+            if isinstance(value, _ATOMIC_TYPES)
+        }
+
+        kills = self._events_since(self.lol_game.kills, timestamp, remove_empty)
+        if kills:
+            delta["kills"] = kills
+
+        teams = {}
+
+        for side, team in zip(("BLUE", "RED"), self.lol_game.teams):
+            team_delta = {}
+
+            for list_name in TEAM_LISTS.values():
+                events = self._events_since(
+                    getattr(team, list_name), timestamp, remove_empty
+                )
+                if events:
+                    team_delta[list_name] = events
+
+            if self._aggregator is not None:
+                team_delta["endOfGameStats"] = to_dict(
+                    team.endOfGameStats, remove_empty
+                )
+
+            players = []
+
+            for player in team.players:
+                player_delta = {}
+
+                for list_name in (*PLAYER_LISTS.values(), *TIMESTAMPS_LISTS):
+                    events = self._events_since(
+                        getattr(player, list_name), timestamp, remove_empty
+                    )
+                    if events:
+                        player_delta[list_name] = events
+
+                if self._aggregator is not None:
+                    player_delta["endOfGameStats"] = to_dict(
+                        player.endOfGameStats, remove_empty
+                    )
+
+                if player_delta:
+                    players.append({"id": player.id, **player_delta})
+
+            if players:
+                team_delta["players"] = players
+
+            if team_delta:
+                teams[side] = team_delta
+
+        if teams:
+            delta["teams"] = teams
+
+        return delta
+
+    def _snapshot_team(self, team, lol_game: LolGame):
+        team = copy.copy(team)
+        team.game = lol_game
+        team.endOfGameStats = copy.copy(team.endOfGameStats)
+
+        for list_name in (*TEAM_LISTS.values(), *TEAM_OTHER_LISTS):
+            value = getattr(team, list_name)
+            if value is not None:
+                setattr(team, list_name, PrefixView(value))
+
+        team.players = [self._snapshot_player(p, lol_game) for p in team.players]
+
+        return team
+
+    @staticmethod
+    def _snapshot_player(player: LolGamePlayer, lol_game: LolGame):
+        player = copy.copy(player)
+        player.game = lol_game
+        player.endOfGameStats = copy.copy(player.endOfGameStats)
+
+        if player.endOfGameStats is not None:
+            player.endOfGameStats.items = PrefixView(player.endOfGameStats.items)
+
+        for list_name in (*PLAYER_LISTS.values(), *PLAYER_OTHER_LISTS):
+            setattr(player, list_name, PrefixView(getattr(player, list_name)))
+
+        return player
+
+    def _events_since(self, events: list, timestamp: float, remove_empty: bool):
+        buffer, timestamps, is_sorted = self._timestamps.get(
+            id(events), (None, [], True)
+        )
+
+        if buffer is not events:
+            # New list, or an id reused by another list
+            timestamps, is_sorted = [], True
+
+        for event in events[len(timestamps) :]:
+            event_timestamp = _get_timestamp(event)
+
+            if event_timestamp is None or (
+                timestamps and event_timestamp < timestamps[-1]
+            ):
+                is_sorted = False
+
+            timestamps.append(event_timestamp)
+
+        self._timestamps[id(events)] = events, timestamps, is_sorted
+
+        if is_sorted:
+            new_events = events[bisect_right(timestamps, timestamp) :]
+        else:
+            new_events = [
+                e
+                for e, event_timestamp in zip(events, timestamps)
+                if event_timestamp is not None and event_timestamp > timestamp
+            ]
+
+        return [
+            e if isinstance(e, _ATOMIC_TYPES) else to_dict(e, remove_empty)
+            for e in new_events
+        ]
+
+
+def _get_timestamp(event) -> Optional[float]:
+    # Lists of timestamps, like levelUpEvents, hold the timestamps themselves
+    if isinstance(event, _ATOMIC_TYPES):
+        return event
+
+    return event.timestamp
+
+
+def _get_list_name(lists: Dict[type, str], event) -> str:
+    for cls in get_original_class(type(event)).__mro__:
+        if cls in lists:
+            return lists[cls]
+
+    raise ValueError(f"No list for events of class {type(event).__name__}")
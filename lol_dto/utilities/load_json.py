@@ -0,0 +1,341 @@
+import json
+import dataclasses
+import typing
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type, Union
+
+from lol_dto.classes.game import LolGame, LolGamePlayer
+from lol_dto.classes.game.compact import COMPACT_CLASSES
+from lol_dto.classes.sources.empty_dataclass import EmptyDataclass
+from lol_dto.classes.sources.riot_lol_api import RiotGameSource, RiotPlayerSource
+from lol_dto.utilities.class_tree import unwrap_optional
+from lol_dto.utilities.lazy_list import LazyList
+
+# Source dataclasses known for each class having a 'sources' field, indexed by source name
+# Sources that are not registered are loaded as plain dictionaries
+SOURCES_CLASSES: Dict[type, Dict[str, type]] = {
+    LolGame: {"riotLolApi": RiotGameSource},
+    LolGamePlayer: {"riotLolApi": RiotPlayerSource},
+}
+
+# Lists loaded as LazyList objects with from_dict(lazy=True)
+LAZY_FIELDS: Dict[type, Tuple[str, ...]] = {
+    LolGame: ("kills",),
+    LolGamePlayer: (
+        "snapshots",
+        "itemsEvents",
+        "wardsEvents",
+        "skillsLevelUpEvents",
+        "spellsUses",
+    ),
+}
+
+# Converters are built once per (class, compact, lazy), or (class, compact, lazy, projection), and then reused for
+#   every object
+_converters: Dict[tuple, Callable[[dict], Any]] = {}
+
+
+def load_json(
+    filename: str,
+    cls: Type = LolGame,
+    compact: bool = False,
+    fields: Iterable[str] = None,
+    lazy: Union[bool, str] = False,
+):
+    """
+    Loads a LolGame from a local JSON file, usually created with dump_json
+
+    Args:
+        filename: the file to load from
+        cls: the dataclass to load, LolGame by default
+        compact: whether or not to use the compact classes from lol_dto.classes.game.compact for snapshots and events
+        fields: only loads those fields paths, see from_dict
+        lazy: whether or not to load snapshots and events lists as LazyList objects, see from_dict
+
+    Returns:
+        The LolGame object, with all its children and backrefs
+
+    """
+    with open(filename) as file:
+        return from_dict(json.load(file), cls, compact, fields, lazy)
+
+
+def from_dict(
+    data: dict,
+    cls: Type = LolGame,
+    compact: bool = False,
+    fields: Iterable[str] = None,
+    lazy: Union[bool, str] = False,
+):
+    """
+    Creates a LolGame from a dictionary, usually the output of dataclasses.asdict or a JSON dump
+
+    Nested dataclasses are created with converters that are built once per class and cached.
+    Missing fields get their default value, and missing fields without default are set to None.
+
+    Fields paths are dot-separated fields names, with '*' matching all fields of an object or all items of a list, like
+    'winner', 'picksBans', or 'teams.*.players.*.endOfGameStats.kills'. Only the objects needed for those paths are
+    created, and other fields get their default value.
+
+    With lazy=True, the lists in LAZY_FIELDS, like snapshots and events, are LazyList objects keeping the dictionaries
+    and creating objects when they are accessed. Dictionaries are used as-is, so they should not be modified afterwards.
+    With lazy='uncached', objects are created again at every access instead of being kept, see LazyList.
+
+    Args:
+        data: the dictionary to transform
+        cls: the dataclass to create, LolGame by default
+        compact: whether or not to use the compact classes from lol_dto.classes.game.compact for snapshots and events
+        fields: only creates those fields paths, None to create all fields
+        lazy: whether or not to create snapshots and events lists as LazyList objects, or 'uncached' for LazyList
+            objects that do not keep the objects they create
+
+    Returns:
+        The LolGame object, with all its children and backrefs
+
+    """
+    return get_converter(cls, compact, fields, lazy)(data)
+
+
+def register_source(cls: type, source_name: str, source_class: type):
+    """
+    Registers a source dataclass so it gets loaded as a dataclass and not as a dictionary
+
+    Args:
+        cls: the class holding the 'sources' field, for example LolGame or LolGamePlayer
+        source_name: the attribute name of the source, for example 'riotLolApi'
+        source_class: the source dataclass, for example RiotGameSource
+    """
+    SOURCES_CLASSES.setdefault(cls, {})[source_name] = source_class
+
+    # Converters capture their children converters, so they all need to be rebuilt
+    _converters.clear()
+
+
+def get_converter(
+    cls: type,
+    compact: bool = False,
+    fields: Iterable[str] = None,
+    lazy: Union[bool, str] = False,
+) -> Callable[[dict], Any]:
+    """
+    Returns the cached converter creating objects of the given dataclass from a dictionary
+    """
+    if fields is not None:
+        return _get_projected_converter(cls, compact, lazy, parse_fields(fields))
+
+    try:
+        return _converters[cls, compact, lazy]
+    except KeyError:
+        converter = _converters[cls, compact, lazy] = _make_class_converter(
+            cls, compact, lazy
+        )
+        return converter
+
+
+def parse_fields(fields: Iterable[str]) -> dict:
+    """
+    Transforms fields paths to a projection tree, like {'teams': {'*': {'players': {'*': {'championId': {}}}}}}
+
+    Empty dictionaries mean the whole field is loaded.
+    """
+    if isinstance(fields, str):
+        raise TypeError("fields needs to be an iterable of fields paths, not a string")
+
+    projection = {}
+
+    for path in fields:
+        node = projection
+        *parents, leaf = path.split(".")
+
+        for name in parents:
+            child = node.get(name)
+
+            if child is not None and not child:
+                # A parent of the path is already fully loaded
+                break
+
+            node = node.setdefault(name, {})
+        else:
+            node[leaf] = {}
+
+    return projection
+
+
+def _get_projected_converter(
+    cls: type, compact: bool, lazy: Union[bool, str], projection: dict
+) -> Callable[[dict], Any]:
+    if not projection:
+        return get_converter(cls, compact, lazy=lazy)
+
+    key = cls, compact, lazy, _freeze(projection)
+
+    try:
+        return _converters[key]
+    except KeyError:
+        converter = _converters[key] = _make_class_converter(
+            cls, compact, lazy, projection
+        )
+        return converter
+
+
+def _get_field_projection(projection: dict, name: str) -> Optional[dict]:
+    """
+    Returns the projection of a field, merging the ones of its name and of '*', or None if it is not loaded
+    """
+    projections = [
+        p for p in (projection.get(name), projection.get("*")) if p is not None
+    ]
+
+    if not projections:
+        return None
+
+    if any(not p for p in projections):
+        return {}
+
+    if len(projections) == 1:
+        return projections[0]
+
+    return _merge_projections(*projections)
+
+
+def _merge_projections(projection: dict, other: dict) -> dict:
+    if not projection or not other:
+        return {}
+
+    merged = dict(projection)
+
+    for name, child in other.items():
+        merged[name] = (
+            _merge_projections(merged[name], child) if name in merged else child
+        )
+
+    return merged
+
+
+def _freeze(projection: dict) -> tuple:
+    return tuple(sorted((k, _freeze(v)) for k, v in projection.items()))
+
+
+def _make_class_converter(
+    cls: type, compact: bool, lazy: Union[bool, str] = False, projection: dict = None
+) -> Callable[[dict], Any]:
+    lazy_fields = LAZY_FIELDS.get(cls, ()) if lazy else ()
+
+    if compact:
+        cls = COMPACT_CLASSES.get(cls, cls)
+
+    type_hints = typing.get_type_hints(cls)
+
+    fields_converters = {}
+    required_fields = []
+
+    for f in dataclasses.fields(cls):
+        if not f.init:
+            continue
+
+        # Required fields are set to None when missing, even if they are outside of the projection
+        if (
+            f.default is dataclasses.MISSING
+            and f.default_factory is dataclasses.MISSING
+        ):
+            required_fields.append(f.name)
+
+        field_projection = None
+
+        if projection:
+            field_projection = _get_field_projection(projection, f.name)
+
+            # Fields outside of the projection are handled like unknown keys
+            if field_projection is None:
+                continue
+
+        if f.name == "sources":
+            fields_converters[f.name] = make_sources_converter(cls)
+        else:
+            fields_converters[f.name] = _make_type_converter(
+                type_hints[f.name],
+                compact,
+                lazy,
+                field_projection,
+                f.name in lazy_fields,
+            )
+
+    def converter(data: dict):
+        kwargs = dict.fromkeys(required_fields)
+
+        for key, value in data.items():
+            try:
+                field_converter = fields_converters[key]
+            except KeyError:
+                # Unknown keys, like ones coming from a more recent version, are ignored
+                continue
+
+            if field_converter is None or value is None:
+                kwargs[key] = value
+            else:
+                kwargs[key] = field_converter(value)
+
+        # LolGame.__post_init__ takes care of the backrefs
+        return cls(**kwargs)
+
+    return converter
+
+
+def _make_type_converter(
+    type_hint,
+    compact: bool,
+    lazy: Union[bool, str] = False,
+    projection: dict = None,
+    lazy_list: bool = False,
+) -> Optional[Callable[[Any], Any]]:
+    """
+    Returns a function converting a JSON value to the given type, or None if no conversion is needed
+    """
+    type_hint = unwrap_optional(type_hint)
+
+    if isinstance(type_hint, type) and dataclasses.is_dataclass(type_hint):
+        if projection:
+            return _get_projected_converter(type_hint, compact, lazy, projection)
+
+        return get_converter(type_hint, compact, lazy=lazy)
+
+    if getattr(type_hint, "__origin__", None) is list and type_hint.__args__:
+        # 'players.*.championId' and 'players.championId' both apply to all players
+        if projection and list(projection) == ["*"]:
+            projection = projection["*"]
+
+        item_converter = _make_type_converter(
+            type_hint.__args__[0], compact, lazy, projection
+        )
+
+        if item_converter is None:
+            return None
+
+        if lazy_list:
+            cache = lazy != "uncached"
+            return lambda value: LazyList(value, item_converter, cache) if value else []
+
+        return lambda value: [item_converter(item) for item in value]
+
+    return None
+
+
+def make_sources_converter(cls: type) -> Callable[[dict], EmptyDataclass]:
+    """
+    Returns a function creating the sources of the given class, with registered source dataclasses from SOURCES_CLASSES
+    """
+    sources_classes = SOURCES_CLASSES.get(cls, {})
+
+    def converter(data: dict) -> EmptyDataclass:
+        sources = EmptyDataclass()
+
+        for source_name, source_data in data.items():
+            source_class = sources_classes.get(source_name)
+
+            if source_class is not None and isinstance(source_data, dict):
+                source_data = get_converter(source_class)(source_data)
+
+            setattr(sources, source_name, source_data)
+
+        return sources
+
+    return converter
@@ -0,0 +1,378 @@
+import copy
+import operator
+import heapq
+import dataclasses
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+
+from lol_dto.classes.game import LolGame, LolGamePlayer, LolGameTeam
+
+# Fields identifying an event in each events list, on top of its timestamp
+# Two events from different sources are considered identical if those fields are equal and their timestamps are within
+#   the merge tolerance
+EVENTS_KEYS = {
+    "kills": ("killerId", "victimId"),
+    "epicMonstersKills": ("type", "subType"),
+    "buildingsKills": ("type", "lane", "side", "turretLocation"),
+    "snapshots": (),
+    "itemsEvents": ("type", "id"),
+    "wardsEvents": ("type", "wardType"),
+    "skillsLevelUpEvents": ("slot",),
+    "largeMonstersKills": ("type",),
+    "spellsUses": ("key", "id"),
+    "specialKills": ("type",),
+}
+
+TEAM_EVENTS_LISTS = ("epicMonstersKills", "buildingsKills")
+PLAYER_EVENTS_LISTS = (
+    "snapshots",
+    "itemsEvents",
+    "wardsEvents",
+    "skillsLevelUpEvents",
+    "largeMonstersKills",
+    "spellsUses",
+    "specialKills",
+)
+
+# Fields names are computed once per class
+_fields_names: Dict[type, Tuple[str, ...]] = {}
+
+# Fields referring to players ids, which need to be translated when merging players from another source
+PLAYER_ID_FIELDS = ("killerId", "victimId", "participantId")
+
+
+def merge_games(
+    *lol_games: LolGame, tolerance: float = 1.0, copy_games=True
+) -> LolGame:
+    """
+    Merges multiple LolGame objects representing the same game, coming from different sources
+
+    The first game is used as the base and the next ones are merged into it:
+        - sources are unioned
+        - fields that are None in the base game are filled from the other games, recursively
+        - players are matched through their sources identifiers, then through their championId, and other games
+            player ids are translated to the base game ids in events
+        - players that cannot be matched are added, with a new id if theirs is already used in the base game
+        - events lists are merged and deduplicated, two events being identical if their EVENTS_KEYS fields are equal
+            and their timestamps are within the tolerance
+
+    Events lists are sorted then merged linearly, so the cost is linear in the number of events for sorted inputs.
+
+    Args:
+        *lol_games: the games to merge, at least one
+        tolerance: the maximum timestamp difference in seconds for two events to be considered identical
+        copy_games: whether or not to copy games before merging, set to False to merge in place into the first game
+            and reuse the objects of the next games
+
+    Returns:
+        The merged game
+    """
+    if not lol_games:
+        raise ValueError("merge_games requires at least one game")
+
+    if copy_games:
+        lol_games = [copy.deepcopy(g) for g in lol_games]
+
+    merged_game, *other_games = lol_games
+
+    for other_game in other_games:
+        _merge_game(merged_game, other_game, tolerance)
+
+    # Backrefs need to point to the merged game
+    merged_game.__post_init__()
+
+    return merged_game
+
+
+def _merge_game(game: LolGame, other: LolGame, tolerance: float):
+    players_pairs = {}
+    ids_mapping = {}
+
+    for team, other_team in zip(game.teams, other.teams):
+        players_pairs[id(team)] = _match_players(team, other_team)
+        ids_mapping.update((o.id, p.id) for p, o in players_pairs[id(team)])
+
+    # Players that could not be matched keep their id if it is free in the base game, and get a new one otherwise
+    used_ids = {p.id for team in game.teams for p in team.players if p.id is not None}
+
+    for team, other_team in zip(game.teams, other.teams):
+        matched = {id(other_player) for _, other_player in players_pairs[id(team)]}
+
+        for other_player in other_team.players:
+            if id(other_player) in matched or other_player.id is None:
+                continue
+
+            if other_player.id in used_ids:
+                ids_mapping[other_player.id] = max(used_ids) + 1
+                other_player.id = ids_mapping[other_player.id]
+            else:
+                ids_mapping[other_player.id] = other_player.id
+
+            used_ids.add(other_player.id)
+
+    for team, other_team in zip(game.teams, other.teams):
+        for list_name in TEAM_EVENTS_LISTS:
+            for event in getattr(other_team, list_name):
+                _translate_ids(event, ids_mapping)
+
+        _merge_team(team, other_team, players_pairs[id(team)], tolerance)
+
+    for kill in other.kills:
+        _translate_ids(kill, ids_mapping)
+
+    game.kills = merge_events(game.kills, other.kills, EVENTS_KEYS["kills"], tolerance)
+
+    _fill_missing(game, other, skip=("teams", "kills"))
+
+
+def _merge_team(
+    team: LolGameTeam,
+    other: LolGameTeam,
+    players_pairs: List[Tuple[LolGamePlayer, LolGamePlayer]],
+    tolerance: float,
+):
+    matched = {id(other_player) for _, other_player in players_pairs}
+
+    # Players that could not be matched are added as-is
+    team.players.extend(p for p in other.players if id(p) not in matched)
+
+    for player, other_player in players_pairs:
+        other_player.id = player.id
+
+        for list_name in PLAYER_EVENTS_LISTS:
+            setattr(
+                player,
+                list_name,
+                merge_events(
+                    getattr(player, list_name),
+                    getattr(other_player, list_name),
+                    EVENTS_KEYS[list_name],
+                    tolerance,
+                ),
+            )
+
+        if not player.levelUpEvents:
+            player.levelUpEvents = other_player.levelUpEvents
+
+        _fill_missing(player, other_player, skip=PLAYER_EVENTS_LISTS)
+
+    for list_name in TEAM_EVENTS_LISTS:
+        setattr(
+            team,
+            list_name,
+            merge_events(
+                getattr(team, list_name),
+                getattr(other, list_name),
+                EVENTS_KEYS[list_name],
+                tolerance,
+            ),
+        )
+
+    _fill_missing(team, other, skip=("players",) + TEAM_EVENTS_LISTS)
+
+
+def merge_events(
+    events: list, other_events: list, key_fields: Tuple[str, ...], tolerance: float
+) -> list:
+    """
+    Merges two events lists, deduplicating events that have equal key fields and timestamps within the tolerance
+
+    Matched events of the first list get their None fields filled from the matching event. Both lists are sorted by
+    timestamp, which is linear for already sorted lists, then scanned once with a sliding window.
+
+    Args:
+        events: the events of the base game
+        other_events: the events of the game to merge
+        key_fields: the fields identifying an event on top of its timestamp
+        tolerance: the maximum timestamp difference in seconds for two events to be considered identical
+
+    Returns:
+        The merged events, sorted by timestamp, events without timestamp being at the end
+    """
+    if not other_events:
+        return events
+    if not events:
+        return list(other_events)
+
+    get_key = _make_key_getter(key_fields)
+
+    timed, untimed = _split_timed(events)
+    other_timed, other_untimed = _split_timed(other_events)
+
+    # Base events with a timestamp lower than current + tolerance, not matched yet, by key
+    pending: Dict[tuple, deque] = {}
+    added = []
+    i = 0
+
+    for other_event in other_timed:
+        timestamp = other_event.timestamp
+
+        while i < len(timed) and timed[i].timestamp <= timestamp + tolerance:
+            pending.setdefault(get_key(timed[i]), deque()).append(timed[i])
+            i += 1
+
+        candidates = pending.get(get_key(other_event))
+
+        # Events too old to match the current event cannot match the next ones either
+        while candidates and candidates[0].timestamp < timestamp - tolerance:
+            candidates.popleft()
+
+        if candidates:
+            _fill_missing(candidates.popleft(), other_event)
+        else:
+            added.append(other_event)
+
+    merged = list(heapq.merge(timed, added, key=lambda e: e.timestamp))
+
+    return merged + untimed + [e for e in other_untimed if e not in untimed]
+
+
+def _match_players(
+    team: LolGameTeam, other: LolGameTeam
+) -> List[Tuple[LolGamePlayer, LolGamePlayer]]:
+    """
+    Returns (player, other team player) pairs, matching players through their sources identifiers first and their
+    championId second
+    """
+    players_by_identifier = {}
+    for player in team.players:
+        for identifier in _get_identifiers(player):
+            players_by_identifier.setdefault(identifier, player)
+
+    pairs = []
+    matched = set()
+
+    for other_player in other.players:
+        player = next(
+            (
+                players_by_identifier[i]
+                for i in _get_identifiers(other_player)
+                if i in players_by_identifier
+            ),
+            None,
+        )
+
+        if player is None or id(player) in matched:
+            continue
+
+        pairs.append((player, other_player))
+        matched.add(id(player))
+        matched.add(id(other_player))
+
+    for other_player in other.players:
+        if id(other_player) in matched or other_player.championId is None:
+            continue
+
+        player = next(
+            (
+                p
+                for p in team.players
+                if p.championId == other_player.championId and id(p) not in matched
+            ),
+            None,
+        )
+
+        if player is not None:
+            pairs.append((player, other_player))
+            matched.add(id(player))
+
+    return pairs
+
+
+def _get_identifiers(player: LolGamePlayer) -> List[tuple]:
+    """
+    Returns (source name, field, value) tuples from the player sources, like ('riotLolApi', 'puuid', '...')
+    """
+    identifiers = []
+
+    for source_name, source in vars(player.sources).items():
+        values = source if isinstance(source, dict) else vars(source)
+
+        identifiers.extend(
+            (source_name, field_name, value)
+            for field_name, value in values.items()
+            if value is not None and field_name != "platformId"
+        )
+
+    return identifiers
+
+
+def _translate_ids(obj, ids_mapping: Dict[int, int]):
+    """
+    Translates players ids of an event coming from another source, including its damage instances
+    """
+    for name in PLAYER_ID_FIELDS:
+        value = getattr(obj, name, None)
+        if value is not None:
+            setattr(obj, name, ids_mapping.get(value, value))
+
+    assists_ids = getattr(obj, "assistsIds", None)
+    if assists_ids:
+        obj.assistsIds = [ids_mapping.get(i, i) for i in assists_ids]
+
+    for name in "victimDamageDealt", "victimDamageReceived":
+        for damage_instance in getattr(obj, name, None) or ():
+            _translate_ids(damage_instance, ids_mapping)
+
+
+def _fill_missing(obj, other, skip: Tuple[str, ...] = ()):
+    """
+    Fills the None fields and empty lists of a dataclass with the values of another one, recursively
+    """
+    fields_names = _get_fields_names(type(obj))
+
+    if not fields_names:
+        # Sources are EmptyDataclass objects with attributes added through setattr()
+        for name, other_source in vars(other).items():
+            source = getattr(obj, name, None)
+
+            if source is None:
+                setattr(obj, name, other_source)
+            elif hasattr(source, "__dataclass_fields__") and hasattr(
+                other_source, "__dataclass_fields__"
+            ):
+                _fill_missing(source, other_source)
+        return
+
+    for name in fields_names:
+        if name in skip:
+            continue
+
+        other_value = getattr(other, name, None)
+        if other_value is None:
+            continue
+
+        value = getattr(obj, name)
+
+        if value is None or (type(value) is list and not value):
+            setattr(obj, name, other_value)
+        elif hasattr(value, "__dataclass_fields__") and hasattr(
+            other_value, "__dataclass_fields__"
+        ):
+            _fill_missing(value, other_value)
+
+
+def _get_fields_names(cls: type) -> Tuple[str, ...]:
+    try:
+        return _fields_names[cls]
+    except KeyError:
+        fields_names = _fields_names[cls] = tuple(
+            f.name for f in dataclasses.fields(cls)
+        )
+        return fields_names
+
+
+def _make_key_getter(key_fields: Tuple[str, ...]) -> Callable[[object], tuple]:
+    if not key_fields:
+        return lambda event: ()
+
+    return operator.attrgetter(*key_fields)
+
+
+def _split_timed(events: list) -> Tuple[list, list]:
+    timed = sorted(
+        (e for e in events if e.timestamp is not None), key=lambda e: e.timestamp
+    )
+    untimed = [e for e in events if e.timestamp is None]
+
+    return timed, untimed
@@ -0,0 +1,344 @@
+import zlib
+import typing
+import dataclasses
+from typing import Dict, List, Tuple, Type, Union
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities.class_tree import get_dataclasses, unwrap_optional
+from lol_dto.utilities.dump_json import to_dict
+from lol_dto.utilities.load_json import SOURCES_CLASSES, from_dict
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# First element of every encoded game, followed by the format version
+MAGIC = "lol_dto"
+FORMAT_VERSION = 2
+
+# Snapshots fields that can be delta-encoded, as they mostly grow by small steps
+DELTA_FIELDS = ("timestamp", "totalGold", "currentGold", "xp")
+
+# Float values are delta-encoded as integer milliseconds if they have no more precision than that
+FLOAT_DELTA_SCALE = 1000
+
+# Key tables and keys plans are computed once per class and registered sources
+_key_tables: Dict[tuple, Tuple[List[str], int]] = {}
+_plans: Dict[tuple, "KeysPlan"] = {}
+
+# Keys of a map as (key table ids, plans of the values holding dataclasses), by key
+KeysPlan = Tuple[Dict[str, int], Dict[str, "KeysPlan"]]
+
+
+def to_msgpack(
+    lol_game: Union[LolGame, dataclasses.dataclass], delta: bool = False
+) -> bytes:
+    """
+    Encodes the given LolGame to MessagePack, with fields names replaced by small integers
+
+    Fields names are numbered through a key table derived from the LolGame schema, see get_key_table, so they are never
+    repeated in the output. Only the keys of dataclasses and sources are replaced, and free-form dictionaries, like
+    unregistered sources, are kept as-is. The output starts with a checksum of the key table, which is checked when
+    loading.
+
+    None fields are always removed, like with dump_json(remove_empty=True).
+
+    Args:
+        lol_game: the LolGame object to encode or a similar dataclass
+        delta: whether or not to delta-encode snapshots timestamps, gold, and xp, which makes them smaller integers
+
+    Returns:
+        The encoded game
+
+    """
+    _check_msgpack()
+
+    _, crc = get_key_table(type(lol_game))
+    plan = _get_plan(type(lol_game))
+
+    data = to_dict(lol_game)
+
+    if delta:
+        for player in _iter_players(data):
+            _delta_encode(player)
+
+    return msgpack.packb(
+        [MAGIC, FORMAT_VERSION, crc, delta, _intern(data, plan)], use_bin_type=True
+    )
+
+
+def from_msgpack(data: bytes, cls: Type = LolGame, compact: bool = False):
+    """
+    Decodes a LolGame from MessagePack created with to_msgpack
+
+    Args:
+        data: the encoded game
+        cls: the dataclass to load, LolGame by default
+        compact: whether or not to use the compact classes from lol_dto.classes.game.compact for snapshots and events
+
+    Returns:
+        The LolGame object, with all its children and backrefs
+
+    """
+    _check_msgpack()
+
+    names, crc = get_key_table(cls)
+
+    magic, version, data_crc, delta, output_dict = msgpack.unpackb(
+        data, raw=False, strict_map_key=False
+    )
+
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"Not a lol_dto MessagePack game: {magic} {version}")
+
+    if data_crc != crc:
+        raise ValueError(
+            "The game was encoded with a different key table, which happens when classes or registered sources differ"
+        )
+
+    output_dict = _restore(output_dict, _get_plan(cls), names)
+
+    if delta:
+        for player in _iter_players(output_dict):
+            _delta_decode(player)
+
+    return from_dict(output_dict, cls, compact)
+
+
+def dump_msgpack(
+    lol_game: Union[LolGame, dataclasses.dataclass], filename: str, delta: bool = False
+):
+    """
+    Dumps the given LolGame to a local file in MessagePack format, see to_msgpack
+
+    Args:
+        lol_game: the LolGame object to dump or a similar dataclass
+        filename: the file to dump to
+        delta: whether or not to delta-encode snapshots timestamps, gold, and xp
+
+    Returns:
+        Nothing
+
+    """
+    output = to_msgpack(lol_game, delta)
+
+    with open(filename, "wb") as file:
+        file.write(output)
+
+
+def load_msgpack(filename: str, cls: Type = LolGame, compact: bool = False):
+    """
+    Loads a LolGame from a local MessagePack file created with dump_msgpack, see from_msgpack
+
+    Args:
+        filename: the file to load from
+        cls: the dataclass to load, LolGame by default
+        compact: whether or not to use the compact classes from lol_dto.classes.game.compact for snapshots and events
+
+    Returns:
+        The LolGame object, with all its children and backrefs
+
+    """
+    with open(filename, "rb") as file:
+        return from_msgpack(file.read(), cls, compact)
+
+
+def get_key_table(cls: type = LolGame) -> Tuple[List[str], int]:
+    """
+    Returns the sorted names of all fields of the class and its children, with their CRC32
+
+    Sources names and fields from SOURCES_CLASSES are included, so registering a source changes the table.
+    """
+    key = cls, _get_sources_key()
+
+    try:
+        return _key_tables[key]
+    except KeyError:
+        pass
+
+    names = set()
+    classes = [cls]
+    seen = set()
+
+    while classes:
+        current = classes.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+
+        for source_name, source_class in SOURCES_CLASSES.get(current, {}).items():
+            names.add(source_name)
+            classes.append(source_class)
+
+        for name, type_hint in typing.get_type_hints(current).items():
+            names.add(name)
+            classes.extend(get_dataclasses(type_hint))
+
+    table = sorted(names)
+    _key_tables[key] = table, zlib.crc32("\n".join(table).encode())
+
+    return _key_tables[key]
+
+
+def _get_plan(cls: type) -> KeysPlan:
+    key = cls, _get_sources_key()
+
+    try:
+        return _plans[key]
+    except KeyError:
+        pass
+
+    names, _ = get_key_table(cls)
+    key_ids = {name: i for i, name in enumerate(names)}
+
+    plan = _plans[key] = _make_plan(cls, key_ids)
+    return plan
+
+
+def _make_plan(cls: type, key_ids: Dict[str, int]) -> KeysPlan:
+    children = {}
+
+    for name, type_hint in typing.get_type_hints(cls).items():
+        if name == "sources":
+            # Sources names are interned, but only registered sources have known fields
+            children[name] = key_ids, {
+                source_name: _make_plan(source_class, key_ids)
+                for source_name, source_class in SOURCES_CLASSES.get(cls, {}).items()
+            }
+            continue
+
+        type_hint = unwrap_optional(type_hint)
+        if getattr(type_hint, "__origin__", None) is list and type_hint.__args__:
+            type_hint = unwrap_optional(type_hint.__args__[0])
+
+        if dataclasses.is_dataclass(type_hint) and isinstance(type_hint, type):
+            children[name] = _make_plan(type_hint, key_ids)
+
+    return key_ids, children
+
+
+def _intern(obj: dict, plan: KeysPlan) -> dict:
+    """
+    Replaces the keys of a dataclass dictionary by their id in the key table, following the plan for its children
+    """
+    key_ids, children = plan
+    output = {}
+
+    for key, value in obj.items():
+        child_plan = children.get(key)
+
+        if child_plan is not None:
+            if value.__class__ is dict:
+                value = _intern(value, child_plan)
+            elif value.__class__ is list:
+                value = [
+                    _intern(v, child_plan) if v.__class__ is dict else v for v in value
+                ]
+
+        output[key_ids.get(key, key)] = value
+
+    return output
+
+
+def _restore(obj: dict, plan: KeysPlan, names: List[str]) -> dict:
+    """
+    Replaces the keys ids of a dictionary created by _intern by their name, following the plan for its children
+    """
+    _, children = plan
+    output = {}
+
+    for key, value in obj.items():
+        if key.__class__ is int:
+            key = names[key]
+
+        child_plan = children.get(key)
+
+        if child_plan is not None:
+            if value.__class__ is dict:
+                value = _restore(value, child_plan, names)
+            elif value.__class__ is list:
+                value = [
+                    _restore(v, child_plan, names) if v.__class__ is dict else v
+                    for v in value
+                ]
+
+        output[key] = value
+
+    return output
+
+
+def _get_sources_key() -> tuple:
+    return tuple((c, tuple(s.items())) for c, s in SOURCES_CLASSES.items())
+
+
+def _iter_players(data: dict):
+    for team in (data.get("teams") or {}).values():
+        yield from team.get("players") or ()
+
+
+def _delta_encode(player: dict):
+    """
+    Replaces snapshots fields values by their difference with the previous snapshot, and stores the encoded fields with
+    their scale in the player '_deltas' key
+    """
+    snapshots = player.get("snapshots")
+    if not snapshots:
+        return
+
+    deltas = {}
+
+    for name in DELTA_FIELDS:
+        values = [s.get(name) for s in snapshots]
+        scale = _get_delta_scale(values)
+
+        if scale is None:
+            continue
+
+        previous = 0
+        for snapshot, value in zip(snapshots, values):
+            value = round(value * scale)
+            snapshot[name] = value - previous
+            previous = value
+
+        deltas[name] = scale
+
+    if deltas:
+        player["_deltas"] = deltas
+
+
+def _delta_decode(player: dict):
+    deltas = player.pop("_deltas", None)
+    if not deltas:
+        return
+
+    for name, scale in deltas.items():
+        total = 0
+
+        for snapshot in player["snapshots"]:
+            total += snapshot[name]
+            snapshot[name] = total if scale == 1 else total / scale
+
+
+def _get_delta_scale(values: list):
+    """
+    Returns 1 for integer values, FLOAT_DELTA_SCALE for floats that can be encoded exactly, and None otherwise
+    """
+    if all(v.__class__ is int for v in values):
+        return 1
+
+    if all(
+        v.__class__ in (int, float)
+        and round(v * FLOAT_DELTA_SCALE) / FLOAT_DELTA_SCALE == v
+        for v in values
+    ):
+        return FLOAT_DELTA_SCALE
+
+    return None
+
+
+def _check_msgpack():
+    if msgpack is None:
+        raise ImportError(
+            "MessagePack encoding requires the msgpack package: pip install lol_dto[msgpack]"
+        )
@@ -0,0 +1,419 @@
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from lol_dto.classes.game import LolGame, LolGamePlayer
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Number of items events between two inventory checkpoints, which is the longest replay of a state_at() query
+CHECKPOINT_INTERVAL = 16
+
+# Skill slots, from 1 to 4
+SKILL_SLOTS = (1, 2, 3, 4)
+
+# Items events types adding or removing an item from the inventory
+ADDING_ITEM_TYPES = ("PURCHASED", "PICKED_UP")
+REMOVING_ITEM_TYPES = ("SOLD", "DESTROYED")
+# Items events types that can be reverted by an UNDO
+UNDOABLE_ITEM_TYPES = ("PURCHASED", "SOLD")
+# Items events types kept to replay UNDO events, destroyed components being restored with the purchase they built
+UNDO_HISTORY_TYPES = UNDOABLE_ITEM_TYPES + ("DESTROYED",)
+
+
+@dataclass
+class PlayerState:
+    """
+    The state of a player at a given timestamp, reconstructed from its events
+    """
+
+    timestamp: float
+
+    # None if the player has neither levelUpEvents nor snapshots before the timestamp
+    level: Optional[int] = None
+
+    # Items ids in the inventory, in acquisition order
+    items: List[int] = field(default_factory=list)
+
+    # Skill slot -> number of NORMAL skill level ups, for slots 1 to 4
+    skillsLevels: Dict[int, int] = field(default_factory=dict)
+    # Skill slots that got an EVOLVE point
+    evolvedSlots: List[int] = field(default_factory=list)
+
+
+class _Inventory:
+    """
+    Replays items events
+
+    UNDO events revert the latest PURCHASED or SOLD event matching them that was not undone yet, like Riot's
+    ITEM_UNDO events: beforeUndoId is the item the undone event added, so a purchase, and id is the item it removed, so
+    a sale. Components DESTROYED with the same timestamp as an undone purchase, as they built the item, are restored.
+    UNDO events without any id revert the latest PURCHASED or SOLD event, and UNDO events without a matching event are
+    ignored.
+    """
+
+    __slots__ = ("items", "history")
+
+    def __init__(self, checkpoint: tuple = ((), None)):
+        items, self.history = checkpoint
+        self.items = list(items)
+
+    def checkpoint(self) -> tuple:
+        # The history is a linked list of ((type, id, timestamp), next) tuples, so checkpoints share it instead of
+        #   copying it
+        return tuple(self.items), self.history
+
+    def apply(self, event):
+        if event.type in UNDO_HISTORY_TYPES:
+            self.history = (event.type, event.id, event.timestamp), self.history
+
+        if event.type in ADDING_ITEM_TYPES:
+            self.items.append(event.id)
+        elif event.type in REMOVING_ITEM_TYPES:
+            _remove_last(self.items, event.id)
+        elif event.type == "UNDO":
+            self._undo(event.beforeUndoId or None, event.id or None)
+
+    def _undo(self, added_id: Optional[int], removed_id: Optional[int]):
+        # History entries newer than the undone event, which stay in the history
+        newer = []
+        node = self.history
+
+        while node is not None:
+            entry, node = node
+            if _is_undone_by(entry, added_id, removed_id):
+                break
+            newer.append(entry)
+        else:
+            return
+
+        event_type, item_id, timestamp = entry
+
+        if event_type == "SOLD":
+            self.items.append(item_id)
+        else:
+            _remove_last(self.items, item_id)
+
+            # Components destroyed to build the item share its timestamp, and are listed before or after the purchase
+            kept = []
+            for newer_entry in newer:
+                if newer_entry[0] == "DESTROYED" and newer_entry[2] == timestamp:
+                    self.items.append(newer_entry[1])
+                else:
+                    kept.append(newer_entry)
+            newer = kept
+
+            while (
+                node is not None
+                and node[0][0] == "DESTROYED"
+                and node[0][2] == timestamp
+            ):
+                self.items.append(node[0][1])
+                node = node[1]
+
+        for newer_entry in reversed(newer):
+            node = newer_entry, node
+
+        self.history = node
+
+
+class PlayerStateIndex:
+    """
+    Reconstructs the inventory, skill levels, and level of a player at any timestamp
+
+    Items events are sorted once and the inventory is saved every CHECKPOINT_INTERVAL events, so a query is a bisect
+    and the replay of at most CHECKPOINT_INTERVAL - 1 events. Skill levels are cumulated for every skill level up, and
+    levels come from levelUpEvents, or from snapshots for sources without level up events.
+
+    Events without timestamp are ignored. Events sharing a timestamp are applied in their list order.
+
+    It is built lazily and cached by LolGamePlayer.state_at(), and rebuilt when an events list is replaced or changes
+    length. Changing an event in place requires calling LolGamePlayer.invalidate_state_index().
+    """
+
+    def __init__(
+        self, player: LolGamePlayer, checkpoint_interval: int = CHECKPOINT_INTERVAL
+    ):
+        self.fingerprint = self.get_fingerprint(player)
+        self.checkpoint_interval = checkpoint_interval
+
+        self.items_events = _sorted_events(player.itemsEvents)
+        self.items_timestamps = [e.timestamp for e in self.items_events]
+
+        inventory = _Inventory()
+        self.checkpoints = []
+
+        for index, event in enumerate(self.items_events):
+            if index % checkpoint_interval == 0:
+                self.checkpoints.append(inventory.checkpoint())
+            inventory.apply(event)
+
+        # Skill levels after each skill level up event, as (levels by slot, evolved slots)
+        skills_events = _sorted_events(player.skillsLevelUpEvents)
+        self.skills_timestamps = [e.timestamp for e in skills_events]
+        self.skills_states: List[Tuple[Tuple[int, ...], Tuple[int, ...]]] = []
+
+        levels, evolved = [0] * len(SKILL_SLOTS), ()
+
+        for event in skills_events:
+            if event.slot in SKILL_SLOTS:
+                if event.type == "EVOLVE":
+                    if event.slot not in evolved:
+                        evolved += (event.slot,)
+                else:
+                    levels[event.slot - 1] += 1
+
+            self.skills_states.append((tuple(levels), evolved))
+
+        # Players start at level 1, but it is only known before the first snapshot if the source has level up events
+        self.starts_at_level_1 = bool(player.levelUpEvents)
+
+        if player.levelUpEvents:
+            # Each level up event adds one level to the starting level of 1
+            self.levels_timestamps = sorted(player.levelUpEvents)
+            self.levels = list(range(2, len(self.levels_timestamps) + 2))
+        else:
+            snapshots = [
+                s
+                for s in _sorted_events(player.snapshots)
+                if getattr(s, "level", None) is not None
+            ]
+            self.levels_timestamps = [s.timestamp for s in snapshots]
+            self.levels = [s.level for s in snapshots]
+
+    def items_at(self, timestamp: float) -> List[int]:
+        """
+        Returns the items ids in the inventory after all events with a timestamp lower or equal to the given one
+        """
+        count = bisect_right(self.items_timestamps, timestamp)
+
+        if count == 0:
+            return []
+
+        checkpoint_index = (count - 1) // self.checkpoint_interval
+        inventory = _Inventory(self.checkpoints[checkpoint_index])
+
+        for event in self.items_events[
+            checkpoint_index * self.checkpoint_interval : count
+        ]:
+            inventory.apply(event)
+
+        return inventory.items
+
+    def skills_at(self, timestamp: float) -> Tuple[Dict[int, int], List[int]]:
+        """
+        Returns the skill levels by slot and the evolved slots at the given timestamp
+        """
+        count = bisect_right(self.skills_timestamps, timestamp)
+
+        if count == 0:
+            return {slot: 0 for slot in SKILL_SLOTS}, []
+
+        levels, evolved = self.skills_states[count - 1]
+
+        return dict(zip(SKILL_SLOTS, levels)), list(evolved)
+
+    def level_at(self, timestamp: float) -> Optional[int]:
+        """
+        Returns the level of the player at the given timestamp, None if it is unknown
+        """
+        count = bisect_right(self.levels_timestamps, timestamp)
+
+        if count == 0:
+            return 1 if self.starts_at_level_1 else None
+
+        return self.levels[count - 1]
+
+    def state_at(self, timestamp: float) -> PlayerState:
+        """
+        Returns the state of the player after all events with a timestamp lower or equal to the given one
+        """
+        skills_levels, evolved_slots = self.skills_at(timestamp)
+
+        return PlayerState(
+            timestamp=timestamp,
+            level=self.level_at(timestamp),
+            items=self.items_at(timestamp),
+            skillsLevels=skills_levels,
+            evolvedSlots=evolved_slots,
+        )
+
+    @staticmethod
+    def get_fingerprint(player: LolGamePlayer) -> Tuple[list, Tuple[int, ...]]:
+        """
+        Returns the lists used by the index with their lengths, used to know if the index needs to be rebuilt
+        """
+        lists = [
+            player.itemsEvents,
+            player.skillsLevelUpEvents,
+            player.snapshots,
+            player.levelUpEvents,
+        ]
+
+        return lists, tuple(len(lst) for lst in lists)
+
+    def is_up_to_date(self, player: LolGamePlayer) -> bool:
+        """
+        Returns True if no list used by the index was replaced or changed length since the index was built
+        """
+        lists, lengths = self.get_fingerprint(player)
+        indexed_lists, indexed_lengths = self.fingerprint
+
+        return lengths == indexed_lengths and all(
+            a is b for a, b in zip(lists, indexed_lists)
+        )
+
+
+@dataclass
+class SampledPlayersStates:
+    """
+    States of all players of a game sampled at fixed timestamps, as NumPy arrays
+    """
+
+    # Sampled timestamps, shape (timestamps,)
+    timestamp: "numpy.ndarray"
+    # Players ids, in teams.BLUE then teams.RED order, shape (players,)
+    playerId: "numpy.ndarray"
+    # Levels as floats, NaN when unknown, shape (players, timestamps)
+    level: "numpy.ndarray"
+    # NORMAL skill level ups by slot, shape (players, timestamps, 4)
+    skillsLevels: "numpy.ndarray"
+    # Items ids in acquisition order, padded with 0, shape (players, timestamps, max items)
+    items: "numpy.ndarray"
+
+
+def sample_players_states(
+    lol_game: LolGame, interval: float = 60, start: float = 0, end: float = None
+) -> SampledPlayersStates:
+    """
+    Samples the state of all players of the game every interval seconds, see PlayerStateIndex
+
+    Events of each player are replayed once, and the state of all sampled timestamps is then read with a single
+    numpy.searchsorted per player and state.
+
+    Args:
+        lol_game: the LolGame to sample
+        interval: the time between two samples, in seconds
+        start: the first sampled timestamp, in seconds
+        end: the last possible sampled timestamp, included, the game duration by default
+
+    Returns:
+        A SampledPlayersStates with numpy arrays
+    """
+    _check_numpy()
+
+    if end is None:
+        end = lol_game.duration if lol_game.duration is not None else start
+
+    timestamps = numpy.arange(start, end + interval / 2, interval, dtype="f8")
+    timestamps = timestamps[timestamps <= end]
+
+    players = [player for team in lol_game.teams for player in team.players]
+
+    levels = numpy.full((len(players), len(timestamps)), numpy.nan)
+    skills = numpy.zeros((len(players), len(timestamps), len(SKILL_SLOTS)), "i8")
+    players_items = []
+
+    for row, player in enumerate(players):
+        index = get_state_index(player)
+
+        level_count = numpy.searchsorted(
+            index.levels_timestamps, timestamps, side="right"
+        )
+        known_levels = numpy.array(
+            [1 if index.starts_at_level_1 else numpy.nan, *index.levels], "f8"
+        )
+        levels[row] = known_levels[level_count]
+
+        if index.skills_states:
+            skills_states = numpy.array(
+                [[0] * len(SKILL_SLOTS)] + [s[0] for s in index.skills_states], "i8"
+            )
+            skills[row] = skills_states[
+                numpy.searchsorted(index.skills_timestamps, timestamps, side="right")
+            ]
+
+        # Inventories after each event, the first one being the empty inventory before any event
+        inventory = _Inventory()
+        inventories = [()]
+        for event in index.items_events:
+            inventory.apply(event)
+            inventories.append(tuple(inventory.items))
+
+        players_items.append(
+            (
+                inventories,
+                numpy.searchsorted(index.items_timestamps, timestamps, side="right"),
+            )
+        )
+
+    max_items = max(
+        (len(inv) for inventories, _ in players_items for inv in inventories),
+        default=0,
+    )
+    items = numpy.zeros((len(players), len(timestamps), max_items), "i8")
+
+    for row, (inventories, count) in enumerate(players_items):
+        padded = numpy.zeros((len(inventories), max_items), "i8")
+        for i, inventory in enumerate(inventories):
+            padded[i, : len(inventory)] = [0 if x is None else x for x in inventory]
+
+        items[row] = padded[count]
+
+    return SampledPlayersStates(
+        timestamp=timestamps,
+        playerId=numpy.array(
+            [numpy.nan if p.id is None else p.id for p in players], "f8"
+        ),
+        level=levels,
+        skillsLevels=skills,
+        items=items,
+    )
+
+
+def get_state_index(player: LolGamePlayer) -> PlayerStateIndex:
+    """
+    Returns the cached state index of the player, building it if it does not exist or is out of date
+    """
+    index = player.__dict__.get("_state_index")
+
+    if index is None or not index.is_up_to_date(player):
+        index = player.__dict__["_state_index"] = PlayerStateIndex(player)
+
+    return index
+
+
+def _is_undone_by(entry: tuple, added_id: Optional[int], removed_id: Optional[int]):
+    event_type, item_id, _ = entry
+
+    if added_id is None and removed_id is None:
+        return event_type in UNDOABLE_ITEM_TYPES
+
+    return (event_type == "PURCHASED" and item_id == added_id) or (
+        event_type == "SOLD" and item_id == removed_id
+    )
+
+
+def _remove_last(items: List[int], item_id: int):
+    # The latest copy of an item is the one a sale or an undo refers to
+    for index in range(len(items) - 1, -1, -1):
+        if items[index] == item_id:
+            del items[index]
+            return
+
+
+def _sorted_events(events) -> list:
+    # Python's sort is stable, so events sharing a timestamp keep their list order
+    return sorted(
+        (e for e in events if e.timestamp is not None), key=lambda e: e.timestamp
+    )
+
+
+def _check_numpy():
+    if numpy is None:
+        raise ImportError(
+            "Sampling players states requires the numpy package: pip install lol_dto[numpy]"
+        )
@@ -0,0 +1,357 @@
+import math
+import typing
+from typing import Iterable, List
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGamePlayer,
+    LolGamePlayerSnapshot,
+    LolGamePlayerSnapshotChampionStats,
+    LolGamePlayerSnapshotDamageStats,
+    Position,
+)
+from lol_dto.utilities.timeline import (
+    CHAMPION_STATS_FIELDS,
+    DAMAGE_STATS_FIELDS,
+    SNAPSHOT_FIELDS,
+    TIMELINE_FIELDS,
+    _check_numpy,
+    snapshots_array,
+    timeline_arrays,
+)
+
+try:
+    import numpy
+    from numpy.lib.recfunctions import (
+        structured_to_unstructured,
+        unstructured_to_structured,
+    )
+except ImportError:
+    numpy = None
+
+# Fields keeping the value of the last snapshot, as interpolating them makes no sense
+CARRIED_FIELDS = (
+    "level",
+    "isAlive",
+    "spell1Available",
+    "spell2Available",
+    "ultimateAvailable",
+)
+
+# Fields linearly interpolated between the snapshots surrounding the sampled timestamp
+INTERPOLATED_FIELDS = tuple(
+    name for name in TIMELINE_FIELDS if name not in CARRIED_FIELDS + ("timestamp",)
+)
+
+# Field types, used to round values when creating snapshot objects
+SNAPSHOT_TYPES = typing.get_type_hints(LolGamePlayerSnapshot)
+CHAMPION_STATS_TYPES = typing.get_type_hints(LolGamePlayerSnapshotChampionStats)
+DAMAGE_STATS_TYPES = typing.get_type_hints(LolGamePlayerSnapshotDamageStats)
+
+
+def resample(
+    array: "numpy.ndarray",
+    interval: float = 60,
+    start: float = 0,
+    end: float = None,
+    timestamps: "numpy.ndarray" = None,
+) -> "numpy.ndarray":
+    """
+    Resamples a structured array of snapshots at fixed timestamps
+
+    The array can be any array with the timeline fields and time as its last axis, like the output of
+    snapshots_array(), timeline_arrays(), or resample_games(). Each row has its own timestamps, which do not need to be
+    aligned, and all rows are resampled at once with vectorized operations.
+
+    Fields in CARRIED_FIELDS, like level and isAlive, take the value of the last snapshot with a value at or before the
+    sampled timestamp. Other fields, like gold, xp, cs, and positions, are linearly interpolated between the surrounding
+    snapshots with a value, and are NaN after the last one. Fields that are not timeline fields, like 'playerId', are
+    copied from the first column.
+
+    Args:
+        array: the structured array to resample, of shape (..., snapshots)
+        interval: the time between two samples, in seconds
+        start: the first sampled timestamp, in seconds
+        end: the last possible sampled timestamp, included, the last snapshot timestamp by default
+        timestamps: the sampled timestamps, overriding interval, start, and end
+
+    Returns:
+        A structured array with the same fields, of shape (..., timestamps)
+    """
+    _check_numpy()
+
+    # The number of rows is given explicitly, as -1 cannot be inferred for arrays without snapshots
+    flat = array.reshape(int(numpy.prod(array.shape[:-1])), array.shape[-1])
+    rows, columns = flat.shape
+    source_timestamps = flat["timestamp"]
+
+    if timestamps is None:
+        if end is None:
+            end = numpy.nanmax(source_timestamps) if source_timestamps.size else start
+        timestamps = numpy.arange(start, end + interval / 2, interval, dtype="f8")
+        timestamps = timestamps[timestamps <= end]
+    else:
+        timestamps = numpy.asarray(timestamps, dtype="f8")
+
+    shape = array.shape[:-1] + (len(timestamps),)
+
+    if rows == 0 or columns == 0 or len(timestamps) == 0:
+        result = numpy.full(shape, numpy.nan, dtype=array.dtype)
+        result["timestamp"] = timestamps
+        return result
+
+    # All fields are processed at once as a contiguous (rows, columns, fields) float array, as operations on strided
+    #   fields of a structured array are several times slower
+    names = array.dtype.names
+    values = structured_to_unstructured(flat, dtype="f8")
+    carried = numpy.array([n in CARRIED_FIELDS for n in names])
+    constant = numpy.array([n not in TIMELINE_FIELDS for n in names])
+
+    values = _fill_missing_values(values, source_timestamps, carried)
+
+    # Index of the last snapshot at or before each sampled timestamp, -1 if there is none, and of the next one
+    last = _count_lower_or_equal(source_timestamps, timestamps) - 1
+    has_last = last >= 0
+    last = numpy.maximum(last, 0)
+    following = numpy.minimum(last + 1, columns - 1)
+
+    row_index = numpy.arange(rows)[:, None]
+    left_timestamps = source_timestamps[row_index, last]
+    right_timestamps = source_timestamps[row_index, following]
+
+    # Sampled timestamps after the last snapshot of their row get a NaN ratio
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        ratio = numpy.where(
+            left_timestamps == timestamps,
+            0,
+            (timestamps - left_timestamps) / (right_timestamps - left_timestamps),
+        )[:, :, None]
+
+    left_values = values[row_index, last]
+    right_values = values[row_index, following]
+
+    with numpy.errstate(invalid="ignore"):
+        resampled = numpy.where(
+            carried | (ratio == 0),
+            left_values,
+            left_values + ratio * (right_values - left_values),
+        )
+
+    resampled[~has_last] = numpy.nan
+    resampled[:, :, constant] = values[:, :1, constant]
+    resampled[:, :, names.index("timestamp")] = timestamps
+
+    return unstructured_to_structured(resampled, dtype=array.dtype).reshape(shape)
+
+
+def resample_player(
+    player: LolGamePlayer, interval: float = 60, start: float = 0, end: float = None
+) -> "numpy.ndarray":
+    """
+    Returns the snapshots of the player resampled every interval seconds, see resample()
+    """
+    return resample(snapshots_array(player), interval, start, end)
+
+
+def resample_game(
+    lol_game: LolGame, interval: float = 60, start: float = 0, end: float = None
+) -> "numpy.ndarray":
+    """
+    Returns the snapshots of all players of the game resampled every interval seconds, of shape (players, timestamps),
+    see resample()
+    """
+    return resample(timeline_arrays(lol_game), interval, start, end)
+
+
+def resample_games(
+    lol_games: Iterable[LolGame],
+    interval: float = 60,
+    start: float = 0,
+    end: float = None,
+) -> "numpy.ndarray":
+    """
+    Returns the snapshots of all players of a batch of games resampled at the same timestamps, see resample()
+
+    Games are stacked in a single array of shape (games, players, timestamps), and are padded with NaN rows if they
+    have fewer players than others, and with NaN columns after their last snapshot.
+
+    Args:
+        lol_games: the games to resample
+        interval: the time between two samples, in seconds
+        start: the first sampled timestamp, in seconds
+        end: the last possible sampled timestamp, included, the last snapshot timestamp of all games by default
+
+    Returns:
+        A structured array of shape (games, players, timestamps)
+    """
+    _check_numpy()
+
+    arrays = [timeline_arrays(lol_game) for lol_game in lol_games]
+
+    # Timelines are stacked with NaN padding, which sorts after the timestamps of each row, and resampled at once
+    players = max((a.shape[0] for a in arrays), default=0)
+    columns = max((a.shape[1] for a in arrays), default=0)
+    dtype = arrays[0].dtype if arrays else timeline_arrays(LolGame()).dtype
+
+    stacked = numpy.full((len(arrays), players, columns), numpy.nan, dtype)
+
+    for game_array, array in zip(stacked, arrays):
+        game_array[: array.shape[0], : array.shape[1]] = array
+
+    return resample(stacked, interval, start, end)
+
+
+def to_snapshots(array: "numpy.ndarray") -> List[LolGamePlayerSnapshot]:
+    """
+    Transforms a one-dimensional structured array of snapshots, like a row of resample_game(), to snapshot objects
+
+    NaN values become None, and values of int and bool fields are rounded to the nearest integer.
+    """
+    _check_numpy()
+
+    snapshots = []
+
+    for row in array.tolist():
+        values = dict(zip(array.dtype.names, row))
+
+        snapshot = LolGamePlayerSnapshot(
+            **{
+                name: _convert(values[name], SNAPSHOT_TYPES[name])
+                for name in SNAPSHOT_FIELDS
+            }
+        )
+
+        if not math.isnan(values["positionX"]) and not math.isnan(values["positionY"]):
+            snapshot.position = Position(
+                x=_convert(values["positionX"], int),
+                y=_convert(values["positionY"], int),
+            )
+
+        snapshot.championStats = LolGamePlayerSnapshotChampionStats(
+            **{
+                name: _convert(values[name], CHAMPION_STATS_TYPES[name])
+                for name in CHAMPION_STATS_FIELDS
+            }
+        )
+        snapshot.damageStats = LolGamePlayerSnapshotDamageStats(
+            **{
+                name: _convert(values[name], DAMAGE_STATS_TYPES[name])
+                for name in DAMAGE_STATS_FIELDS
+            }
+        )
+
+        snapshots.append(snapshot)
+
+    return snapshots
+
+
+def resample_snapshots(
+    player: LolGamePlayer, interval: float = 60, start: float = 0, end: float = None
+) -> List[LolGamePlayerSnapshot]:
+    """
+    Returns the snapshots of the player resampled every interval seconds as snapshot objects, see resample()
+    """
+    return to_snapshots(resample_player(player, interval, start, end))
+
+
+def _fill_missing_values(
+    values: "numpy.ndarray",
+    source_timestamps: "numpy.ndarray",
+    carried: "numpy.ndarray",
+) -> "numpy.ndarray":
+    """
+    Fills NaN values of the (rows, columns, fields) array that have a value before them in their row
+
+    Carried fields take the last value, and other fields are interpolated between the surrounding values, or stay NaN
+    after the last value. As interpolation is piecewise linear, interpolating between filled values gives the same
+    result as interpolating between the original values, so resampling can use the surrounding snapshots directly.
+    """
+    missing = numpy.isnan(values) & ~numpy.isnan(source_timestamps)[:, :, None]
+    valid = ~numpy.isnan(values)
+
+    # Only fields with both missing and valid values in a row need to be filled
+    fields = (missing.any(axis=1) & valid.any(axis=1)).any(axis=0)
+
+    if not fields.any():
+        return values
+
+    subset = values[:, :, fields]
+    valid = valid[:, :, fields]
+    rows, columns, _ = subset.shape
+    positions = numpy.arange(columns)[None, :, None]
+    row_index = numpy.arange(rows)[:, None, None]
+
+    previous = numpy.maximum.accumulate(numpy.where(valid, positions, -1), axis=1)
+    following = numpy.minimum.accumulate(
+        numpy.where(valid, positions, columns)[:, ::-1], axis=1
+    )[:, ::-1]
+
+    has_previous = previous >= 0
+    has_following = following < columns
+    previous = numpy.maximum(previous, 0)
+    following = numpy.minimum(following, columns - 1)
+
+    previous_values = numpy.take_along_axis(subset, previous, axis=1)
+    following_values = numpy.take_along_axis(subset, following, axis=1)
+    previous_timestamps = source_timestamps[row_index, previous]
+    following_timestamps = source_timestamps[row_index, following]
+
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        interpolated = previous_values + (
+            source_timestamps[:, :, None] - previous_timestamps
+        ) / (following_timestamps - previous_timestamps) * (
+            following_values - previous_values
+        )
+
+    filled = numpy.where(
+        valid,
+        subset,
+        numpy.where(
+            carried[fields],
+            numpy.where(has_previous, previous_values, numpy.nan),
+            numpy.where(has_previous & has_following, interpolated, numpy.nan),
+        ),
+    )
+
+    values = values.copy()
+    values[:, :, fields] = filled
+
+    return values
+
+
+def _count_lower_or_equal(
+    source_timestamps: "numpy.ndarray", timestamps: "numpy.ndarray"
+) -> "numpy.ndarray":
+    """
+    Returns the number of source timestamps lower or equal to each timestamp, for each row of source timestamps
+
+    Rows are sorted, with NaN timestamps at the end. They are shifted so they can be concatenated into a single sorted
+    array and searched with a single numpy.searchsorted call.
+    """
+    rows, columns = source_timestamps.shape
+
+    finite = source_timestamps[~numpy.isnan(source_timestamps)]
+    low = min(finite.min(initial=0), timestamps.min())
+    high = max(finite.max(initial=0), timestamps.max()) + 1
+
+    # NaN timestamps are replaced with a value above all sampled timestamps, and every row gets its own range
+    width = high - low + 1
+    offsets = numpy.arange(rows)[:, None] * width
+    shifted = numpy.where(numpy.isnan(source_timestamps), high, source_timestamps)
+    shifted = shifted - low + offsets
+
+    counts = numpy.searchsorted(
+        shifted.ravel(), (timestamps - low + offsets), side="right"
+    )
+
+    return counts - numpy.arange(rows)[:, None] * columns
+
+
+def _convert(value: float, type_hint):
+    if math.isnan(value):
+        return None
+    if type_hint is bool:
+        return bool(round(value))
+    if type_hint is int:
+        return int(round(value))
+    return value
@@ -0,0 +1,533 @@
+import os
+import sys
+import json
+import typing
+import hashlib
+import tempfile
+import dataclasses
+import importlib.util
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities.class_tree import get_classes, unwrap_optional
+from lol_dto.utilities.load_json import SOURCES_CLASSES, from_dict
+
+# Key added to versioned dumps, holding the schema fingerprint of the dumped class
+SCHEMA_VERSION_KEY = "schemaVersion"
+
+# Changing the generated code requires incrementing this version, which is part of the fingerprint
+CODEGEN_VERSION = 3
+
+# Generated modules and their bytecode are only reused by the Python version that generated them
+_PYTHON_VERSION = "{}.{}".format(*sys.version_info)
+
+# Values of those types are copied as-is by generated encoders
+_ATOMIC_TYPES = (str, int, float, bool)
+
+# Registered migrations: from version -> (to version, function transforming a dictionary)
+MIGRATIONS: Dict[str, Tuple[str, Callable[[dict], dict]]] = {}
+
+# Codecs are generated once per class and registered sources
+_codecs: Dict[tuple, "SchemaCodec"] = {}
+
+
+@dataclasses.dataclass
+class SchemaCodec:
+    """
+    Encode and decode functions generated for a class tree, identified by the fingerprint of its schema
+    """
+
+    cls: type
+    fingerprint: str
+    source: str  # The generated Python code
+    module: ModuleType
+
+    def encode(self, lol_game, remove_empty: bool = True) -> dict:
+        """
+        Transforms the object to a dictionary, with the same output as to_dict
+        """
+        if remove_empty:
+            return self.module.encode(lol_game)
+        return self.module.encode_full(lol_game)
+
+    def decode(self, data: dict):
+        """
+        Creates the object from a dictionary, with the same output as from_dict
+        """
+        return self.module.decode(data)
+
+
+def get_schema(cls: type = LolGame) -> Dict[str, dict]:
+    """
+    Returns a description of the class and all the dataclasses it contains, including registered sources
+
+    Args:
+        cls: the root dataclass, LolGame by default
+
+    Returns:
+        A dictionary {class path: {'fields': [[name, type, has default], ...], 'sources': {name: class path}}}
+    """
+    return {_get_path(c): _describe(c) for c in get_classes(cls, SOURCES_CLASSES)}
+
+
+def get_schema_fingerprint(cls: type = LolGame) -> str:
+    """
+    Returns a short hash of the schema of the class, which changes when any field of the class tree changes
+
+    Args:
+        cls: the root dataclass, LolGame by default
+
+    Returns:
+        A 16 characters hexadecimal string
+    """
+    return _get_schema_hash(cls)[:16]
+
+
+def get_codec(cls: type = LolGame, cache_dir: Optional[str] = None) -> SchemaCodec:
+    """
+    Returns the encode and decode functions generated for the current schema of the class
+
+    Generated code does not use any reflection. With a cache_dir, it is also saved as a Python module named after the
+    schema fingerprint, so later processes only import it and reuse its bytecode. Cached modules that cannot be loaded,
+    for example after being truncated, are generated again.
+
+    Args:
+        cls: the root dataclass, LolGame by default
+        cache_dir: the directory of the generated modules, 'default' for $LOL_DTO_CACHE_DIR or ~/.cache/lol_dto, or None
+            to not use a disk cache
+
+    Returns:
+        The SchemaCodec of the class
+    """
+    key = cls, cache_dir, _get_sources_key()
+
+    try:
+        return _codecs[key]
+    except KeyError:
+        pass
+
+    schema_hash = _get_schema_hash(cls)
+    fingerprint = schema_hash[:16]
+
+    if cache_dir == "default":
+        cache_dir = os.environ.get(
+            "LOL_DTO_CACHE_DIR",
+            os.path.join(os.path.expanduser("~"), ".cache", "lol_dto"),
+        )
+
+    module = None
+    filename = None
+
+    if cache_dir is not None:
+        filename = _get_cache_filename(cache_dir, fingerprint)
+
+        try:
+            with open(filename) as file:
+                source = file.read()
+
+            module = _load_module(schema_hash, source, filename)
+        except Exception:
+            # Missing, truncated, corrupted, or stale modules are generated again
+            module = None
+
+    if module is None:
+        source = generate_codec_source(cls)
+
+        if filename is not None:
+            filename = _write_cache(filename, source)
+
+        module = _load_module(schema_hash, source, filename)
+
+    codec = _codecs[key] = SchemaCodec(cls, fingerprint, source, module)
+
+    return codec
+
+
+def to_versioned_dict(lol_game, remove_empty: bool = True) -> dict:
+    """
+    Transforms the object to a dictionary with the generated encoder, adding its schema fingerprint under
+    SCHEMA_VERSION_KEY
+
+    Loaders that do not know about versions ignore the additional key.
+    """
+    codec = get_codec(type(lol_game))
+
+    output = codec.encode(lol_game, remove_empty)
+    output[SCHEMA_VERSION_KEY] = codec.fingerprint
+
+    return output
+
+
+def from_versioned_dict(data: dict, cls: Type = LolGame):
+    """
+    Creates the object from a dictionary created with to_versioned_dict
+
+    Dictionaries with the current schema version use the generated decoder. Older versions go through registered
+    migrations to reach the current version, and only fall back to from_dict if no migrations path exists.
+
+    Args:
+        data: the dictionary to transform, which is not modified
+        cls: the dataclass to create, LolGame by default
+
+    Returns:
+        The LolGame object, with all its children and backrefs
+    """
+    codec = get_codec(cls)
+    version = data.get(SCHEMA_VERSION_KEY)
+
+    if version != codec.fingerprint:
+        data = migrate(data, codec.fingerprint)
+
+        if data.get(SCHEMA_VERSION_KEY) != codec.fingerprint:
+            return from_dict(data, cls)
+
+    return codec.decode(data)
+
+
+def dump_json_versioned(lol_game, filename: str, remove_empty: bool = True):
+    """
+    Dumps the given LolGame to a local file in JSON format with its schema version, see to_versioned_dict
+    """
+    output_dict = to_versioned_dict(lol_game, remove_empty)
+
+    with open(filename, "w+") as file:
+        json.dump(output_dict, file)
+
+
+def load_json_versioned(filename: str, cls: Type = LolGame):
+    """
+    Loads a LolGame from a local JSON file created with dump_json_versioned, see from_versioned_dict
+    """
+    with open(filename) as file:
+        return from_versioned_dict(json.load(file), cls)
+
+
+def register_migration(
+    from_version: str, to_version: str, migration: Callable[[dict], dict]
+):
+    """
+    Registers a function transforming dictionaries of a schema version to the next one
+
+    Migrations are chained, so each schema change only needs a migration from the previous version.
+
+    Args:
+        from_version: the fingerprint of the old schema, as found in dumps
+        to_version: the fingerprint of the new schema, see get_schema_fingerprint
+        migration: a function taking the old dictionary and returning the new one, without modifying its input
+    """
+    MIGRATIONS[from_version] = to_version, migration
+
+
+def migrate(data: dict, to_version: str) -> dict:
+    """
+    Applies registered migrations to the dictionary until it reaches to_version or no migration applies
+    """
+    seen = set()
+
+    while data.get(SCHEMA_VERSION_KEY) != to_version:
+        version = data.get(SCHEMA_VERSION_KEY)
+
+        if version not in MIGRATIONS or version in seen:
+            break
+        seen.add(version)
+
+        next_version, migration = MIGRATIONS[version]
+        data = {**migration(data), SCHEMA_VERSION_KEY: next_version}
+
+    return data
+
+
+def generate_codec_source(cls: type) -> str:
+    """
+    Returns the Python code of a module with encode, encode_full, and decode functions for the class
+
+    Every class of the tree gets its own functions, accessing fields by name without any reflection. The first lines
+    hold the schema hash, the Python version, and a checksum of the code, checked before cached modules are executed.
+    """
+    classes = get_classes(cls, SOURCES_CLASSES)
+    names = {c: f"_c{i}" for i, c in enumerate(classes)}
+
+    lines = [
+        "from lol_dto.utilities.dump_json import serialize",
+        "from lol_dto.utilities.load_json import make_sources_converter",
+    ]
+
+    for c, name in names.items():
+        lines.append(f"from {c.__module__} import {c.__qualname__} as {name}")
+
+    for c in classes:
+        lines.extend(_generate_class_functions(c, names))
+
+    root = names[cls]
+    lines.extend(
+        [
+            "",
+            f"encode = encode{root}",
+            f"encode_full = encode_full{root}",
+            f"decode = decode{root}",
+            "",
+        ]
+    )
+
+    return _add_header(_get_schema_hash(cls), "\n".join(lines))
+
+
+def _generate_class_functions(cls: type, names: Dict[type, str]) -> List[str]:
+    name = names[cls]
+    type_hints = typing.get_type_hints(cls)
+    fields = [f for f in dataclasses.fields(cls)]
+    has_sources = any(f.name == "sources" for f in fields)
+
+    lines = [""]
+
+    if has_sources:
+        lines.append(f"_sources{name} = make_sources_converter({name})")
+
+    for function_name, remove_empty in ("encode", True), ("encode_full", False):
+        lines.extend(["", f"def {function_name}{name}(obj):", "    output = {}"])
+
+        for f in fields:
+            encode_expression = _get_encode_expression(
+                type_hints[f.name], names, function_name, remove_empty
+            )
+
+            lines.append(f"    value = obj.{f.name}")
+
+            if remove_empty:
+                lines.append("    if value is not None:")
+                lines.append(f"        output[{f.name!r}] = {encode_expression}")
+            else:
+                lines.append(
+                    f"    output[{f.name!r}] = None if value is None else {encode_expression}"
+                )
+
+        lines.append("    return output")
+
+    required_fields = [
+        f.name
+        for f in fields
+        if f.init
+        and f.default is dataclasses.MISSING
+        and f.default_factory is dataclasses.MISSING
+    ]
+
+    init_fields = [f.name for f in fields if f.init]
+    required = "".join(f"{n!r}: None, " for n in required_fields)
+
+    # Known keys are copied in a single operation, and only fields needing a conversion are then looked at
+    lines.append(f"_fields{name} = frozenset({init_fields!r})")
+    lines.extend(["", f"def decode{name}(data):"])
+    known_items = f"{{k: v for k, v in data.items() if k in _fields{name}}}"
+    lines.append(f"    if _fields{name}.issuperset(data):")
+    lines.append(
+        f"        kwargs = {{{required}**data}}"
+        if required
+        else "        kwargs = dict(data)"
+    )
+    lines.append("    else:")
+    lines.append(
+        "        # Unknown keys, like ones coming from a more recent version, are ignored"
+    )
+    lines.append(
+        f"        kwargs = {{{required}**{known_items}}}"
+        if required
+        else f"        kwargs = {known_items}"
+    )
+
+    for f in fields:
+        if not f.init:
+            continue
+
+        if f.name == "sources" and has_sources:
+            decode_expression = f"_sources{name}(value)"
+        else:
+            decode_expression = _get_decode_expression(type_hints[f.name], names)
+
+        if decode_expression == "value":
+            continue
+
+        lines.append(f"    value = kwargs.get({f.name!r})")
+        lines.append("    if value is not None:")
+        lines.append(f"        kwargs[{f.name!r}] = {decode_expression}")
+
+    lines.append(f"    return {name}(**kwargs)")
+
+    return lines
+
+
+def _get_encode_expression(
+    type_hint, names: Dict[type, str], function_name: str, remove_empty: bool
+) -> str:
+    """
+    Returns the expression encoding 'value', falling back to serialize when the value does not have the hinted type
+    """
+    type_hint = unwrap_optional(type_hint)
+    fallback = f"serialize(value, {remove_empty})"
+
+    if type_hint in _ATOMIC_TYPES:
+        return f"value if value.__class__ is {type_hint.__name__} else {fallback}"
+
+    if type_hint in names:
+        name = names[type_hint]
+        return (
+            f"{function_name}{name}(value) if value.__class__ is {name} else {fallback}"
+        )
+
+    if getattr(type_hint, "__origin__", None) is list and type_hint.__args__:
+        item_hint = unwrap_optional(type_hint.__args__[0])
+
+        if item_hint in names:
+            name = names[item_hint]
+            return (
+                f"[{function_name}{name}(v) if v.__class__ is {name} else serialize(v, {remove_empty}) "
+                f"for v in value] if value.__class__ is list else {fallback}"
+            )
+
+    return fallback
+
+
+def _get_decode_expression(type_hint, names: Dict[type, str]) -> str:
+    type_hint = unwrap_optional(type_hint)
+
+    if type_hint in names:
+        return f"decode{names[type_hint]}(value)"
+
+    if getattr(type_hint, "__origin__", None) is list and type_hint.__args__:
+        item_hint = unwrap_optional(type_hint.__args__[0])
+
+        if item_hint in names:
+            return f"[decode{names[item_hint]}(v) for v in value]"
+
+    return "value"
+
+
+def _describe(cls: type) -> dict:
+    type_hints = typing.get_type_hints(cls)
+
+    return {
+        "fields": [
+            [
+                f.name,
+                _type_repr(type_hints[f.name]),
+                f.default is not dataclasses.MISSING
+                or f.default_factory is not dataclasses.MISSING,
+            ]
+            for f in dataclasses.fields(cls)
+        ],
+        "sources": {
+            name: _get_path(c) for name, c in SOURCES_CLASSES.get(cls, {}).items()
+        },
+    }
+
+
+def _type_repr(type_hint) -> str:
+    """
+    Returns a description of the type hint that is the same in all processes and all supported Python versions
+    """
+    origin = getattr(type_hint, "__origin__", None)
+
+    if origin is None:
+        # Classes, but also functions like dataclass, whose repr includes their memory address
+        if hasattr(type_hint, "__qualname__"):
+            return _get_path(type_hint)
+
+        return repr(type_hint)
+
+    args = [a for a in type_hint.__args__ if a is not type(None)]
+
+    if origin is typing.Union and len(args) < len(type_hint.__args__):
+        # Python 3.7 and 3.8 show Optional[X] as Union[X, NoneType]
+        name, args = ("Optional", args) if len(args) == 1 else ("Union", args + [None])
+    elif origin is typing.Union:
+        name = "Union"
+    else:
+        # Python 3.7+ uses builtin classes as the origin of typing generics, like list for List[int]
+        name = origin.__name__.capitalize()
+
+    return f"typing.{name}[{', '.join(_type_repr(a) for a in args)}]"
+
+
+def _get_path(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _get_schema_hash(cls: type) -> str:
+    schema = {"codegen": CODEGEN_VERSION, "classes": get_schema(cls)}
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
+
+def _get_cache_filename(cache_dir: str, fingerprint: str) -> str:
+    python = _PYTHON_VERSION.replace(".", "")
+    return os.path.join(cache_dir, f"codec_{fingerprint}_py{python}.py")
+
+
+def _get_sources_key() -> tuple:
+    return tuple((c, tuple(s.items())) for c, s in SOURCES_CLASSES.items())
+
+
+def _write_cache(filename: str, source: str) -> Optional[str]:
+    """
+    Writes the generated module atomically, returning None if the cache directory is not writable
+    """
+    directory = os.path.dirname(filename)
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, suffix=".tmp", delete=False
+        ) as file:
+            file.write(source)
+
+        os.replace(file.name, filename)
+    except OSError:
+        return None
+
+    return filename
+
+
+def _get_header(schema_hash: str) -> str:
+    return (
+        f"# Generated by lol_dto.utilities.schema for schema {schema_hash} "
+        f"on Python {_PYTHON_VERSION}, do not edit"
+    )
+
+
+def _add_header(schema_hash: str, code: str) -> str:
+    checksum = hashlib.sha256(code.encode()).hexdigest()
+    return f"{_get_header(schema_hash)}\n# Checksum {checksum}\n{code}"
+
+
+def _load_module(schema_hash: str, source: str, filename: Optional[str]) -> ModuleType:
+    """
+    Executes the generated module, raising an exception if it is not a complete codec for the schema
+
+    The whole schema hash, the Python version, and the checksum of the code are checked before executing anything.
+    """
+    fingerprint = schema_hash[:16]
+    module_name = f"lol_dto_codec_{fingerprint}"
+
+    header, checksum_line, code = (source.split("\n", 2) + ["", ""])[:3]
+
+    if header != _get_header(schema_hash):
+        raise ImportError(f"{filename} is not a codec for schema {fingerprint}")
+
+    if checksum_line != f"# Checksum {hashlib.sha256(code.encode()).hexdigest()}":
+        raise ImportError(f"{filename} does not match its checksum")
+
+    if filename is not None:
+        # Importing from the file lets Python cache the bytecode next to it
+        spec = importlib.util.spec_from_file_location(module_name, filename)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    else:
+        module = ModuleType(module_name)
+        exec(compile(source, f"<{module_name}>", "exec"), module.__dict__)
+
+    # A module truncated between two functions still executes, but misses the last ones
+    for name in "encode", "encode_full", "decode":
+        if not callable(getattr(module, name, None)):
+            raise ImportError(f"{module_name} has no {name} function")
+
+    return module
@@ -0,0 +1,303 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from lol_dto.classes.game import LolGame
+from lol_dto.classes.game.compact import with_compact_classes
+
+# Riot's coordinates bounds, see Position
+MAP_MIN = -120
+MAP_MAX = 14870
+
+
+class IndexedPosition(NamedTuple):
+    x: int
+    y: int
+    # The event or snapshot the position comes from
+    item: object
+    # The player owning the event or snapshot, None for kills and team events
+    playerId: Optional[int]
+    lol_game: LolGame
+
+
+class RectangleRegion:
+    def __init__(self, x_min: float, y_min: float, x_max: float, y_max: float):
+        self.bbox = (x_min, y_min, x_max, y_max)
+
+    def contains(self, x: float, y: float) -> bool:
+        x_min, y_min, x_max, y_max = self.bbox
+        return x_min <= x <= x_max and y_min <= y <= y_max
+
+
+class CircleRegion:
+    def __init__(self, x: float, y: float, radius: float):
+        self.center = (x, y)
+        self.radius = radius
+        self.bbox = (x - radius, y - radius, x + radius, y + radius)
+
+    def contains(self, x: float, y: float) -> bool:
+        return (x - self.center[0]) ** 2 + (y - self.center[1]) ** 2 <= self.radius**2
+
+
+class DiagonalBandRegion:
+    """
+    Points with low <= x + y <= high, which is a band going from the top left to the bottom right of the map
+    """
+
+    def __init__(self, low: float, high: float):
+        self.low = low
+        self.high = high
+        self.bbox = (MAP_MIN, MAP_MIN, MAP_MAX, MAP_MAX)
+
+    def contains(self, x: float, y: float) -> bool:
+        return self.low <= x + y <= self.high
+
+    def intersects(
+        self, x_min: float, y_min: float, x_max: float, y_max: float
+    ) -> bool:
+        """
+        Returns True if the band intersects the given rectangle, used to skip grid cells
+        """
+        return x_max + y_max >= self.low and x_min + y_min <= self.high
+
+
+# Approximate map regions, using Riot's coordinates
+MAP_REGIONS = {
+    "blue_base": DiagonalBandRegion(2 * MAP_MIN, 5800),
+    "red_base": DiagonalBandRegion(23700, 2 * MAP_MAX),
+    "blue_side": DiagonalBandRegion(2 * MAP_MIN, 13400),
+    "red_side": DiagonalBandRegion(16100, 2 * MAP_MAX),
+    "river": DiagonalBandRegion(13400, 16100),
+    "baron_pit": CircleRegion(5007, 10471, 900),
+    "dragon_pit": CircleRegion(9866, 4414, 900),
+}
+
+
+class SpatialIndex:
+    """
+    A uniform grid index over the positions of events and snapshots, from one or multiple games
+
+    Supports bounding box, radius, and map region queries, which only look at the grid cells overlapping the query.
+    """
+
+    def __init__(self, cell_size: int = 500):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[IndexedPosition]] = {}
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for cell in self._cells.values():
+            yield from cell
+
+    @classmethod
+    def from_games(
+        cls,
+        lol_games: Iterable[LolGame],
+        events: bool = True,
+        snapshots: bool = True,
+        cell_size: int = 500,
+    ) -> "SpatialIndex":
+        """
+        Creates an index over the positions of all events and snapshots of the given games
+
+        Args:
+            lol_games: the games to index
+            events: whether or not to index events positions, using LolGame.event_index
+            snapshots: whether or not to index snapshots positions
+            cell_size: the size of the grid cells in Riot's coordinates units
+
+        Returns:
+            The spatial index
+        """
+        index = cls(cell_size)
+
+        for lol_game in lol_games:
+            index.add_game(lol_game, events, snapshots)
+
+        return index
+
+    def add_game(self, lol_game: LolGame, events: bool = True, snapshots: bool = True):
+        """
+        Adds the positions of the events and snapshots of a game to the index
+        """
+        if events:
+            event_index = lol_game.event_index
+
+            for indexed_event in (*event_index.events, *event_index.untimed):
+                self.add(indexed_event.event, indexed_event.playerId, lol_game)
+
+        if snapshots:
+            for team in lol_game.teams:
+                for player in team.players:
+                    for snapshot in player.snapshots:
+                        self.add(snapshot, player.id, lol_game)
+
+    def add(self, item, player_id: Optional[int] = None, lol_game: LolGame = None):
+        """
+        Adds an event or a snapshot to the index, if it has a position
+        """
+        position = getattr(item, "position", None)
+
+        if position is None or position.x is None or position.y is None:
+            return
+
+        self._cells.setdefault(self._get_cell(position.x, position.y), []).append(
+            IndexedPosition(position.x, position.y, item, player_id, lol_game)
+        )
+        self._count += 1
+
+    def in_bbox(
+        self,
+        x_min: float,
+        y_min: float,
+        x_max: float,
+        y_max: float,
+        item_class: type = None,
+    ) -> List[IndexedPosition]:
+        """
+        Returns the positions with x_min <= x <= x_max and y_min <= y <= y_max
+
+        Args:
+            x_min: the left of the bounding box
+            y_min: the bottom of the bounding box
+            x_max: the right of the bounding box
+            y_max: the top of the bounding box
+            item_class: only returns positions of items of this class, for example LolGameKill
+
+        Returns:
+            A list of IndexedPosition
+        """
+        return self._query(
+            (x_min, y_min, x_max, y_max),
+            lambda x, y: x_min <= x <= x_max and y_min <= y <= y_max,
+            item_class,
+        )
+
+    def in_radius(
+        self, x: float, y: float, radius: float, item_class: type = None
+    ) -> List[IndexedPosition]:
+        """
+        Returns the positions at a distance of (x, y) lower or equal to radius
+        """
+        region = CircleRegion(x, y, radius)
+        return self._query(region.bbox, region.contains, item_class)
+
+    def in_region(
+        self, region: Union[str, object], item_class: type = None
+    ) -> List[IndexedPosition]:
+        """
+        Returns the positions in a map region
+
+        Args:
+            region: a name from MAP_REGIONS, like 'river' or 'baron_pit', or an object with bbox and contains(x, y)
+            item_class: only returns positions of items of this class, for example LolGamePlayerWardEvent
+
+        Returns:
+            A list of IndexedPosition
+        """
+        if isinstance(region, str):
+            region = MAP_REGIONS[region]
+
+        return self._query(
+            region.bbox,
+            region.contains,
+            item_class,
+            getattr(region, "intersects", None),
+        )
+
+    def heatmap(self, bins: int = 64, item_class: type = None):
+        """
+        Returns a 2D histogram of the indexed positions, see heatmap()
+        """
+        if item_class is not None:
+            item_class = with_compact_classes(item_class)
+
+        positions = [
+            p for p in self if item_class is None or isinstance(p.item, item_class)
+        ]
+
+        return heatmap([p.x for p in positions], [p.y for p in positions], bins)
+
+    def _get_cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def _query(
+        self, bbox, contains, item_class, intersects=None
+    ) -> List[IndexedPosition]:
+        x_min, y_min, x_max, y_max = bbox
+        cell_x_min, cell_y_min = self._get_cell(x_min, y_min)
+        cell_x_max, cell_y_max = self._get_cell(x_max, y_max)
+
+        # On large queries, iterating on existing cells is faster than iterating on all cells in the bounding box
+        if (cell_x_max - cell_x_min + 1) * (cell_y_max - cell_y_min + 1) > len(
+            self._cells
+        ):
+            keys = [
+                (cell_x, cell_y)
+                for cell_x, cell_y in self._cells
+                if cell_x_min <= cell_x <= cell_x_max
+                and cell_y_min <= cell_y <= cell_y_max
+            ]
+        else:
+            keys = [
+                (cell_x, cell_y)
+                for cell_x in range(cell_x_min, cell_x_max + 1)
+                for cell_y in range(cell_y_min, cell_y_max + 1)
+                if (cell_x, cell_y) in self._cells
+            ]
+
+        if intersects is not None:
+            size = self.cell_size
+            keys = [
+                (cell_x, cell_y)
+                for cell_x, cell_y in keys
+                if intersects(
+                    cell_x * size,
+                    cell_y * size,
+                    (cell_x + 1) * size,
+                    (cell_y + 1) * size,
+                )
+            ]
+
+        cells = [self._cells[key] for key in keys]
+
+        if item_class is not None:
+            item_class = with_compact_classes(item_class)
+
+        return [
+            p
+            for cell in cells
+            for p in cell
+            if (item_class is None or isinstance(p.item, item_class))
+            and contains(p.x, p.y)
+        ]
+
+
+def heatmap(x: Iterable[float], y: Iterable[float], bins: int = 64):
+    """
+    Bins positions on a bins x bins grid covering the whole map, using numpy
+
+    Args:
+        x: the x coordinates of the positions
+        y: the y coordinates of the positions
+        bins: the number of bins on each axis
+
+    Returns:
+        A (bins, bins) numpy array of counts, indexed with [x_bin, y_bin]
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Heatmaps require the numpy package: pip install lol_dto[numpy]"
+        )
+
+    counts, _, _ = numpy.histogram2d(
+        numpy.asarray(x, dtype=float),
+        numpy.asarray(y, dtype=float),
+        bins=bins,
+        range=[[MAP_MIN, MAP_MAX], [MAP_MIN, MAP_MAX]],
+    )
+
+    return counts
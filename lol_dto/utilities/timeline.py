@@ -0,0 +1,140 @@
+import dataclasses
+from typing import List
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGamePlayer,
+    LolGamePlayerSnapshot,
+    LolGamePlayerSnapshotChampionStats,
+    LolGamePlayerSnapshotDamageStats,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Snapshot scalar fields, position being split in positionX and positionY
+SNAPSHOT_FIELDS = [
+    f.name
+    for f in dataclasses.fields(LolGamePlayerSnapshot)
+    if f.name not in ("position", "championStats", "damageStats")
+]
+CHAMPION_STATS_FIELDS = [
+    f.name for f in dataclasses.fields(LolGamePlayerSnapshotChampionStats)
+]
+DAMAGE_STATS_FIELDS = [
+    f.name for f in dataclasses.fields(LolGamePlayerSnapshotDamageStats)
+]
+
+# All values are stored as floats so missing values and booleans can be represented as NaN and 0/1
+TIMELINE_FIELDS = (
+    SNAPSHOT_FIELDS
+    + ["positionX", "positionY"]
+    + CHAMPION_STATS_FIELDS
+    + DAMAGE_STATS_FIELDS
+)
+
+
+def snapshots_array(player: LolGamePlayer) -> "numpy.ndarray":
+    """
+    Returns the player snapshots as a structured NumPy array sorted by timestamp
+
+    The array has one row per snapshot and one float64 field per snapshot value, including 'positionX', 'positionY',
+    and every champion and damage stat. Missing values are NaN and booleans are 0 or 1.
+
+    Args:
+        player: the LolGamePlayer to transform
+
+    Returns:
+        A structured array of shape (snapshots,)
+
+    """
+    _check_numpy()
+
+    snapshots = sorted(
+        player.snapshots,
+        key=lambda s: float("inf") if s.timestamp is None else s.timestamp,
+    )
+
+    array = numpy.empty(len(snapshots), dtype=_get_dtype())
+    _fill_array(array, snapshots)
+
+    return array
+
+
+def timeline_arrays(lol_game: LolGame) -> "numpy.ndarray":
+    """
+    Returns the snapshots of all players as a single structured NumPy array aligned on timestamps
+
+    Rows are players, in teams.BLUE then teams.RED order, and columns are the sorted union of all snapshots
+    timestamps. A player without a snapshot at a given timestamp has NaN values for this timestamp. On top of the
+    snapshot_array fields, the array has a 'playerId' field.
+
+    Args:
+        lol_game: the LolGame to transform
+
+    Returns:
+        A structured array of shape (players, timestamps)
+
+    """
+    _check_numpy()
+
+    players = [player for team in lol_game.teams for player in team.players]
+    timestamps = sorted(
+        {s.timestamp for p in players for s in p.snapshots if s.timestamp is not None}
+    )
+    timestamps_index = {timestamp: index for index, timestamp in enumerate(timestamps)}
+
+    array = numpy.full(
+        (len(players), len(timestamps)),
+        numpy.nan,
+        dtype=_get_dtype() + [("playerId", "f8")],
+    )
+    array["timestamp"] = timestamps
+
+    for row, player in zip(array, players):
+        row["playerId"] = numpy.nan if player.id is None else player.id
+
+        snapshots = [s for s in player.snapshots if s.timestamp is not None]
+        _fill_array(row, snapshots, [timestamps_index[s.timestamp] for s in snapshots])
+
+    return array
+
+
+def _fill_array(
+    array: "numpy.ndarray",
+    snapshots: List[LolGamePlayerSnapshot],
+    index=slice(None),
+):
+    """
+    Fills array[field][index] with the values of the given snapshots
+    """
+    # numpy transforms None to NaN when creating float arrays
+    for name in SNAPSHOT_FIELDS:
+        array[name][index] = [getattr(s, name) for s in snapshots]
+
+    positions = [s.position for s in snapshots]
+    array["positionX"][index] = [None if p is None else p.x for p in positions]
+    array["positionY"][index] = [None if p is None else p.y for p in positions]
+
+    for attribute, fields in (
+        ("championStats", CHAMPION_STATS_FIELDS),
+        ("damageStats", DAMAGE_STATS_FIELDS),
+    ):
+        stats = [getattr(s, attribute) for s in snapshots]
+        for name in fields:
+            array[name][index] = [
+                None if st is None else getattr(st, name) for st in stats
+            ]
+
+
+def _get_dtype() -> list:
+    return [(name, "f8") for name in TIMELINE_FIELDS]
+
+
+def _check_numpy():
+    if numpy is None:
+        raise ImportError(
+            "Timeline arrays require the numpy package: pip install lol_dto[numpy]"
+        )
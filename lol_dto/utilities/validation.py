@@ -0,0 +1,552 @@
+import typing
+import dataclasses
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGamePlayer,
+    LolGamePlayerItemEvent,
+    LolGamePlayerLargeMonsterKill,
+    LolGamePlayerSkillLevelUpEvent,
+    LolGamePlayerSummonerSpell,
+    LolGamePlayerWardEvent,
+    LolGameTeamBuildingKill,
+    LolGameTeamEpicMonsterKill,
+    LolPickBan,
+    Position,
+)
+from lol_dto.classes.game.compact import COMPACT_CLASSES
+from lol_dto.utilities.class_tree import get_classes, unwrap_optional
+
+# Changing the generated code requires incrementing this version
+CODEGEN_VERSION = 1
+
+SIDES = ("BLUE", "RED")
+LANES = ("TOP", "MID", "BOT")
+
+# Allowed values of string and integer fields, by class
+ENUMS: Dict[type, Dict[str, tuple]] = {
+    LolGame: {"winner": SIDES},
+    LolPickBan: {"team": SIDES},
+    LolGamePlayer: {"role": ("TOP", "JGL", "MID", "BOT", "SUP")},
+    LolGamePlayerSummonerSpell: {"slot": (0, 1)},
+    LolGameTeamEpicMonsterKill: {
+        "type": ("DRAGON", "DRAGON_SOUL", "BARON", "RIFT_HERALD"),
+        "subType": (
+            "CLOUD",
+            "INFERNAL",
+            "MOUNTAIN",
+            "OCEAN",
+            "HEXTECH",
+            "CHEMTECH",
+            "ELDER",
+        ),
+    },
+    LolGameTeamBuildingKill: {
+        "type": ("TURRET", "TURRET_PLATE", "INHIBITOR", "NEXUS"),
+        "lane": LANES,
+        "side": SIDES,
+        "turretLocation": ("OUTER", "INNER", "INHIBITOR", "NEXUS"),
+    },
+    LolGamePlayerItemEvent: {
+        "type": ("PURCHASED", "SOLD", "UNDO", "PICKED_UP", "USED", "DESTROYED")
+    },
+    LolGamePlayerWardEvent: {
+        "type": ("PLACED", "KILLED"),
+        "wardType": (
+            "YELLOW_TRINKET",
+            "CONTROL_WARD",
+            "SIGHT_WARD",
+            "BLUE_TRINKET",
+            "TEEMO_MUSHROOM",
+            "VISION_WARD",
+            "UNDEFINED",
+        ),
+    },
+    LolGamePlayerSkillLevelUpEvent: {
+        "type": ("NORMAL", "EVOLVE"),
+        "slot": (1, 2, 3, 4),
+    },
+    LolGamePlayerLargeMonsterKill: {
+        "type": (
+            "BLUE_BUFF",
+            "RED_BUFF",
+            "RAPTOR",
+            "WOLF",
+            "KRUG",
+            "GROMP",
+            "SCUTTLE",
+        )
+    },
+}
+
+# Fields referring to the id of a player of the game
+# Damage instances participantId is not one of them, as it is 0 for damage coming from minions and turrets
+REFERENCE_FIELDS = ("killerId", "victimId", "assistsIds")
+
+# Lists of timestamps, checked like the timestamp field of events
+TIMESTAMPS_LISTS = ("levelUpEvents",)
+
+# Lists of objects with a timestamp that do not need to be sorted, snapshots being sorted when used, see snapshots_array
+UNORDERED_LISTS = ("snapshots",)
+
+# Riot's map coordinates, see Position
+POSITION_BOUNDS = (-120, 14870)
+
+# Timestamps can be this many seconds after the game duration, which is usually rounded down to the second
+DURATION_TOLERANCE = 1.0
+
+# Accepted classes of atomic values, ints being valid floats but bools not being valid ints
+_ATOMIC_TYPES = {
+    int: frozenset({int}),
+    float: frozenset({int, float}),
+    str: frozenset({str}),
+    bool: frozenset({bool}),
+}
+
+# Validators are generated once per class and then reused for every game
+_validators: Dict[type, "Validator"] = {}
+
+
+@dataclass
+class ValidationIssue:
+    """
+    A single problem found in a game
+    """
+
+    path: str  # Path of the invalid value, like 'kills[3].killerId' or 'teams.BLUE.players[0].snapshots[2]'
+    code: str  # 'type', 'missing', 'value', 'reference', 'duplicate', 'timestamp', 'order', or 'position'
+    message: str
+
+
+@dataclass
+class ValidationReport:
+    """
+    The issues of a single game in a batch
+    """
+
+    index: int  # Position of the game in the input iterable
+    issues: List[ValidationIssue]
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+
+@dataclass
+class Validator:
+    """
+    Validation functions generated for a class tree
+    """
+
+    cls: type
+    source: str  # The generated Python code
+    function: Callable  # function(obj, path, issues, player_ids, max_timestamp)
+
+
+def validate_game(lol_game, cls: Type = LolGame) -> List[ValidationIssue]:
+    """
+    Checks types, allowed values, timestamps, positions, and references to players of a game, in a single pass
+
+    Checks are:
+        - every field has its hinted type, ints being accepted for floats, and required fields are set
+        - fields in ENUMS have one of their allowed values, like winner being BLUE or RED
+        - killerId, victimId, and assistsIds are ids of players of the game, and players ids are unique
+        - timestamps are between 0 and the game duration, and lists of events are sorted by timestamp
+        - positions are inside the map
+
+    Sources are not checked. Compact classes and lazy lists are supported.
+
+    Args:
+        lol_game: the LolGame to check
+        cls: the class of the game, LolGame by default
+
+    Returns:
+        A list of ValidationIssue, empty if the game is valid
+    """
+    issues = []
+
+    duration = getattr(lol_game, "duration", None)
+    if duration.__class__ in _ATOMIC_TYPES[float]:
+        max_timestamp = duration + DURATION_TOLERANCE
+    else:
+        max_timestamp = float("inf")
+
+    player_ids = _get_player_ids(lol_game, issues)
+
+    get_validator(cls).function(lol_game, None, issues, player_ids, max_timestamp)
+
+    return issues
+
+
+def validate_games(
+    lol_games: Iterable, cls: Type = LolGame, only_invalid: bool = False
+) -> Iterator[ValidationReport]:
+    """
+    Checks all the given games, see validate_game
+
+    The validator is generated once and reused for every game.
+
+    Args:
+        lol_games: the games to check, which can come from a generator
+        cls: the class of the games, LolGame by default
+        only_invalid: whether or not to only yield reports of games with issues
+
+    Returns:
+        A generator of ValidationReport, one per game
+    """
+    get_validator(cls)
+
+    for index, lol_game in enumerate(lol_games):
+        issues = validate_game(lol_game, cls)
+
+        if issues or not only_invalid:
+            yield ValidationReport(index, issues)
+
+
+def register_enum(cls: type, field_name: str, values: Optional[Iterable]):
+    """
+    Sets the allowed values of a field, for example for a new monster type, or removes them with None
+
+    Args:
+        cls: the class of the field, like LolGameTeamEpicMonsterKill
+        field_name: the name of the field, like 'type'
+        values: the allowed values, or None to allow any value
+    """
+    if values is None:
+        ENUMS.get(cls, {}).pop(field_name, None)
+    else:
+        ENUMS.setdefault(cls, {})[field_name] = tuple(values)
+
+    # Validators capture their children validators, so they all need to be rebuilt
+    _validators.clear()
+
+
+def get_validator(cls: type = LolGame) -> Validator:
+    """
+    Returns the cached validator of the class, generating it the first time
+    """
+    try:
+        return _validators[cls]
+    except KeyError:
+        pass
+
+    source, namespace = generate_validator_source(cls)
+    exec(compile(source, f"<lol_dto_validator_{cls.__name__}>", "exec"), namespace)
+
+    validator = _validators[cls] = Validator(cls, source, namespace["validate"])
+
+    return validator
+
+
+def generate_validator_source(cls: type) -> Tuple[str, dict]:
+    """
+    Returns the Python code of a module with a validation function per class of the tree, and the namespace it runs in
+
+    Functions access fields by name and only format paths and messages when they find an issue.
+    """
+    classes = get_classes(cls)
+    names = {c: f"_c{i}" for i, c in enumerate(classes)}
+
+    namespace = {
+        "_add_issue": _add_issue,
+        "_check_class": _check_class,
+        "_is_sequence": _is_sequence,
+        "_MINUS_INFINITY": float("-inf"),
+        **{f"_{t.__name__.upper()}": types for t, types in _ATOMIC_TYPES.items()},
+    }
+
+    lines = [f"# Generated by lol_dto.utilities.validation v{CODEGEN_VERSION}"]
+
+    for c, name in names.items():
+        namespace[name] = c
+        namespace[f"_compact{name}"] = COMPACT_CLASSES.get(c, c)
+        lines.extend(_generate_class_function(c, names, namespace))
+
+    lines.extend(["", f"validate = validate{names[cls]}", ""])
+
+    return "\n".join(lines), namespace
+
+
+def _generate_class_function(
+    cls: type, names: Dict[type, str], namespace: dict
+) -> List[str]:
+    name = names[cls]
+    type_hints = typing.get_type_hints(cls)
+    enums = ENUMS.get(cls, {})
+
+    lines = [
+        "",
+        f"def validate{name}(obj, path, issues, player_ids, max_timestamp):",
+        f"    if obj.__class__ is not {name} and obj.__class__ is not _compact{name}:",
+        f"        if not _check_class(obj, {name}, path, issues):",
+        "            return",
+    ]
+
+    for f in dataclasses.fields(cls):
+        if not f.init:
+            continue
+
+        required = (
+            f.default is dataclasses.MISSING
+            and f.default_factory is dataclasses.MISSING
+        )
+
+        values_name = None
+        if f.name in enums:
+            values_name = f"_values{name}_{f.name}"
+            namespace[values_name] = frozenset(enums[f.name])
+
+        check_lines = _generate_field_check(
+            f.name, type_hints[f.name], names, values_name
+        )
+
+        if check_lines is None:
+            continue
+
+        lines.append(f"    value = obj.{f.name}")
+        lines.append("    if value is None:")
+        lines.append(
+            f"        _add_issue(issues, (path, {f.name!r}), 'missing', 'Missing required field')"
+            if required
+            else "        pass"
+        )
+        lines.extend(check_lines)
+
+    if cls is Position:
+        minimum, maximum = POSITION_BOUNDS
+        lines.extend(
+            [
+                "    x, y = obj.x, obj.y",
+                "    if x.__class__ in _FLOAT and y.__class__ in _FLOAT:",
+                f"        if not ({minimum} <= x <= {maximum} and {minimum} <= y <= {maximum}):",
+                "            _add_issue(issues, path, 'position', f'({x}, {y}) is outside of the map')",
+            ]
+        )
+
+    return lines
+
+
+def _generate_field_check(
+    field_name: str,
+    type_hint,
+    names: Dict[type, str],
+    values_name: Optional[str],
+) -> Optional[List[str]]:
+    """
+    Returns the lines checking 'value', a non-None value of the field, or None if the field is not checked
+    """
+    type_hint = unwrap_optional(type_hint)
+    field_path = f"(path, {field_name!r})"
+
+    if type_hint in names:
+        return [
+            "    else:",
+            f"        validate{names[type_hint]}(value, {field_path}, issues, player_ids, max_timestamp)",
+        ]
+
+    if type_hint in _ATOMIC_TYPES:
+        return _generate_atomic_check(
+            "value",
+            type_hint,
+            field_path,
+            values_name,
+            field_name in REFERENCE_FIELDS,
+            field_name == "timestamp",
+            "    ",
+        )
+
+    if getattr(type_hint, "__origin__", None) is not list or not type_hint.__args__:
+        # Sources and other types are not checked
+        return None
+
+    item_hint = unwrap_optional(type_hint.__args__[0])
+
+    lines = [
+        "    elif value.__class__ is not list and not _is_sequence(value):",
+        f"        _add_issue(issues, {field_path}, 'type', f'Expected a list, got {{value.__class__.__name__}}')",
+        "    else:",
+        f"        list_path = {field_path}",
+    ]
+
+    if item_hint in names:
+        ordered = field_name not in UNORDERED_LISTS and "timestamp" in {
+            f.name for f in dataclasses.fields(item_hint)
+        }
+
+        if ordered:
+            lines.append("        previous = _MINUS_INFINITY")
+
+        lines.extend(
+            [
+                "        for index, item in enumerate(value):",
+                f"            validate{names[item_hint]}(item, (list_path, index), issues, player_ids, max_timestamp)",
+            ]
+        )
+
+        if ordered:
+            lines.extend(
+                [
+                    "            timestamp = getattr(item, 'timestamp', None)",
+                    "            if timestamp.__class__ in _FLOAT:",
+                    "                if timestamp < previous:",
+                    "                    _add_issue(issues, (list_path, index), 'order', "
+                    "f'Timestamp {timestamp} is before the previous one, {previous}')",
+                    "                previous = timestamp",
+                ]
+            )
+
+        return lines
+
+    if item_hint in _ATOMIC_TYPES:
+        ordered = field_name in TIMESTAMPS_LISTS
+
+        if ordered:
+            lines.append("        previous = _MINUS_INFINITY")
+
+        lines.append("        for index, item in enumerate(value):")
+        lines.append("            if item is None:")
+        lines.append(
+            f"                _add_issue(issues, (list_path, index), 'type', 'Expected {item_hint.__name__}, got None')"
+        )
+        lines.extend(
+            _generate_atomic_check(
+                "item",
+                item_hint,
+                "(list_path, index)",
+                values_name,
+                field_name in REFERENCE_FIELDS,
+                ordered,
+                "            ",
+            )
+        )
+
+        if ordered:
+            lines.extend(
+                [
+                    "            if item.__class__ in _FLOAT:",
+                    "                if item < previous:",
+                    "                    _add_issue(issues, (list_path, index), 'order', "
+                    "f'Timestamp {item} is before the previous one, {previous}')",
+                    "                previous = item",
+                ]
+            )
+
+        return lines
+
+    return None
+
+
+def _generate_atomic_check(
+    variable: str,
+    type_hint: type,
+    path: str,
+    values_name: Optional[str],
+    reference: bool,
+    timestamp: bool,
+    indent: str,
+) -> List[str]:
+    """
+    Returns elif branches checking the type, allowed values, reference, and timestamp of a non-None atomic value
+    """
+    types_name = f"_{type_hint.__name__.upper()}"
+
+    lines = [
+        f"elif {variable}.__class__ not in {types_name}:",
+        f"    _add_issue(issues, {path}, 'type', f'Expected {type_hint.__name__}, got {{{variable}.__class__.__name__}}')",
+    ]
+
+    if values_name is not None:
+        lines.extend(
+            [
+                f"elif {variable} not in {values_name}:",
+                f"    _add_issue(issues, {path}, 'value', f'{{{variable}!r}} is not one of {{sorted({values_name})}}')",
+            ]
+        )
+
+    if reference:
+        lines.extend(
+            [
+                f"elif player_ids is not None and {variable} not in player_ids:",
+                f"    _add_issue(issues, {path}, 'reference', f'{{{variable}!r}} is not the id of a player of the game')",
+            ]
+        )
+
+    if timestamp:
+        lines.extend(
+            [
+                f"elif {variable} < 0 or {variable} > max_timestamp:",
+                f"    _add_issue(issues, {path}, 'timestamp', f'{{{variable}}} is outside of the game')",
+            ]
+        )
+
+    return [indent + line for line in lines]
+
+
+def _get_player_ids(lol_game, issues: List[ValidationIssue]) -> Optional[set]:
+    """
+    Returns the ids of the players of the game, or None if they are unknown and references cannot be checked
+    """
+    player_ids = set()
+
+    try:
+        for side in SIDES:
+            for index, player in enumerate(getattr(lol_game.teams, side).players):
+                player_id = player.id
+
+                if player_id is None:
+                    continue
+
+                if player_id in player_ids:
+                    _add_issue(
+                        issues,
+                        ((((None, "teams"), side), "players"), index),
+                        "duplicate",
+                        f"Player id {player_id!r} is used by several players",
+                    )
+
+                player_ids.add(player_id)
+    except (AttributeError, TypeError):
+        # Type issues are reported by the validator
+        return None
+
+    return player_ids or None
+
+
+def _add_issue(issues: List[ValidationIssue], path: tuple, code: str, message: str):
+    issues.append(ValidationIssue(_format_path(path), code, message))
+
+
+def _format_path(path: Optional[tuple]) -> str:
+    """
+    Transforms a path built as nested (parent, key) tuples to a string like 'teams.BLUE.players[0]'
+    """
+    keys = []
+
+    while path is not None:
+        path, key = path
+        keys.append(key)
+
+    output = ""
+    for key in reversed(keys):
+        output += f"[{key}]" if isinstance(key, int) else f".{key}"
+
+    return output.lstrip(".")
+
+
+def _check_class(obj, cls: type, path: Optional[tuple], issues: list) -> bool:
+    # Subclasses are accepted
+    if isinstance(obj, cls):
+        return True
+
+    _add_issue(
+        issues, path, "type", f"Expected {cls.__name__}, got {obj.__class__.__name__}"
+    )
+    return False
+
+
+def _is_sequence(value) -> bool:
+    # Lazy lists from from_dict(lazy=True) are sequences but not lists
+    return isinstance(value, Sequence) and not isinstance(value, str)
@@ -0,0 +1,69 @@
+import pytest
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGameKill,
+    LolGamePlayer,
+    LolGamePlayerItemEvent,
+    LolGamePlayerRune,
+    LolGamePlayerSnapshot,
+    LolGameTeam,
+    LolGameTeamEpicMonsterKill,
+    LolGameTeams,
+    Position,
+)
+from lol_dto.utilities import to_dict
+
+# benchmarks is not installed with the package, pytest finds it through the pythonpath option in pyproject.toml
+from benchmarks.synthetic_game import make_game
+
+
+@pytest.fixture
+def lol_game():
+    return make_game()
+
+
+@pytest.fixture
+def game_dict(lol_game):
+    return to_dict(lol_game)
+
+
+@pytest.fixture
+def small_game():
+    """
+    A handwritten game small enough to check results by hand, with unsorted snapshots and an event without timestamp
+    """
+    blue_player = LolGamePlayer(
+        id=1,
+        championId=157,
+        primaryRuneTreeId=8000,
+        runes=[LolGamePlayerRune(slot=0, id=8005)],
+        itemsEvents=[
+            LolGamePlayerItemEvent(timestamp=30, id=3031),
+            LolGamePlayerItemEvent(timestamp=None, id=3031),
+        ],
+        snapshots=[
+            LolGamePlayerSnapshot(timestamp=120, totalGold=800, isAlive=False),
+            LolGamePlayerSnapshot(
+                timestamp=60, position=Position(x=10, y=20), totalGold=500
+            ),
+        ],
+    )
+    red_player = LolGamePlayer(
+        id=6,
+        snapshots=[LolGamePlayerSnapshot(timestamp=90, totalGold=600, isAlive=True)],
+    )
+
+    return LolGame(
+        kills=[LolGameKill(timestamp=20, killerId=1, victimId=6, assistsIds=[])],
+        teams=LolGameTeams(
+            BLUE=LolGameTeam(
+                bans=[1],
+                players=[blue_player],
+                epicMonstersKills=[
+                    LolGameTeamEpicMonsterKill(timestamp=10, killerId=1, type="BARON")
+                ],
+            ),
+            RED=LolGameTeam(players=[red_player]),
+        ),
+    )
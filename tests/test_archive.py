@@ -0,0 +1,196 @@
+import pytest
+
+from lol_dto.classes.game.compact import CompactLolGamePlayerSnapshot
+from lol_dto.classes.sources.riot_lol_api import RiotGameSource
+from lol_dto.utilities import to_dict
+from lol_dto.utilities.archive import (
+    TRAILER_MAGIC,
+    LolGameArchive,
+    compact_archive,
+    get_game_keys,
+)
+from benchmarks.synthetic_game import make_game
+
+
+def make_keyed_game(seed: int, game_hash: str = None):
+    lol_game = make_game(10, seed=seed)
+    lol_game.sources.riotLolApi = RiotGameSource(
+        gameId=seed, platformId="EUW1", gameHash=game_hash
+    )
+
+    return lol_game
+
+
+@pytest.fixture
+def filename(tmp_path):
+    return str(tmp_path / "games.lolar")
+
+
+@pytest.mark.parametrize("codec", ["json", "msgpack"])
+def test_round_trip(filename, codec):
+    lol_games = [make_keyed_game(seed) for seed in range(3)]
+
+    with LolGameArchive(filename, "a", codec=codec) as archive:
+        assert archive.extend(lol_games) == 3
+
+    with LolGameArchive(filename) as archive:
+        assert archive.codec == codec
+        assert len(archive) == 3
+        assert ("EUW1", 1) in archive
+        assert ["EUW1", 1] in archive
+        assert to_dict(archive.get(("EUW1", 1))) == to_dict(lol_games[1])
+        assert to_dict(archive[("EUW1", 2)]) == to_dict(lol_games[2])
+        assert [to_dict(g) for g in archive] == [to_dict(g) for g in lol_games]
+
+
+def test_keys(filename):
+    lol_game = make_keyed_game(0, game_hash="abc")
+
+    assert get_game_keys(lol_game) == [("EUW1", 0), "abc"]
+    assert get_game_keys(to_dict(lol_game)) == [("EUW1", 0), "abc"]
+
+    with LolGameArchive(filename, "a") as archive:
+        assert archive.append(lol_game) == [("EUW1", 0), "abc"]
+
+        assert len(archive) == 1
+        assert archive.get_bytes("abc") == archive.get_bytes(("EUW1", 0))
+        assert set(archive.keys()) == {("EUW1", 0), "abc"}
+
+        with pytest.raises(KeyError):
+            archive.get(("EUW1", 1))
+
+
+def test_keys_of_unregistered_sources():
+    lol_game = make_game(10)
+    lol_game.sources.other = {"platformId": "KR", "gameId": 1}
+    lol_game.sources.note = "no key"
+
+    assert get_game_keys(lol_game) == [("KR", 1)]
+    assert get_game_keys(to_dict(lol_game)) == [("KR", 1)]
+
+
+@pytest.mark.parametrize("codec", ["json", "msgpack"])
+def test_append_dict(filename, codec):
+    lol_game = make_keyed_game(0)
+
+    with LolGameArchive(filename, "a", codec=codec) as archive:
+        assert archive.append(to_dict(lol_game)) == [("EUW1", 0)]
+
+    with LolGameArchive(filename) as archive:
+        assert to_dict(archive.get(("EUW1", 0))) == to_dict(lol_game)
+
+
+def test_explicit_key(filename):
+    lol_game = make_game(10)
+
+    with LolGameArchive(filename, "a") as archive:
+        with pytest.raises(ValueError):
+            archive.append(lol_game)
+
+        archive.append(lol_game, key="custom")
+        archive.append(to_dict(lol_game), key=("KR", 1))
+
+    with LolGameArchive(filename) as archive:
+        assert to_dict(archive.get("custom")) == to_dict(lol_game)
+        assert to_dict(archive.get(("KR", 1))) == to_dict(lol_game)
+
+
+def test_read_mode(filename):
+    LolGameArchive(filename, "a").close()
+
+    with LolGameArchive(filename) as archive:
+        assert len(archive) == 0
+
+        with pytest.raises(ValueError):
+            archive.append(make_keyed_game(0))
+
+
+def test_invalid_arguments(filename, tmp_path):
+    with pytest.raises(ValueError):
+        LolGameArchive(filename, "w")
+    with pytest.raises(ValueError):
+        LolGameArchive(filename, "a", codec="pickle")
+
+    not_an_archive = tmp_path / "game.json"
+    not_an_archive.write_bytes(b"{}" * 16)
+
+    with pytest.raises(ValueError, match="not a lol_dto archive"):
+        LolGameArchive(str(not_an_archive))
+
+
+def test_games_are_visible_after_flush(filename):
+    writer = LolGameArchive(filename, "a")
+    writer.append(make_keyed_game(0))
+
+    # The game can be read by the writer before the flush
+    assert writer.get(("EUW1", 0)).duration == 600
+
+    with LolGameArchive(filename) as reader:
+        assert len(reader) == 0
+
+    writer.flush()
+
+    with LolGameArchive(filename) as reader:
+        assert len(reader) == 1
+
+    writer.close()
+
+
+def test_replace_and_compact(filename):
+    with LolGameArchive(filename, "a") as archive:
+        archive.append(make_keyed_game(0))
+        archive.append(make_keyed_game(1))
+
+    replacement = make_keyed_game(2)
+    replacement.sources.riotLolApi.gameId = 0
+
+    with LolGameArchive(filename, "a") as archive:
+        archive.append(replacement)
+
+        assert len(archive) == 2
+        assert to_dict(archive.get(("EUW1", 0))) == to_dict(replacement)
+
+    with LolGameArchive(filename) as archive:
+        garbage_size = archive.garbage_size
+        games = [to_dict(g) for g in archive]
+
+    assert garbage_size > 0
+
+    compact_archive(filename)
+
+    with LolGameArchive(filename) as archive:
+        assert archive.garbage_size == 0
+        assert len(archive) == 2
+        assert [to_dict(g) for g in archive] == games
+        assert to_dict(archive.get(("EUW1", 0))) == to_dict(replacement)
+
+
+def test_interrupted_append(filename):
+    with LolGameArchive(filename, "a") as archive:
+        archive.append(make_keyed_game(0))
+
+    # An append that stopped before its footer, including trailer magic bytes in the game data
+    with open(filename, "ab") as file:
+        file.write(b'{"incomplete":"' + TRAILER_MAGIC + b'"' + b"\0" * 40)
+
+    with LolGameArchive(filename, "a") as archive:
+        assert archive.keys() == [("EUW1", 0)]
+        assert archive.garbage_size > 0
+
+        archive.append(make_keyed_game(1))
+
+    with LolGameArchive(filename) as archive:
+        assert len(archive) == 2
+        assert archive.get(("EUW1", 1)).duration == 600
+
+
+def test_compact_classes(filename):
+    with LolGameArchive(filename, "a") as archive:
+        archive.append(make_keyed_game(0))
+
+    with LolGameArchive(filename, compact=True) as archive:
+        lol_game = archive.get(("EUW1", 0))
+
+    assert type(lol_game.teams.BLUE.players[0].snapshots[0]) is (
+        CompactLolGamePlayerSnapshot
+    )
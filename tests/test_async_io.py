@@ -0,0 +1,199 @@
+import asyncio
+import io
+import threading
+
+import pytest
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities import async_io, dump_json, to_dict
+from lol_dto.utilities.json_lines import dump_json_lines
+from lol_dto.utilities.lazy_list import LazyList
+
+# Upper bound on how long a test waits for another thread, only reached when the test fails
+TIMEOUT = 5
+
+
+def _check_not_in_event_loop():
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    raise AssertionError("Blocking file system call made in the event loop")
+
+
+class BlockingFile(io.StringIO):
+    """
+    A file where every read is a blocking call, like a file on a slow network file system
+    """
+
+    def read(self, *args):
+        _check_not_in_event_loop()
+        return super().read(*args)
+
+    def __next__(self):
+        _check_not_in_event_loop()
+        return super().__next__()
+
+
+@pytest.fixture
+def blocking_file_system(monkeypatch):
+    def blocking_open(filename, *args, **kwargs):
+        _check_not_in_event_loop()
+        with open(filename) as file:
+            return BlockingFile(file.read())
+
+    monkeypatch.setattr(async_io, "open", blocking_open, raising=False)
+    monkeypatch.setattr(async_io, "open_file", blocking_open)
+
+
+class DeserializeTracker:
+    """
+    Wraps async_io._deserialize to record how many games are created at the same time
+
+    The first game only finishes once concurrency - 1 other games have finished, which requires concurrency games to
+    be loaded at the same time, and makes games finish out of order.
+    """
+
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.finished = 0
+        self.others_finished = threading.Event()
+        self.deserialize = async_io._deserialize
+
+        if concurrency == 1:
+            self.others_finished.set()
+
+    def __call__(self, *args):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        game = self.deserialize(*args)
+
+        if game.duration == 0:
+            assert self.others_finished.wait(
+                TIMEOUT
+            ), "Games are not loaded concurrently"
+
+        with self.lock:
+            self.in_flight -= 1
+            if game.duration != 0:
+                self.finished += 1
+                if self.finished == self.concurrency - 1:
+                    self.others_finished.set()
+
+        return game
+
+
+async def _collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+def test_load_json_async_does_not_block(tmp_path, blocking_file_system):
+    filename = str(tmp_path / "game.json")
+    dump_json(LolGame(duration=1800, patch="11.1"), filename)
+
+    loaded = asyncio.run(async_io.load_json_async(filename))
+
+    assert loaded == LolGame(duration=1800, patch="11.1")
+
+
+def test_iter_games_async_does_not_block(tmp_path, blocking_file_system):
+    filename = str(tmp_path / "games.jsonl")
+    dump_json_lines([LolGame(duration=i) for i in range(40)], filename)
+
+    games = asyncio.run(_collect(async_io.iter_games_async(filename)))
+
+    assert [game.duration for game in games] == list(range(40))
+
+
+def test_blocking_file_system_is_detected(tmp_path, blocking_file_system):
+    filename = str(tmp_path / "game.json")
+    dump_json(LolGame(), filename)
+
+    async def blocking_load():
+        return async_io._read_text(filename)
+
+    with pytest.raises(AssertionError, match="in the event loop"):
+        asyncio.run(blocking_load())
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 4])
+@pytest.mark.parametrize("directory", [True, False])
+def test_iter_games_async_runs_concurrently_in_order(
+    tmp_path, monkeypatch, concurrency, directory
+):
+    games = [LolGame(duration=i) for i in range(10)]
+
+    if directory:
+        path = str(tmp_path)
+        for game in games:
+            dump_json(game, str(tmp_path / f"{game.duration}.json"))
+    else:
+        path = str(tmp_path / "games.jsonl")
+        dump_json_lines(games, path)
+
+    tracker = DeserializeTracker(concurrency)
+    monkeypatch.setattr(async_io, "_deserialize", tracker)
+
+    loaded = asyncio.run(
+        _collect(async_io.iter_games_async(path, concurrency=concurrency))
+    )
+
+    assert [game.duration for game in loaded] == list(range(10))
+    assert tracker.max_in_flight <= concurrency
+
+
+def test_dump_json_async(tmp_path, lol_game):
+    filename = str(tmp_path / "game.json")
+
+    asyncio.run(async_io.dump_json_async(lol_game, filename))
+    loaded = asyncio.run(async_io.load_json_async(filename))
+
+    assert to_dict(loaded) == to_dict(lol_game)
+
+
+def test_load_json_async_fields_and_lazy(tmp_path, lol_game):
+    filename = str(tmp_path / "game.json")
+    dump_json(lol_game, filename)
+
+    loaded = asyncio.run(
+        async_io.load_json_async(filename, fields=["duration", "teams.*.bans"])
+    )
+    assert loaded.duration == lol_game.duration
+    assert loaded.teams.BLUE.bans == lol_game.teams.BLUE.bans
+    assert loaded.teams.BLUE.players == []
+
+    loaded = asyncio.run(async_io.load_json_async(filename, lazy=True))
+    assert isinstance(loaded.teams.BLUE.players[0].snapshots, LazyList)
+    assert to_dict(loaded) == to_dict(lol_game)
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_iter_games_async_directory(tmp_path, concurrency):
+    for i in range(5):
+        dump_json(LolGame(duration=i, patch="11.1"), str(tmp_path / f"{i}.json"))
+
+    loaded = asyncio.run(
+        _collect(
+            async_io.iter_games_async(
+                str(tmp_path),
+                concurrency=concurrency,
+                # A generator is only iterable once but is used for every game
+                fields=(field for field in ["duration"]),
+                lazy=True,
+            )
+        )
+    )
+
+    assert [game.duration for game in loaded] == list(range(5))
+    assert all(game.patch is None for game in loaded)
+
+
+def test_iter_games_async_concurrency():
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(async_io.iter_games_async(".", concurrency=0)))
@@ -0,0 +1,116 @@
+import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities import dump_json, to_dict
+from lol_dto.utilities.batch import (
+    dump_json_batch,
+    from_json_batch,
+    load_json_batch,
+    map_batch,
+    to_json_batch,
+)
+
+
+# Functions run in workers need to be defined at the module level
+def _square(x: int) -> int:
+    if x == 3:
+        raise ValueError("no threes")
+    return x * x
+
+
+def _make_unpicklable(x: int):
+    return threading.Lock() if x == 2 else x
+
+
+def _exit_worker(x: int) -> int:
+    if x == 2:
+        os._exit(1)
+    return x
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_map_batch_captures_errors(ordered):
+    results = list(
+        map_batch(_square, range(6), max_workers=2, max_in_flight=3, ordered=ordered)
+    )
+    results.sort(key=lambda r: r.index)
+
+    assert [r.index for r in results] == list(range(6))
+    assert [r.value for r in results if r.ok] == [0, 1, 4, 16, 25]
+    assert not results[3].ok
+    assert "ValueError: no threes" in results[3].error
+
+
+def test_map_batch_ordered_with_executor():
+    with ThreadPoolExecutor(4) as executor:
+        results = list(map_batch(_square, range(10, 20), executor=executor))
+
+    assert [r.value for r in results] == [x * x for x in range(10, 20)]
+
+
+def test_map_batch_unpicklable_item():
+    items = [0, 1, threading.Lock()]
+
+    results = list(map_batch(_make_unpicklable, items, max_workers=1))
+
+    assert [r.value for r in results] == [0, 1, None]
+    assert "pickle" in results[2].error
+
+
+def test_map_batch_unpicklable_result():
+    results = list(map_batch(_make_unpicklable, range(4), max_workers=2))
+
+    assert [r.ok for r in results] == [True, True, False, True]
+    assert "pickle" in results[2].error
+
+
+def test_map_batch_broken_pool():
+    results = list(map_batch(_exit_worker, range(6), max_workers=1, max_in_flight=2))
+
+    assert [r.index for r in results] == list(range(6))
+    assert [r.value for r in results[:2]] == [0, 1]
+    assert all("BrokenProcessPool" in r.error for r in results[2:])
+
+
+def test_games_batches(tmp_path, lol_game):
+    games = [lol_game, LolGame(duration=60)]
+    filenames = [str(tmp_path / f"{i}.json") for i in range(2)]
+
+    results = list(dump_json_batch(zip(games, filenames), max_workers=2))
+    assert [r.value for r in results] == filenames
+
+    results = list(load_json_batch(filenames + ["missing.json"], max_workers=2))
+    assert [to_dict(r.value) for r in results[:2]] == [to_dict(g) for g in games]
+    assert "FileNotFoundError" in results[2].error
+
+    json_strings = [r.value for r in to_json_batch(games, max_workers=2)]
+    results = list(from_json_batch(json_strings, max_workers=2))
+    assert [to_dict(r.value) for r in results] == [to_dict(g) for g in games]
+
+
+def test_games_batches_loading_options(tmp_path, lol_game):
+    filename = str(tmp_path / "game.json")
+    dump_json(lol_game, filename)
+    json_string = json.dumps(to_dict(lol_game))
+
+    for results in [
+        load_json_batch([filename], fields=iter(["duration"]), max_workers=1),
+        from_json_batch([json_string], fields=iter(["duration"]), max_workers=1),
+    ]:
+        (game,) = [r.value for r in results]
+        assert game.duration == lol_game.duration
+        assert game.teams.BLUE.players == []
+
+    for results in [
+        load_json_batch([filename], compact=True, max_workers=1),
+        from_json_batch([json_string], compact=True, max_workers=1),
+    ]:
+        (game,) = [r.value for r in results]
+        snapshots = game.teams.BLUE.players[0].snapshots
+        assert type(snapshots[0]).__module__ == "lol_dto.classes.game.compact"
+        assert to_dict(game) == to_dict(lol_game)
@@ -0,0 +1,81 @@
+import pytest
+
+from lol_dto.utilities import to_dict
+from lol_dto.utilities.validation import validate_game
+from benchmarks import suite
+from benchmarks.synthetic_game import make_game
+
+
+def test_make_game_is_deterministic():
+    assert to_dict(make_game(seed=3)) == to_dict(make_game(seed=3))
+    assert to_dict(make_game(seed=3)) != to_dict(make_game(seed=4))
+
+
+@pytest.mark.parametrize("duration_minutes", [1, 15, 35, 60])
+@pytest.mark.parametrize("seed", range(5))
+def test_make_game_is_valid(duration_minutes, seed):
+    lol_game = make_game(duration_minutes, seed)
+
+    assert validate_game(lol_game) == []
+    assert len(lol_game.teams.BLUE.players[0].snapshots) == duration_minutes + 1
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_make_game_winner_destroys_nexus(seed):
+    lol_game = make_game(seed=seed)
+    teams = dict(zip(("BLUE", "RED"), lol_game.teams))
+    winner = teams.pop(lol_game.winner)
+    (loser,) = teams.values()
+
+    nexus_kill = winner.buildingsKills[-1]
+    assert nexus_kill.type == "NEXUS"
+    assert nexus_kill.timestamp <= lol_game.duration
+
+    nexus_turrets = [b for b in winner.buildingsKills if b.turretLocation == "NEXUS"]
+    assert len(nexus_turrets) == 2
+    assert any(
+        b.type == "INHIBITOR" and b.timestamp <= nexus_turrets[0].timestamp
+        for b in winner.buildingsKills
+    )
+
+    assert all(b.timestamp <= nexus_turrets[0].timestamp for b in loser.buildingsKills)
+    assert not any(
+        b.type == "NEXUS" or b.turretLocation == "NEXUS" for b in loser.buildingsKills
+    )
+    assert winner.endOfGameStats.turretKills > loser.endOfGameStats.turretKills
+
+
+def test_measure_prepares_before_each_call():
+    calls = []
+
+    def prepare():
+        calls.append("prepare")
+        return len(calls)
+
+    def function(argument):
+        assert argument == len(calls)
+        calls.append("run")
+
+    result = suite.measure(function, prepare, repeat=2, number=3)
+
+    assert calls == ["prepare", "run"] * 6
+    assert result["repeat"] == 2 and result["number"] == 3
+    assert 0 <= result["min"] <= result["median"]
+
+
+def test_run_and_compare(capsys):
+    before = suite.run(["to_dict", "json_size"], repeat=2, number=1, duration_minutes=5)
+
+    assert set(before["results"]) == {"to_dict", "json_size"}
+    assert before["metadata"]["duration_minutes"] == 5
+
+    after = {
+        "metadata": before["metadata"],
+        "results": {
+            "to_dict": {**before["results"]["to_dict"], "median": 1e9},
+            "json_size": before["results"]["json_size"],
+        },
+    }
+
+    assert suite.compare(before, after) == ["to_dict"]
+    assert suite.compare(before, before) == []
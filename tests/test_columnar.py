@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import pytest
+
+from lol_dto.utilities.columnar import dump_parquet, games_to_columns, games_to_tables
+
+
+def test_games_to_columns(lol_game):
+    tables = games_to_columns([lol_game, lol_game])
+    snapshots = tables["snapshots"]
+    player = lol_game.teams.BLUE.players[0]
+
+    count = sum(len(p.snapshots) for team in lol_game.teams for p in team.players)
+    assert all(len(column) == 2 * count for column in snapshots.values())
+
+    assert snapshots["gameIndex"][0] == 0 and snapshots["gameIndex"][-1] == 1
+    assert snapshots["playerId"][0] == player.id
+    assert snapshots["position.x"][0] == player.snapshots[0].position.x
+    assert snapshots["totalGold"][: len(player.snapshots)] == [
+        s.totalGold for s in player.snapshots
+    ]
+
+    assert len(tables["kills"]["gameIndex"]) == 2 * len(lol_game.kills)
+    assert "playerId" not in tables["kills"]
+
+
+def test_dump_parquet(tmp_path, lol_game):
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    paths = dump_parquet([lol_game], str(tmp_path / "games"))
+
+    assert set(paths) == set(games_to_tables([lol_game]))
+    table = parquet.read_table(paths["itemsEvents"])
+    assert table.num_rows == sum(
+        len(p.itemsEvents) for team in lol_game.teams for p in team.players
+    )
+
+
+def test_pyarrow_is_imported_on_first_use():
+    code = (
+        "import sys, lol_dto.utilities.columnar; " "assert 'pyarrow' not in sys.modules"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_missing_pyarrow(monkeypatch, lol_game):
+    # A None entry in sys.modules makes the import fail
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match=r"lol_dto\[arrow\]"):
+        games_to_tables([lol_game])
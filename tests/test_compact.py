@@ -0,0 +1,119 @@
+import pytest
+
+from lol_dto.classes.game import (
+    LolEvent,
+    LolGamePlayerItemEvent,
+    LolGamePlayerSnapshot,
+    LolGamePlayerWardEvent,
+)
+from lol_dto.classes.game.compact import (
+    COMPACT_CLASSES,
+    CompactLolGamePlayerItemEvent,
+    CompactLolGamePlayerSnapshot,
+    get_original_class,
+    with_compact_classes,
+)
+from lol_dto.utilities import from_dict, to_dict
+from lol_dto.utilities.live import LiveLolGameBuilder
+from lol_dto.utilities.spatial_index import SpatialIndex
+
+
+@pytest.fixture
+def compact_game(game_dict):
+    return from_dict(game_dict, compact=True)
+
+
+def test_compact_objects_have_no_dict(compact_game):
+    snapshot = compact_game.teams.BLUE.players[0].snapshots[0]
+
+    assert type(snapshot) is CompactLolGamePlayerSnapshot
+    assert not hasattr(snapshot, "__dict__")
+    assert not hasattr(snapshot.position, "__dict__")
+
+
+def test_compact_game_round_trip(lol_game, compact_game):
+    assert to_dict(compact_game) == to_dict(lol_game)
+
+
+def test_compact_objects_equal_original_objects(lol_game, compact_game):
+    player, compact_player = (
+        lol_game.teams.BLUE.players[0],
+        compact_game.teams.BLUE.players[0],
+    )
+
+    assert compact_player.snapshots[3] == player.snapshots[3]
+    assert player.snapshots[3] == compact_player.snapshots[3]
+    assert compact_player.itemsEvents == player.itemsEvents
+    assert compact_player.snapshots[3] != player.snapshots[4]
+    assert compact_player == player
+
+
+def test_compact_events_are_instances_of_original_classes(compact_game):
+    event = compact_game.teams.BLUE.players[0].itemsEvents[0]
+
+    assert type(event) is CompactLolGamePlayerItemEvent
+    assert isinstance(event, LolGamePlayerItemEvent)
+    assert isinstance(event, LolEvent)
+
+
+def test_with_compact_classes():
+    assert with_compact_classes(LolGamePlayerSnapshot) == (
+        LolGamePlayerSnapshot,
+        CompactLolGamePlayerSnapshot,
+    )
+    assert set(with_compact_classes(LolEvent)) >= {
+        LolEvent,
+        COMPACT_CLASSES[LolGamePlayerWardEvent],
+    }
+    assert get_original_class(CompactLolGamePlayerItemEvent) is LolGamePlayerItemEvent
+    assert get_original_class(LolGamePlayerItemEvent) is LolGamePlayerItemEvent
+
+
+@pytest.mark.parametrize(
+    "event_class", [LolGamePlayerItemEvent, LolGamePlayerWardEvent, LolEvent]
+)
+def test_event_index_on_compact_game(lol_game, compact_game, event_class):
+    events = compact_game.event_index.for_class(event_class)
+
+    assert len(events) == len(lol_game.event_index.for_class(event_class)) > 0
+    assert [e.event for e in events] == [
+        e.event for e in lol_game.event_index.for_class(event_class)
+    ]
+
+    player_events = compact_game.event_index.between(
+        player_id=1, event_class=event_class
+    )
+    assert player_events and all(
+        isinstance(e.event, with_compact_classes(event_class)) for e in player_events
+    )
+
+
+def test_spatial_index_on_compact_game(lol_game, compact_game):
+    index, compact_index = SpatialIndex(), SpatialIndex()
+    index.add_game(lol_game)
+    compact_index.add_game(compact_game)
+
+    for region in ("river", "blue_base"):
+        positions = compact_index.in_region(region, LolGamePlayerSnapshot)
+
+        assert positions
+        assert len(positions) == len(index.in_region(region, LolGamePlayerSnapshot))
+
+    assert (
+        compact_index.heatmap(item_class=LolGamePlayerSnapshot).sum()
+        == index.heatmap(item_class=LolGamePlayerSnapshot).sum()
+        > 0
+    )
+
+
+def test_live_builder_accepts_compact_events(compact_game):
+    player = compact_game.teams.BLUE.players[0]
+    builder = LiveLolGameBuilder()
+    builder.add_player("BLUE", type(player)(id=player.id))
+
+    builder.add_player_event(player.id, player.snapshots[0])
+    builder.add_player_event(player.id, player.itemsEvents[0])
+
+    snapshot = builder.snapshot().teams.BLUE.players[0]
+    assert snapshot.snapshots == [player.snapshots[0]]
+    assert snapshot.itemsEvents == [player.itemsEvents[0]]
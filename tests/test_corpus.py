@@ -0,0 +1,144 @@
+import pytest
+
+from lol_dto.classes.sources.riot_lol_api import RiotPlayerSource
+from lol_dto.utilities.corpus import DEFAULT_INDEXES, LolGameCorpus
+from benchmarks.synthetic_game import make_game
+
+PATCHES = ("12.3", "12.4", "12.5")
+QUEUES = (420, 440)
+
+
+@pytest.fixture(scope="module")
+def games():
+    games = []
+
+    for seed in range(12):
+        lol_game = make_game(15, seed=seed)
+        lol_game.patch = PATCHES[seed % len(PATCHES)]
+        lol_game.queue_id = QUEUES[seed % len(QUEUES)]
+
+        # Players puuids are shared between games
+        for index, player in enumerate(lol_game.teams.BLUE.players):
+            player.sources.riotLolApi = RiotPlayerSource(puuid=f"{seed % 4}-{index}")
+
+        games.append(lol_game)
+
+    return games
+
+
+@pytest.fixture
+def corpus(games):
+    return LolGameCorpus(games)
+
+
+def brute_force_query(games, **criteria) -> list:
+    def matches(lol_game, name, value) -> bool:
+        values = set(DEFAULT_INDEXES[name](lol_game))
+        if isinstance(value, (list, tuple, set)):
+            return bool(values & set(value))
+        return value in values
+
+    return [
+        g
+        for g in games
+        if all(matches(g, name, value) for name, value in criteria.items())
+    ]
+
+
+def test_query(corpus, games):
+    champion_id = games[0].teams.BLUE.players[0].championId
+    banned_id = next(pb.championId for pb in games[1].picksBans if pb.isBan)
+
+    for criteria in (
+        {"patch": "12.3"},
+        {"patch": "12.4", "queue_id": 440},
+        {"pick": champion_id},
+        {"pick": champion_id, "winner": "BLUE"},
+        {"ban": banned_id, "patch": ["12.3", "12.5"]},
+        {"puuid": "1-2"},
+        {"puuid": ["0-0", "3-0"], "queue_id": 420},
+    ):
+        expected = brute_force_query(games, **criteria)
+
+        assert corpus.query(**criteria) == expected, criteria
+        assert corpus.count(**criteria) == len(expected)
+
+
+def test_query_without_match(corpus):
+    assert corpus.query(patch="10.1") == []
+    assert corpus.query(patch="12.3", queue_id=999) == []
+    assert corpus.query(pick=[]) == []
+    assert corpus.count(puuid="unknown") == 0
+
+
+def test_query_without_criteria(corpus, games):
+    assert corpus.query() == games
+
+
+def test_unknown_index(corpus):
+    with pytest.raises(KeyError):
+        corpus.query(duration=900)
+
+
+def test_add_and_remove(corpus, games):
+    assert len(corpus) == len(games)
+    assert games[0] in corpus
+    assert corpus.add(games[0]) == 0
+    assert len(corpus) == len(games)
+
+    corpus.remove(games[0])
+
+    assert games[0] not in corpus
+    assert games[0] not in corpus.query(patch="12.3")
+    assert list(corpus) == games[1:]
+
+    with pytest.raises(KeyError):
+        corpus.remove(games[0])
+
+    # Re-added games get a new key and are returned last
+    assert corpus.add(games[0]) == len(games)
+    assert corpus.query(patch="12.3")[-1] is games[0]
+
+
+def test_removed_values_are_deleted(games):
+    corpus = LolGameCorpus(games[:1])
+    corpus.remove(games[0])
+
+    assert corpus.values("patch") == []
+    assert corpus.values("pick") == []
+
+
+def test_update(corpus, games):
+    games[1].patch = "13.1"
+
+    assert corpus.query(patch="13.1") == []
+
+    corpus.update(games[1])
+
+    assert corpus.query(patch="13.1") == [games[1]]
+    assert games[1] not in corpus.query(patch=PATCHES[1])
+
+    games[1].patch = PATCHES[1]
+    corpus.update(games[1])
+
+
+def test_values(corpus):
+    assert sorted(corpus.values("patch")) == list(PATCHES)
+    assert sorted(corpus.values("queue_id")) == list(QUEUES)
+
+
+def test_custom_indexes(games):
+    corpus = LolGameCorpus(games, indexes={"long": lambda g: (g.duration > 600,)})
+
+    assert corpus.query(long=True) == [g for g in games if g.duration > 600]
+
+    with pytest.raises(KeyError):
+        corpus.query(patch="12.3")
+
+
+def test_memory_usage(corpus):
+    usage = corpus.memory_usage()
+
+    assert set(usage) == set(DEFAULT_INDEXES) | {"games", "total"}
+    assert usage["total"] == sum(v for k, v in usage.items() if k != "total")
+    assert usage["pick"] > usage["patch"] > 0
@@ -0,0 +1,73 @@
+import copy
+import dataclasses
+import json
+
+from lol_dto.classes.game import LolGame, LolGamePlayerItemEvent
+from lol_dto.classes.sources.riot_lol_api import RiotGameSource
+from lol_dto.utilities import dump_json, from_dict, to_dict
+from lol_dto.utilities.dump_json import delete_empty_fields
+
+
+def test_same_output_as_asdict(lol_game):
+    full_dict = dataclasses.asdict(lol_game)
+
+    assert to_dict(lol_game, remove_empty=False) == full_dict
+    assert to_dict(lol_game) == delete_empty_fields(copy.deepcopy(full_dict))
+
+
+def test_sources_attributes_are_dumped():
+    lol_game = LolGame(duration=60)
+    lol_game.sources.riotLolApi = RiotGameSource(gameId=1)
+    lol_game.sources.custom = {"id": "a", "empty": None}
+
+    assert to_dict(lol_game)["sources"] == {
+        "riotLolApi": {"gameId": 1},
+        "custom": {"id": "a"},
+    }
+    assert to_dict(lol_game, remove_empty=False)["sources"]["custom"] == {
+        "id": "a",
+        "empty": None,
+    }
+
+
+def test_backrefs_are_not_followed(lol_game):
+    event = lol_game.teams.BLUE.players[0].itemsEvents[0]
+
+    assert event.game is lol_game
+    assert "game" not in to_dict(event)
+
+
+def test_sequences_are_dumped_as_lists():
+    lol_game = LolGame(
+        kills=(),
+        picksBans=tuple(),
+    )
+    player_events = (LolGamePlayerItemEvent(timestamp=1, id=2),)
+
+    assert to_dict(lol_game)["kills"] == []
+    assert to_dict(lol_game)["picksBans"] == []
+    assert [to_dict(e) for e in player_events] == [{"timestamp": 1, "id": 2}]
+
+
+def test_lazy_lists_are_dumped_from_raw_data(game_dict):
+    lazy_game = from_dict(game_dict, lazy=True)
+    snapshots = lazy_game.teams.BLUE.players[0].snapshots
+    snapshots[0].totalGold = -1
+
+    output = to_dict(lazy_game)
+
+    assert snapshots.built_count == 1
+    assert output["teams"]["BLUE"]["players"][0]["snapshots"][0]["totalGold"] == -1
+    assert output["teams"]["BLUE"]["players"][0]["snapshots"][1:] == (
+        game_dict["teams"]["BLUE"]["players"][0]["snapshots"][1:]
+    )
+
+
+def test_dump_json(tmp_path, lol_game, game_dict):
+    filename = tmp_path / "game.json"
+
+    dump_json(lol_game, str(filename))
+    assert json.loads(filename.read_text()) == game_dict
+
+    dump_json(lol_game, str(filename), remove_empty=False)
+    assert json.loads(filename.read_text()) == to_dict(lol_game, remove_empty=False)
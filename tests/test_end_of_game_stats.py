@@ -0,0 +1,109 @@
+import pytest
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGameKill,
+    LolGamePlayer,
+    LolGamePlayerEndOfGameStats,
+    LolGameTeamBuildingKill,
+)
+from lol_dto.classes.game.lol_game import LolGameTeams
+from lol_dto.classes.game.lol_game_team import LolGameTeam
+from lol_dto.utilities import to_dict
+from lol_dto.utilities.end_of_game_stats import (
+    EndOfGameStatsAggregator,
+    fill_end_of_game_stats,
+)
+from benchmarks.end_of_game_stats import (
+    _get_stats,
+    _make_empty_stats_game,
+    fill_with_passes,
+)
+
+
+def _make_game(kills) -> LolGame:
+    return LolGame(
+        teams=LolGameTeams(
+            BLUE=LolGameTeam(players=[LolGamePlayer(id=i) for i in range(1, 6)]),
+            RED=LolGameTeam(players=[LolGamePlayer(id=i) for i in range(6, 11)]),
+        ),
+        kills=kills,
+    )
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_same_stats_as_separate_passes(seed):
+    lol_game, expected = _make_empty_stats_game(seed), _make_empty_stats_game(seed)
+
+    fill_end_of_game_stats(lol_game)
+    fill_with_passes(expected)
+
+    assert _get_stats(lol_game) == _get_stats(expected)
+
+
+def test_multi_kills_and_sprees():
+    kills = [LolGameKill(timestamp=t, killerId=1, victimId=6) for t in (10, 15, 20)]
+    kills += [
+        LolGameKill(timestamp=100, killerId=6, victimId=1, assistsIds=[7]),
+        LolGameKill(timestamp=200, killerId=1, victimId=7),
+    ]
+
+    lol_game = fill_end_of_game_stats(_make_game(kills))
+    stats = lol_game.teams.BLUE.players[0].endOfGameStats
+
+    assert (stats.kills, stats.deaths, stats.assists) == (4, 1, 0)
+    assert (stats.doubleKills, stats.tripleKills) == (1, 1)
+    assert (stats.killingSprees, stats.largestKillingSpree) == (1, 3)
+    assert stats.firstBlood and not stats.firstBloodAssist
+    assert lol_game.teams.RED.players[1].endOfGameStats.assists == 1
+
+
+def test_incremental_updates(lol_game):
+    kills = list(lol_game.kills)
+    lol_game.kills = []
+    aggregator = EndOfGameStatsAggregator(lol_game)
+
+    for kill in kills:
+        lol_game.kills.append(kill)
+        aggregator.update().apply()
+
+    expected = fill_end_of_game_stats(_make_game(kills), overwrite=True)
+
+    for player, expected_player in zip(
+        lol_game.teams.BLUE.players, expected.teams.BLUE.players
+    ):
+        assert player.endOfGameStats.kills == expected_player.endOfGameStats.kills
+        assert (
+            player.endOfGameStats.largestKillingSpree
+            == expected_player.endOfGameStats.largestKillingSpree
+        )
+
+
+def test_existing_values_are_kept():
+    lol_game = _make_game([LolGameKill(timestamp=1, killerId=1, victimId=6)])
+    lol_game.teams.BLUE.players[0].endOfGameStats = LolGamePlayerEndOfGameStats(kills=7)
+
+    fill_end_of_game_stats(lol_game)
+    assert lol_game.teams.BLUE.players[0].endOfGameStats.kills == 7
+    assert lol_game.teams.RED.players[0].endOfGameStats.deaths == 1
+
+    fill_end_of_game_stats(lol_game, overwrite=True)
+    assert lol_game.teams.BLUE.players[0].endOfGameStats.kills == 1
+
+
+def test_missing_lists_are_not_counted():
+    lol_game = fill_end_of_game_stats(_make_game([]))
+
+    assert lol_game.teams.BLUE.endOfGameStats.turretKills is None
+    assert lol_game.teams.BLUE.players[0].endOfGameStats.kills is None
+
+    lol_game.teams.RED.buildingsKills.append(
+        LolGameTeamBuildingKill(timestamp=600, type="TURRET", killerId=7)
+    )
+    fill_end_of_game_stats(lol_game)
+
+    assert lol_game.teams.BLUE.endOfGameStats.turretKills == 0
+    assert lol_game.teams.RED.endOfGameStats.turretKills == 1
+    assert lol_game.teams.RED.endOfGameStats.firstTurret
+    assert lol_game.teams.RED.players[1].endOfGameStats.firstTurret
+    assert to_dict(lol_game.teams.BLUE.players[0].endOfGameStats)["turretKills"] == 0
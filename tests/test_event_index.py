@@ -0,0 +1,157 @@
+import pytest
+
+from lol_dto.classes.game import (
+    LolEvent,
+    LolGame,
+    LolGameKill,
+    LolGamePlayerItemEvent,
+    LolGamePlayerWardEvent,
+)
+from lol_dto.classes.game.lol_game_event_index import (
+    GAME_EVENTS_LISTS,
+    PLAYER_EVENTS_LISTS,
+    TEAM_EVENTS_LISTS,
+    EventIndex,
+)
+
+
+def get_all_events(lol_game) -> list:
+    """
+    Returns (event, player ids) for all events of the game, walking every events list
+    """
+    events = []
+
+    for list_name in GAME_EVENTS_LISTS:
+        for event in getattr(lol_game, list_name):
+            events.append(
+                (event, {event.killerId, event.victimId, *event.assistsIds} - {None})
+            )
+
+    for team in lol_game.teams:
+        for list_name in TEAM_EVENTS_LISTS:
+            for event in getattr(team, list_name):
+                events.append(
+                    (
+                        event,
+                        {event.killerId, *(event.assistsIds or ())} - {None},
+                    )
+                )
+
+        for player in team.players:
+            for list_name in PLAYER_EVENTS_LISTS:
+                events.extend((e, {player.id}) for e in getattr(player, list_name))
+
+    return events
+
+
+def ids(indexed_events) -> list:
+    return sorted(id(e.event) for e in indexed_events)
+
+
+def test_all_events_are_sorted(lol_game):
+    index = lol_game.event_index
+    timestamps = [e.timestamp for e in index]
+
+    assert len(index) == len(get_all_events(lol_game))
+    assert timestamps == sorted(timestamps)
+    assert ids(index.events) == sorted(id(e) for e, _ in get_all_events(lol_game))
+
+
+def test_between(lol_game):
+    index = lol_game.event_index
+    expected = [e for e, _ in get_all_events(lol_game) if 300 <= e.timestamp < 600]
+
+    assert ids(index.between(300, 600)) == sorted(id(e) for e in expected)
+    assert len(index.between(end=600)) + len(index.between(600)) == len(index)
+    assert index.between(600, 600) == []
+
+
+def test_for_player(lol_game):
+    index = lol_game.event_index
+    player_id = lol_game.teams.RED.players[1].id
+
+    expected = [e for e, players in get_all_events(lol_game) if player_id in players]
+
+    assert ids(index.for_player(player_id)) == sorted(id(e) for e in expected)
+    assert index.for_player(404) == []
+
+
+def test_for_type_and_class(lol_game):
+    index = lol_game.event_index
+    events = [e for e, _ in get_all_events(lol_game)]
+
+    assert ids(index.for_type("DRAGON")) == sorted(
+        id(e) for e in events if getattr(e, "type", None) == "DRAGON"
+    )
+    assert ids(index.for_class(LolGamePlayerWardEvent)) == sorted(
+        id(e) for e in events if isinstance(e, LolGamePlayerWardEvent)
+    )
+    assert len(index.for_class(LolEvent)) == len(index)
+    assert index.for_type("UNKNOWN") == []
+
+
+def test_combined_filters(lol_game):
+    index = lol_game.event_index
+    player = lol_game.teams.BLUE.players[0]
+
+    events = index.between(
+        120, 900, player_id=player.id, event_class=LolGamePlayerItemEvent
+    )
+
+    assert ids(events) == sorted(
+        id(e) for e in player.itemsEvents if 120 <= e.timestamp < 900
+    )
+    assert all(e.playerId == player.id and e.side == "BLUE" for e in events)
+    assert index.between(player_id=player.id, event_type="UNKNOWN") == []
+
+
+def test_small_game(small_game):
+    index = small_game.event_index
+
+    assert [(e.timestamp, e.playerId, e.side) for e in index] == [
+        (10, None, "BLUE"),
+        (20, None, None),
+        (30, 1, "BLUE"),
+    ]
+    assert [e.event for e in index.untimed] == [
+        small_game.teams.BLUE.players[0].itemsEvents[1]
+    ]
+    assert [e.timestamp for e in index.for_player(6)] == [20]
+    assert [e.timestamp for e in index.for_player(1)] == [10, 20, 30]
+
+
+def test_index_is_cached_and_rebuilt(small_game):
+    lol_game = small_game
+    index = lol_game.event_index
+
+    assert lol_game.event_index is index
+    assert index.is_up_to_date(lol_game)
+
+    # Appending to a list changes its length
+    lol_game.kills.append(LolGameKill(timestamp=40, victimId=1, assistsIds=[]))
+    assert lol_game.event_index is not index
+    assert len(lol_game.event_index) == 4
+
+    # Replacing a list with one of the same length
+    index = lol_game.event_index
+    lol_game.kills = list(lol_game.kills)
+    assert lol_game.event_index is not index
+
+
+def test_invalidate_event_index(small_game):
+    lol_game = small_game
+    index = lol_game.event_index
+
+    lol_game.kills[0].timestamp = 50
+    assert lol_game.event_index is index
+
+    lol_game.invalidate_event_index()
+    assert [e.timestamp for e in lol_game.event_index] == [10, 30, 50]
+
+
+def test_empty_game():
+    index = EventIndex(LolGame())
+
+    assert len(index) == 0
+    assert index.between(0, 100) == []
+    assert index.for_class(LolEvent) == []
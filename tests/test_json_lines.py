@@ -0,0 +1,54 @@
+import copy
+
+import pytest
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities import dump_json_lines, load_json_lines, to_dict
+
+
+@pytest.mark.parametrize("extension", [".jsonl", ".jsonl.gz", ".jsonl.zst"])
+def test_round_trip(tmp_path, lol_game, extension):
+    if extension.endswith(".zst"):
+        pytest.importorskip("zstandard")
+
+    filename = str(tmp_path / f"games{extension}")
+    games = [lol_game, LolGame(duration=60)]
+
+    assert dump_json_lines(iter(games), filename) == 2
+
+    loaded = list(load_json_lines(filename))
+    assert [to_dict(g) for g in loaded] == [to_dict(g) for g in games]
+
+
+def test_dump_dictionaries_does_not_modify_them(tmp_path):
+    filename = str(tmp_path / "games.jsonl")
+    data = {
+        "duration": 60,
+        "patch": None,
+        "teams": {"BLUE": {"players": [{"id": None}]}},
+    }
+    original = copy.deepcopy(data)
+
+    dump_json_lines([data], filename)
+
+    assert data == original
+    assert list(load_json_lines(filename, as_dict=True)) == [
+        {"duration": 60, "teams": {"BLUE": {"players": [{}]}}}
+    ]
+
+    dump_json_lines([data], filename, remove_empty=False)
+    assert list(load_json_lines(filename, as_dict=True)) == [original]
+
+
+def test_load_options(tmp_path, lol_game):
+    filename = str(tmp_path / "games.jsonl")
+    dump_json_lines([lol_game], filename)
+
+    (loaded,) = load_json_lines(filename, fields=["duration"], compact=True)
+    assert loaded.duration == lol_game.duration
+    assert loaded.teams.BLUE.players == []
+
+
+def test_unknown_compression(tmp_path):
+    with pytest.raises(ValueError):
+        dump_json_lines([], str(tmp_path / "games.jsonl"), compression="lzma")
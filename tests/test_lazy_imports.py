@@ -0,0 +1,90 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import lol_dto
+import lol_dto.classes.game
+from benchmarks.import_time import import_time
+
+OPTIONAL_MODULES = ["numpy", "pyarrow", "msgpack", "zstandard", "gzip", "lol_id_tools"]
+
+
+def get_imported_modules(statement: str) -> list:
+    """
+    Returns the modules imported by a statement, run in a fresh interpreter
+    """
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}\nimport sys, json\nprint(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return json.loads(process.stdout)
+
+
+def test_import_lol_dto():
+    modules = get_imported_modules("import lol_dto")
+
+    assert [m for m in modules if m.startswith("lol_dto")] == ["lol_dto"]
+    assert not set(OPTIONAL_MODULES) & set(modules)
+
+
+def test_import_single_class():
+    modules = get_imported_modules("from lol_dto.classes.game import Position")
+
+    assert [m for m in modules if m.startswith("lol_dto")] == [
+        "lol_dto",
+        "lol_dto.classes",
+        "lol_dto.classes.game",
+        "lol_dto.classes.game.position",
+    ]
+
+
+def test_import_utilities():
+    modules = get_imported_modules("import lol_dto.utilities")
+
+    assert not set(OPTIONAL_MODULES) & set(modules)
+    assert "lol_dto.utilities.timeline" not in modules
+    assert "lol_dto.classes.game.lol_game_event_index" not in modules
+
+
+def test_submodules_attributes():
+    assert lol_dto.classes.game.lol_game.LolGame is lol_dto.classes.game.LolGame
+    assert lol_dto.classes.sources.riot_lol_api.RiotGameSource
+    assert lol_dto.utilities.to_dict
+    assert lol_dto.names_helper.name_resolver.get_name
+
+    assert {"classes", "utilities", "names_helper"} <= set(dir(lol_dto))
+    assert {"LolGame", "Position", "compact"} <= set(dir(lol_dto.classes.game))
+
+
+def test_classes_attributes():
+    from lol_dto.classes.game import lol_game_event
+
+    for name in lol_dto.classes.game.__all__:
+        assert getattr(lol_dto.classes.game, name).__name__ == name
+
+    assert lol_dto.classes.game.LolGameKill is lol_game_event.LolGameKill
+
+
+@pytest.mark.parametrize(
+    "module", [lol_dto, lol_dto.classes, lol_dto.classes.game, lol_dto.classes.sources]
+)
+def test_unknown_attribute(module):
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        module.missing
+
+
+def test_import_time():
+    # Importing the package alone must stay a small fraction of importing the full class tree
+    assert (
+        import_time("lol_dto", number=3)
+        < import_time("lol_dto.classes.game.lol_game", number=3) / 4
+    )
@@ -0,0 +1,98 @@
+import pytest
+
+from lol_dto.classes.game import LolGame, LolGamePlayer, LolGamePlayerItemEvent
+from lol_dto.classes.game.lol_game import LolGameTeams
+from lol_dto.classes.game.lol_game_team import LolGameTeam
+from lol_dto.utilities import from_dict, to_dict
+from lol_dto.utilities.lazy_list import LazyList
+
+
+def _make_lazy_list(cache: bool = True) -> tuple:
+    created = []
+
+    def converter(value):
+        created.append(value)
+        return {"value": value}
+
+    return LazyList(list(range(5)), converter, cache), created
+
+
+def test_lazy_list_creates_objects_on_access():
+    lazy_list, created = _make_lazy_list()
+
+    assert len(lazy_list) == 5
+    assert created == []
+
+    assert lazy_list[-1] == {"value": 4}
+    assert lazy_list[1:3] == [{"value": 1}, {"value": 2}]
+    assert lazy_list[4] is lazy_list[4]
+    assert created == [4, 1, 2]
+    assert lazy_list.built_count == 3
+
+    with pytest.raises(IndexError):
+        lazy_list[5]
+
+
+def test_lazy_list_without_cache():
+    lazy_list, created = _make_lazy_list(cache=False)
+
+    assert lazy_list[0] == lazy_list[0]
+    assert lazy_list[0] is not lazy_list[0]
+    assert created == [0, 0, 0, 0]
+    assert lazy_list.built_count == 0
+
+
+def test_lazy_list_modifications_materialize():
+    lazy_list, created = _make_lazy_list()
+
+    lazy_list.append({"value": 5})
+    del lazy_list[0]
+
+    assert len(lazy_list) == 5
+    assert lazy_list == [{"value": v} for v in range(1, 6)]
+    assert list(lazy_list.iter_raw()) == [{"value": v} for v in range(1, 6)]
+
+
+def test_lazy_list_items_attribute():
+    lazy_list = LazyList([1, 2], lambda value: LolGamePlayerItemEvent(timestamp=value))
+    first = lazy_list[0]
+
+    lazy_list.set_items_attribute("game", "game")
+
+    assert first.game == "game"
+    assert lazy_list[1].game == "game"
+
+
+def test_from_dict_lazy(lol_game, game_dict):
+    lazy_game = from_dict(game_dict, lazy=True)
+    player = lazy_game.teams.BLUE.players[0]
+
+    assert isinstance(player.snapshots, LazyList)
+    assert isinstance(lazy_game.kills, LazyList)
+    assert player.snapshots.built_count == 0
+
+    assert player.itemsEvents[0].game is lazy_game
+    assert player.snapshots[0] is player.snapshots[0]
+    assert to_dict(lazy_game) == game_dict
+    assert lazy_game == lol_game
+
+
+def test_from_dict_lazy_uncached(lol_game, game_dict):
+    lazy_game = from_dict(game_dict, lazy="uncached")
+    player = lazy_game.teams.BLUE.players[0]
+
+    assert isinstance(player.snapshots, LazyList)
+    assert player.snapshots[0] is not player.snapshots[0]
+    assert player.snapshots.built_count == 0
+    assert player.itemsEvents[0].game is lazy_game
+    assert to_dict(lazy_game) == game_dict
+
+
+@pytest.mark.parametrize("items_type", [list, tuple])
+def test_game_with_items_events_iterable(items_type):
+    events = [LolGamePlayerItemEvent(timestamp=t) for t in range(3)]
+    player = LolGamePlayer(itemsEvents=items_type(events))
+
+    lol_game = LolGame(teams=LolGameTeams(BLUE=LolGameTeam(players=[player])))
+
+    assert all(event.game is lol_game for event in events)
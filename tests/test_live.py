@@ -0,0 +1,263 @@
+import copy
+import pickle
+
+import pytest
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGameKill,
+    LolGamePlayer,
+    LolGamePlayerEndOfGameStats,
+    LolGamePlayerItem,
+    LolGamePlayerItemEvent,
+    LolGamePlayerRune,
+    LolGamePlayerSnapshot,
+    LolGamePlayerSummonerSpell,
+    LolGamePlayerWardEvent,
+    LolGameTeamBuildingKill,
+    Position,
+)
+from lol_dto.utilities import to_dict
+from lol_dto.utilities.live import (
+    PLAYER_LISTS,
+    TEAM_LISTS,
+    LiveLolGameBuilder,
+    PrefixView,
+)
+
+
+def get_empty_game(lol_game: LolGame) -> LolGame:
+    """
+    Returns a copy of the game without kills, team events, player events and snapshots
+    """
+    lol_game = copy.deepcopy(lol_game)
+    lol_game.kills = []
+
+    for team in lol_game.teams:
+        for list_name in TEAM_LISTS.values():
+            setattr(team, list_name, [])
+
+        for player in team.players:
+            for list_name in PLAYER_LISTS.values():
+                setattr(player, list_name, [])
+
+    return lol_game
+
+
+def replay(builder: LiveLolGameBuilder, lol_game: LolGame):
+    for kill in lol_game.kills:
+        builder.add_kill(kill)
+
+    for side, team in zip(("BLUE", "RED"), lol_game.teams):
+        for list_name in TEAM_LISTS.values():
+            for event in getattr(team, list_name):
+                builder.add_team_event(side, event)
+
+        for player in team.players:
+            for list_name in PLAYER_LISTS.values():
+                for event in getattr(player, list_name):
+                    builder.add_player_event(player.id, event)
+
+
+def make_builder() -> LiveLolGameBuilder:
+    builder = LiveLolGameBuilder()
+    builder.add_player("BLUE", LolGamePlayer(id=1))
+    builder.add_player("RED", LolGamePlayer(id=6))
+
+    return builder
+
+
+def test_prefix_view():
+    buffer = [1, 2, 3]
+    view = PrefixView(buffer)
+    buffer.append(4)
+
+    assert len(view) == 3
+    assert list(view) == [1, 2, 3]
+    assert view[-1] == 3
+    assert view[1:] == [2, 3]
+    assert view == [1, 2, 3]
+    assert view != [1, 2, 3, 4]
+    assert repr(view) == "[1, 2, 3]"
+
+    with pytest.raises(IndexError):
+        view[3]
+
+    assert PrefixView(buffer, 1) == [1]
+    assert pickle.loads(pickle.dumps(view)) == [1, 2, 3]
+    assert type(copy.deepcopy(view)) is list
+
+
+def test_replay_game(lol_game):
+    builder = LiveLolGameBuilder(get_empty_game(lol_game))
+    replay(builder, lol_game)
+
+    snapshot = builder.snapshot()
+
+    assert to_dict(snapshot) == to_dict(lol_game)
+    assert snapshot.teams.BLUE.players[0].game is snapshot
+    assert len(snapshot.event_index) == len(lol_game.event_index)
+
+
+def test_snapshot_is_not_affected_by_additions():
+    builder = make_builder()
+    builder.add_kill(LolGameKill(timestamp=10, killerId=1, victimId=6))
+    builder.add_player_event(1, LolGamePlayerItemEvent(timestamp=5, id=1055))
+
+    snapshot = builder.snapshot()
+    snapshot_dict = to_dict(snapshot)
+
+    builder.add_kill(LolGameKill(timestamp=20, killerId=6, victimId=1))
+    builder.add_player_event(1, LolGamePlayerItemEvent(timestamp=30, id=3031))
+    builder.add_team_event("BLUE", LolGameTeamBuildingKill(timestamp=40))
+    builder.add_player("BLUE", LolGamePlayer(id=2))
+    builder.set_fields(duration=60)
+
+    assert to_dict(snapshot) == snapshot_dict
+    assert len(snapshot.kills) == 1
+    assert len(builder.snapshot().kills) == 2
+    assert builder.snapshot().duration == 60
+    assert len(builder.snapshot().teams.BLUE.players) == 2
+
+
+def test_snapshot_is_cached():
+    builder = make_builder()
+    snapshot = builder.snapshot()
+
+    assert builder.snapshot() is snapshot
+
+    builder.add_kill(LolGameKill(timestamp=10))
+    assert builder.snapshot() is not snapshot
+
+
+def test_list_names():
+    builder = make_builder()
+    snapshot = LolGamePlayerSnapshot(timestamp=60, position=Position(x=1, y=2))
+    ward = LolGamePlayerWardEvent(timestamp=70, type="PLACED")
+
+    builder.add_player_event(1, snapshot)
+    builder.add_player_event(1, ward)
+    builder.add_team_event("RED", LolGameTeamBuildingKill(timestamp=80))
+
+    player = builder.lol_game.teams.BLUE.players[0]
+    assert player.snapshots == [snapshot]
+    assert player.wardsEvents == [ward]
+    assert len(builder.lol_game.teams.RED.buildingsKills) == 1
+
+    with pytest.raises(ValueError):
+        builder.add_player_event(1, LolGameKill(timestamp=10))
+
+    builder.add_player_event(1, ward, "specialKills")
+    assert player.specialKills == [ward]
+
+
+def test_items_events_backref():
+    builder = make_builder()
+    event = LolGamePlayerItemEvent(timestamp=5, id=1055)
+
+    builder.add_player_event(1, event)
+
+    assert event.game is builder.lol_game
+
+
+def test_delta_since():
+    builder = make_builder()
+    builder.set_fields(duration=60, winner="BLUE")
+    builder.add_kill(LolGameKill(timestamp=10, killerId=1, victimId=6))
+    kill = LolGameKill(timestamp=20, killerId=6, victimId=1)
+    builder.add_kill(kill)
+    builder.add_player_event(6, LolGamePlayerItemEvent(timestamp=15, id=1055))
+    builder.add_player_event(6, LolGamePlayerItemEvent(timestamp=None, id=1056))
+
+    delta = builder.delta_since(10)
+
+    assert delta["duration"] == 60
+    assert delta["winner"] == "BLUE"
+    assert delta["kills"] == [to_dict(kill)]
+    assert delta["teams"] == {
+        "RED": {"players": [{"id": 6, "itemsEvents": [{"timestamp": 15, "id": 1055}]}]}
+    }
+
+    assert "kills" not in builder.delta_since(20)
+    assert "teams" not in builder.delta_since(20)
+
+    # Events added after the first delta are taken into account
+    builder.add_kill(LolGameKill(timestamp=30))
+    assert [k["timestamp"] for k in builder.delta_since(20)["kills"]] == [30]
+
+
+def test_delta_since_unsorted():
+    builder = make_builder()
+
+    for timestamp in 30, 10, 20:
+        builder.add_kill(LolGameKill(timestamp=timestamp))
+
+    assert [k["timestamp"] for k in builder.delta_since(15)["kills"]] == [30, 20]
+
+
+def test_delta_since_remove_empty():
+    builder = make_builder()
+    builder.add_kill(LolGameKill(timestamp=10))
+
+    assert builder.delta_since(0, remove_empty=False)["kills"] == [
+        to_dict(LolGameKill(timestamp=10), remove_empty=False)
+    ]
+
+
+def test_end_of_game_stats():
+    builder = LiveLolGameBuilder(end_of_game_stats=True)
+    builder.add_player("BLUE", LolGamePlayer(id=1))
+    builder.add_player("RED", LolGamePlayer(id=6))
+
+    builder.add_kill(LolGameKill(timestamp=10, killerId=1, victimId=6, assistsIds=[]))
+    first_snapshot = builder.snapshot()
+
+    builder.add_kill(LolGameKill(timestamp=20, killerId=1, victimId=6, assistsIds=[]))
+    second_snapshot = builder.snapshot()
+
+    assert first_snapshot.teams.BLUE.players[0].endOfGameStats.kills == 1
+    assert second_snapshot.teams.BLUE.players[0].endOfGameStats.kills == 2
+    assert second_snapshot.teams.RED.players[0].endOfGameStats.deaths == 2
+
+    delta = builder.delta_since(20)
+    assert delta["teams"]["BLUE"]["players"][0]["endOfGameStats"]["kills"] == 2
+
+
+def test_snapshot_freezes_other_lists():
+    builder = make_builder()
+    builder.lol_game.teams.BLUE.bans = [157]
+    builder.lol_game.teams.BLUE.players[0].endOfGameStats = LolGamePlayerEndOfGameStats(
+        items=[]
+    )
+    builder.add_player_event(1, 60.0, "levelUpEvents")
+
+    snapshot = builder.snapshot()
+    snapshot_dict = to_dict(snapshot)
+
+    player = builder.lol_game.teams.BLUE.players[0]
+    builder.add_player_event(1, 120.0, "levelUpEvents")
+    player.runes.append(LolGamePlayerRune(slot=0, id=8005))
+    player.summonerSpells.append(LolGamePlayerSummonerSpell(slot=0, id=4))
+    player.endOfGameStats.items.append(LolGamePlayerItem(slot=0, id=3031))
+    builder.lol_game.teams.BLUE.bans.append(1)
+
+    assert to_dict(snapshot) == snapshot_dict
+    assert snapshot.teams.BLUE.players[0].levelUpEvents == [60.0]
+    assert builder.snapshot().teams.BLUE.players[0].levelUpEvents == [60.0, 120.0]
+
+
+def test_delta_since_level_ups():
+    builder = make_builder()
+
+    for timestamp in 60.0, 150.0, 240.0:
+        builder.add_player_event(6, timestamp, "levelUpEvents")
+
+    assert builder.delta_since(100)["teams"] == {
+        "RED": {"players": [{"id": 6, "levelUpEvents": [150.0, 240.0]}]}
+    }
+
+    builder.add_player_event(6, 200.0, "levelUpEvents")
+    assert builder.delta_since(190)["teams"]["RED"]["players"][0]["levelUpEvents"] == [
+        240.0,
+        200.0,
+    ]
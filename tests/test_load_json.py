@@ -0,0 +1,179 @@
+import dataclasses
+import typing
+
+import pytest
+
+from lol_dto.classes.game import LolGame
+from lol_dto.classes.game.lol_game import LolPickBan
+from lol_dto.classes.sources.riot_lol_api import RiotGameSource
+from lol_dto.utilities import dump_json, from_dict, load_json, to_dict
+from lol_dto.utilities.class_tree import unwrap_optional
+from lol_dto.utilities.load_json import (
+    SOURCES_CLASSES,
+    _converters,
+    parse_fields,
+    register_source,
+)
+
+
+def _get_paths(cls: type, path: str = "") -> typing.Iterator[typing.Tuple[type, str]]:
+    """
+    Yields every dataclass of the tree with the fields path leading to it, like 'teams.*.players.*.runes.*'
+    """
+    yield cls, path
+    type_hints = typing.get_type_hints(cls)
+
+    for f in dataclasses.fields(cls):
+        type_hint = unwrap_optional(type_hints[f.name])
+        field_path = f"{path}.{f.name}" if path else f.name
+
+        if getattr(type_hint, "__origin__", None) is list:
+            type_hint = unwrap_optional(type_hint.__args__[0])
+            field_path += ".*"
+
+        if isinstance(type_hint, type) and dataclasses.is_dataclass(type_hint):
+            yield from _get_paths(type_hint, field_path)
+
+
+def _has_required_fields(cls: type) -> bool:
+    return any(
+        f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING
+        for f in dataclasses.fields(cls)
+    )
+
+
+@pytest.fixture
+def full_dict(game_dict):
+    # The synthetic game has no pauses and spells uses, which have their own classes
+    game_dict["pauses"] = [{"realTimestamp": "2022-02-10T18:10:00", "type": "PAUSE"}]
+    player = game_dict["teams"]["BLUE"]["players"][0]
+    player["spellsUses"] = [{"timestamp": 10.0, "key": "Q", "cooldown": 8.0}]
+
+    return game_dict
+
+
+CLASSES_WITH_REQUIRED_FIELDS = [
+    (cls, path) for cls, path in _get_paths(LolGame) if _has_required_fields(cls)
+]
+
+
+@pytest.mark.parametrize(
+    "cls, path",
+    CLASSES_WITH_REQUIRED_FIELDS,
+    ids=[path for _, path in CLASSES_WITH_REQUIRED_FIELDS],
+)
+def test_projection_keeps_required_fields(full_dict, cls, path):
+    for f in dataclasses.fields(cls):
+        field_path = f"{path}.{f.name}" if path else f.name
+        lol_game = from_dict(full_dict, fields=[field_path])
+
+        assert isinstance(lol_game, LolGame)
+
+
+def test_projection_required_fields_are_none(game_dict):
+    lol_game = from_dict(game_dict, fields=["picksBans.*.championId"])
+
+    pick_ban = lol_game.picksBans[0]
+    assert pick_ban.championId == game_dict["picksBans"][0]["championId"]
+    assert pick_ban.isBan is None
+    assert pick_ban.team is None
+
+
+def test_round_trip(lol_game, game_dict):
+    loaded = from_dict(game_dict)
+
+    assert to_dict(loaded) == game_dict
+    assert loaded == lol_game
+
+
+def test_load_json(tmp_path, lol_game, game_dict):
+    filename = str(tmp_path / "game.json")
+    dump_json(lol_game, filename)
+
+    assert to_dict(load_json(filename)) == game_dict
+    assert to_dict(load_json(filename, compact=True)) == game_dict
+
+
+def test_backrefs(game_dict):
+    lol_game = from_dict(game_dict)
+    player = lol_game.teams.BLUE.players[0]
+
+    assert lol_game.teams.RED.game is lol_game
+    assert player.game is lol_game
+    assert player.itemsEvents[0].game is lol_game
+    assert player.runes[0].game is lol_game
+    assert lol_game.picksBans[0].game is lol_game
+
+
+def test_missing_and_unknown_fields():
+    lol_game = from_dict(
+        {
+            "duration": 60,
+            "newField": {"a": 1},
+            "picksBans": [{"championId": 1, "unknown": True}],
+        }
+    )
+
+    assert lol_game.duration == 60
+    assert lol_game.winner is None
+    assert lol_game.teams.BLUE.players == []
+    assert lol_game.picksBans[0] == LolPickBan(championId=1, isBan=None, team=None)
+
+
+def test_sources():
+    lol_game = from_dict(
+        {
+            "sources": {
+                "riotLolApi": {"gameId": 1, "platformId": "KR"},
+                "custom": {"id": "a"},
+            }
+        }
+    )
+
+    assert lol_game.sources.riotLolApi == RiotGameSource(gameId=1, platformId="KR")
+    assert lol_game.sources.custom == {"id": "a"}
+
+
+def test_register_source(monkeypatch):
+    @dataclasses.dataclass
+    class CustomSource:
+        id: str = None
+
+    monkeypatch.setitem(SOURCES_CLASSES, LolGame, dict(SOURCES_CLASSES[LolGame]))
+    register_source(LolGame, "custom", CustomSource)
+
+    try:
+        lol_game = from_dict({"sources": {"custom": {"id": "a"}}})
+        assert lol_game.sources.custom == CustomSource(id="a")
+    finally:
+        # Converters built with the custom source need to be dropped
+        _converters.clear()
+
+
+def test_parse_fields():
+    assert parse_fields(["winner", "teams.*.players.*.championId"]) == {
+        "winner": {},
+        "teams": {"*": {"players": {"*": {"championId": {}}}}},
+    }
+    assert parse_fields(["teams", "teams.BLUE.bans"]) == {"teams": {}}
+
+    with pytest.raises(TypeError):
+        parse_fields("winner")
+
+
+def test_projection(game_dict):
+    lol_game = from_dict(
+        game_dict, fields=["winner", "teams.BLUE.players.endOfGameStats.kills"]
+    )
+
+    assert lol_game.winner == game_dict["winner"]
+    assert lol_game.duration is None
+    assert lol_game.kills == []
+    assert lol_game.teams.RED.players == []
+
+    player = lol_game.teams.BLUE.players[0]
+    assert player.endOfGameStats.kills == (
+        game_dict["teams"]["BLUE"]["players"][0]["endOfGameStats"]["kills"]
+    )
+    assert player.endOfGameStats.deaths is None
+    assert player.snapshots == []
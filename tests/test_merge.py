@@ -0,0 +1,230 @@
+import copy
+
+import pytest
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGameKill,
+    LolGamePlayer,
+    LolGamePlayerItemEvent,
+    LolGameTeam,
+    LolGameTeamEpicMonsterKill,
+    LolGameTeams,
+)
+from lol_dto.classes.sources.riot_lol_api import RiotGameSource, RiotPlayerSource
+from lol_dto.utilities import to_dict
+from lol_dto.utilities.merge import merge_events, merge_games
+
+
+def make_source_game() -> LolGame:
+    """
+    A game from the Riot API, with ids 1 and 6, and item events
+    """
+    blue_player = LolGamePlayer(
+        id=1,
+        championId=157,
+        itemsEvents=[
+            LolGamePlayerItemEvent(timestamp=10, type="PURCHASED", id=1055),
+            LolGamePlayerItemEvent(timestamp=300, type="PURCHASED", id=3031),
+        ],
+    )
+    blue_player.sources.riotLolApi = RiotPlayerSource(puuid="a", participantId=1)
+
+    red_player = LolGamePlayer(id=6, championId=1)
+
+    lol_game = LolGame(
+        duration=1800,
+        teams=LolGameTeams(
+            BLUE=LolGameTeam(
+                players=[blue_player],
+                epicMonstersKills=[
+                    LolGameTeamEpicMonsterKill(
+                        timestamp=600, type="DRAGON", subType="CLOUD", killerId=1
+                    )
+                ],
+            ),
+            RED=LolGameTeam(players=[red_player]),
+        ),
+        kills=[LolGameKill(timestamp=100, killerId=1, victimId=6, assistsIds=[])],
+    )
+    lol_game.sources.riotLolApi = RiotGameSource(gameId=1)
+
+    return lol_game
+
+
+def make_other_source_game() -> LolGame:
+    """
+    The same game from another source, with other players ids and slightly different timestamps
+    """
+    # Matched through its sources
+    blue_player = LolGamePlayer(
+        id=10,
+        inGameName="Blue",
+        itemsEvents=[
+            LolGamePlayerItemEvent(timestamp=10.5, type="PURCHASED", id=1055),
+            LolGamePlayerItemEvent(timestamp=500, type="PURCHASED", id=3006),
+        ],
+    )
+    blue_player.sources.riotLolApi = RiotPlayerSource(puuid="a")
+    blue_player.sources.other = {"playerId": "x"}
+
+    # Matched through its championId
+    red_player = LolGamePlayer(id=60, championId=1, inGameName="Red")
+
+    lol_game = LolGame(
+        patch="12.3",
+        teams=LolGameTeams(
+            BLUE=LolGameTeam(
+                players=[blue_player],
+                epicMonstersKills=[
+                    LolGameTeamEpicMonsterKill(
+                        timestamp=600.2,
+                        type="DRAGON",
+                        killerId=10,
+                        assistsIds=[60],
+                        subType="CLOUD",
+                    )
+                ],
+            ),
+            RED=LolGameTeam(players=[red_player]),
+        ),
+        kills=[
+            LolGameKill(timestamp=99.5, killerId=10, victimId=60, bounty=300),
+            LolGameKill(timestamp=200, killerId=60, victimId=10, assistsIds=[]),
+        ],
+    )
+    lol_game.sources.other = {"gameId": "b"}
+
+    return lol_game
+
+
+def test_merge_games():
+    merged = merge_games(make_source_game(), make_other_source_game())
+
+    # Sources are unioned and None fields filled
+    assert merged.sources.riotLolApi == RiotGameSource(gameId=1)
+    assert merged.sources.other == {"gameId": "b"}
+    assert merged.duration == 1800
+    assert merged.patch == "12.3"
+
+    blue_player, red_player = merged.teams.BLUE.players[0], merged.teams.RED.players[0]
+    assert len(merged.teams.BLUE.players) == len(merged.teams.RED.players) == 1
+    assert (blue_player.id, blue_player.inGameName) == (1, "Blue")
+    assert (red_player.id, red_player.inGameName) == (6, "Red")
+    assert blue_player.sources.other == {"playerId": "x"}
+
+    # Events are deduplicated within the tolerance, and ids translated
+    assert [(k.timestamp, k.killerId, k.victimId, k.bounty) for k in merged.kills] == [
+        (100, 1, 6, 300),
+        (200, 6, 1, None),
+    ]
+    assert [(e.timestamp, e.id) for e in blue_player.itemsEvents] == [
+        (10, 1055),
+        (300, 3031),
+        (500, 3006),
+    ]
+
+    (dragon,) = merged.teams.BLUE.epicMonstersKills
+    assert (dragon.timestamp, dragon.killerId, dragon.assistsIds) == (600, 1, [6])
+
+
+def test_merge_games_backrefs():
+    merged = merge_games(make_source_game(), make_other_source_game())
+
+    for team in merged.teams:
+        assert team.game is merged
+
+        for player in team.players:
+            assert player.game is merged
+            assert all(e.game is merged for e in player.itemsEvents)
+
+
+def test_merge_games_copy():
+    lol_game, other_game = make_source_game(), make_other_source_game()
+    lol_game_dict, other_game_dict = to_dict(lol_game), to_dict(other_game)
+
+    merged = merge_games(lol_game, other_game)
+
+    assert merged is not lol_game
+    assert to_dict(lol_game) == lol_game_dict
+    assert to_dict(other_game) == other_game_dict
+
+    assert merge_games(lol_game, other_game, copy_games=False) is lol_game
+    assert to_dict(lol_game) == to_dict(merged)
+
+
+def test_tolerance():
+    merged = merge_games(make_source_game(), make_other_source_game(), tolerance=0.1)
+
+    assert [k.timestamp for k in merged.kills] == [99.5, 100, 200]
+
+
+def test_unmatched_players_are_added():
+    other_game = make_other_source_game()
+    other_game.teams.RED.players[0].championId = 2
+
+    merged = merge_games(make_source_game(), other_game)
+
+    assert [p.id for p in merged.teams.RED.players] == [6, 60]
+
+
+def test_unmatched_players_ids_collisions():
+    other_game = make_other_source_game()
+    other_game.teams.RED.players[0].championId = 2
+    # Collides with the id of the blue player of the base game
+    other_game.teams.RED.players[0].id = 1
+    other_game.kills = [LolGameKill(timestamp=200, killerId=1, victimId=10)]
+
+    merged = merge_games(make_source_game(), other_game)
+
+    assert [p.id for p in merged.teams.BLUE.players] == [1]
+    assert [p.id for p in merged.teams.RED.players] == [6, 7]
+    assert [(k.killerId, k.victimId) for k in merged.kills] == [(1, 6), (7, 1)]
+
+
+def test_merge_game_with_itself(lol_game):
+    merged = merge_games(lol_game, copy.deepcopy(lol_game))
+
+    assert to_dict(merged) == to_dict(lol_game)
+
+
+def test_merge_single_game(lol_game):
+    assert to_dict(merge_games(lol_game)) == to_dict(lol_game)
+
+    with pytest.raises(ValueError):
+        merge_games()
+
+
+def test_merge_events():
+    events = [
+        LolGamePlayerItemEvent(timestamp=20, type="PURCHASED", id=1),
+        LolGamePlayerItemEvent(timestamp=10, type="PURCHASED", id=1),
+        LolGamePlayerItemEvent(timestamp=None, type="SOLD", id=1),
+    ]
+    other_events = [
+        LolGamePlayerItemEvent(timestamp=10.5, type="PURCHASED", id=1),
+        LolGamePlayerItemEvent(timestamp=15, type="PURCHASED", id=1),
+        LolGamePlayerItemEvent(timestamp=20, type="PURCHASED", id=2),
+        LolGamePlayerItemEvent(timestamp=21, type="PURCHASED", id=1),
+        LolGamePlayerItemEvent(timestamp=None, type="SOLD", id=1),
+        LolGamePlayerItemEvent(timestamp=None, type="SOLD", id=2),
+    ]
+
+    merged = merge_events(events, other_events, ("type", "id"), 1.0)
+
+    assert [(e.timestamp, e.id) for e in merged] == [
+        (10, 1),
+        (15, 1),
+        (20, 1),
+        (20, 2),
+        (None, 1),
+        (None, 2),
+    ]
+    assert merged[0] is events[1]
+
+
+def test_merge_events_empty_lists():
+    events = [LolGamePlayerItemEvent(timestamp=1, id=1)]
+
+    assert merge_events(events, [], ("id",), 1.0) is events
+    assert merge_events([], events, ("id",), 1.0) == events
@@ -0,0 +1,63 @@
+import pytest
+
+from lol_dto.classes.sources.empty_dataclass import EmptyDataclass
+from lol_dto.utilities import to_dict
+from lol_dto.utilities.msgpack_codec import (
+    dump_msgpack,
+    from_msgpack,
+    get_key_table,
+    load_msgpack,
+    to_msgpack,
+)
+
+pytest.importorskip("msgpack")
+
+
+@pytest.mark.parametrize("delta", [False, True])
+def test_round_trip(lol_game, game_dict, delta):
+    data = to_msgpack(lol_game, delta)
+
+    assert to_dict(from_msgpack(data)) == game_dict
+    assert to_dict(from_msgpack(data, compact=True)) == game_dict
+
+
+def test_free_form_dictionaries_are_not_interned(lol_game):
+    names, _ = get_key_table()
+    custom = {0: "zero", 1: [{2: "two", "kills": 3}], names[0]: names[1]}
+
+    lol_game.sources.custom = custom
+    lol_game.teams.BLUE.players[0].sources = EmptyDataclass()
+    lol_game.teams.BLUE.players[0].sources.custom = {"gameId": 1, 5: {6: 7}}
+
+    loaded = from_msgpack(to_msgpack(lol_game))
+
+    assert loaded.sources.custom == custom
+    assert loaded.teams.BLUE.players[0].sources.custom == {"gameId": 1, 5: {6: 7}}
+    assert to_dict(loaded) == to_dict(lol_game)
+
+
+def test_keys_are_interned(lol_game):
+    data = to_msgpack(lol_game)
+
+    assert b"snapshots" not in data
+    assert b"totalGold" not in data
+    assert len(data) < len(str(to_dict(lol_game))) / 2
+
+
+def test_file_round_trip(tmp_path, lol_game, game_dict):
+    filename = str(tmp_path / "game.msgpack")
+
+    dump_msgpack(lol_game, filename, delta=True)
+
+    assert to_dict(load_msgpack(filename)) == game_dict
+
+
+def test_invalid_data():
+    import msgpack
+
+    with pytest.raises(ValueError):
+        from_msgpack(msgpack.packb(["other", 1, 0, False, {}]))
+
+    _, crc = get_key_table()
+    with pytest.raises(ValueError):
+        from_msgpack(msgpack.packb(["lol_dto", 2, crc + 1, False, {}]))
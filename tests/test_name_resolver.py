@@ -0,0 +1,136 @@
+import json
+import sys
+
+import pytest
+
+from lol_dto.classes.game import (
+    LolGamePlayerItemEvent,
+)
+from lol_dto.names_helper.name_resolver import (
+    LolIdToolsBackend,
+    StaticDataBackend,
+    get_name,
+    resolve_names,
+    set_backend,
+)
+
+NAMES = {
+    "champion": {157: "Yasuo", 1: "Annie"},
+    "item": {3031: "Infinity Edge"},
+    "rune": {8000: "Precision", 8005: "Press the Attack"},
+}
+PATCHES = {"10.1": {"item": {3031: "Old Infinity Edge"}}}
+
+
+class CountingBackend(StaticDataBackend):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = []
+
+    def get_name(self, object_type, object_id, patch=None):
+        self.calls.append((object_type, object_id, patch))
+        return super().get_name(object_type, object_id, patch)
+
+
+@pytest.fixture
+def backend():
+    backend = CountingBackend(NAMES, PATCHES)
+    set_backend(backend)
+
+    yield backend
+
+    set_backend(LolIdToolsBackend())
+
+
+def test_static_data_backend(backend):
+    assert get_name(157, "champion") == "Yasuo"
+    assert get_name(3031, "item") == "Infinity Edge"
+    assert get_name(3031, "item", "10.1") == "Old Infinity Edge"
+
+    # Patches fall back on the default names
+    assert get_name(157, "champion", "10.1") == "Yasuo"
+    assert get_name(157, "champion", "12.3") == "Yasuo"
+    assert get_name(404, "champion") is None
+
+
+def test_static_data_backend_from_json(tmp_path):
+    filename = tmp_path / "names.json"
+    filename.write_text(json.dumps({"names": NAMES, "patches": PATCHES}))
+
+    backend = StaticDataBackend.from_json(str(filename))
+
+    assert backend.names == NAMES
+    assert backend.patches == PATCHES
+
+
+def test_names_are_cached(backend):
+    for _ in range(3):
+        assert get_name(157, "champion") == "Yasuo"
+        assert get_name(157, "champion", "10.1") == "Yasuo"
+
+    assert backend.calls == [("champion", 157, None), ("champion", 157, "10.1")]
+
+
+def test_set_backend_clears_cache(backend):
+    get_name(157, "champion")
+
+    set_backend(StaticDataBackend({"champion": {157: "Yone"}}))
+
+    assert get_name(157, "champion") == "Yone"
+
+
+def test_cache_size(backend):
+    set_backend(backend, cache_size=1)
+
+    get_name(157, "champion")
+    get_name(1, "champion")
+    get_name(157, "champion")
+
+    assert len(backend.calls) == 3
+
+
+def test_names_properties_use_game_patch(backend, small_game):
+    small_game.patch = "10.1"
+    player = small_game.teams.BLUE.players[0]
+
+    assert player.championName == "Yasuo"
+    assert player.primaryRuneTreeName == "Precision"
+    assert player.runes[0].name == "Press the Attack"
+    assert player.itemsEvents[0].name == "Old Infinity Edge"
+    assert player.game.teams.BLUE.bansNames == ["Annie"]
+
+    small_game.patch = None
+    assert player.itemsEvents[0].name == "Infinity Edge"
+
+
+def test_names_properties_without_game(backend):
+    assert LolGamePlayerItemEvent(timestamp=10, id=3031).name == "Infinity Edge"
+
+
+def test_resolve_names(backend, small_game):
+    lol_game = small_game
+    lol_game.patch = "10.1"
+
+    assert resolve_names(lol_game) == {
+        ("champion", 157): "Yasuo",
+        ("champion", 1): "Annie",
+        ("rune", 8000): "Precision",
+        ("rune", 8005): "Press the Attack",
+        ("item", 3031): "Old Infinity Edge",
+    }
+
+    # Names properties then use the cache
+    calls = len(backend.calls)
+    lol_game.teams.BLUE.players[0].championName
+    lol_game.teams.BLUE.players[0].itemsEvents[0].name
+
+    assert len(backend.calls) == calls
+
+
+def test_lol_id_tools_backend(monkeypatch):
+    # lol_id_tools is only imported on the first lookup
+    monkeypatch.setitem(sys.modules, "lol_id_tools", None)
+    backend = LolIdToolsBackend()
+
+    with pytest.raises(ImportError, match=r"lol_dto\[names\]"):
+        backend.get_name("champion", 157)
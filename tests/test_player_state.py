@@ -0,0 +1,273 @@
+import numpy
+import pytest
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGamePlayer,
+    LolGamePlayerItemEvent,
+    LolGamePlayerSkillLevelUpEvent,
+    LolGamePlayerSnapshot,
+    LolGameTeam,
+    LolGameTeams,
+)
+from lol_dto.utilities import player_state
+from lol_dto.utilities.player_state import (
+    PlayerState,
+    PlayerStateIndex,
+    get_state_index,
+    sample_players_states,
+)
+
+
+def item(timestamp, type_, id_=None) -> LolGamePlayerItemEvent:
+    return LolGamePlayerItemEvent(timestamp=timestamp, type=type_, id=id_)
+
+
+def skill(timestamp, slot, type_="NORMAL") -> LolGamePlayerSkillLevelUpEvent:
+    return LolGamePlayerSkillLevelUpEvent(timestamp=timestamp, slot=slot, type=type_)
+
+
+def items_at(events, timestamp) -> list:
+    return PlayerStateIndex(LolGamePlayer(itemsEvents=events)).items_at(timestamp)
+
+
+def test_items():
+    events = [
+        item(10, "PURCHASED", 1055),
+        item(10, "PURCHASED", 2003),
+        item(60, "SOLD", 2003),
+        item(90, "PICKED_UP", 3513),
+        item(100, "DESTROYED", 3513),
+        item(120, "SOLD", 9999),
+        item(None, "PURCHASED", 1),
+    ]
+
+    assert items_at(events, 0) == []
+    assert items_at(events, 10) == [1055, 2003]
+    assert items_at(events, 60) == [1055]
+    assert items_at(events, 95) == [1055, 3513]
+    assert items_at(events, 1000) == [1055]
+
+
+def undo(timestamp, before_undo_id=0, after_undo_id=0) -> LolGamePlayerItemEvent:
+    # Like Riot's ITEM_UNDO, with beforeId as beforeUndoId and afterId as id
+    return LolGamePlayerItemEvent(
+        timestamp=timestamp, type="UNDO", id=after_undo_id, beforeUndoId=before_undo_id
+    )
+
+
+def test_undo():
+    events = [
+        item(10, "PURCHASED", 1055),
+        item(20, "PURCHASED", 2003),
+        undo(25, before_undo_id=2003),
+        item(30, "SOLD", 1055),
+        undo(35, after_undo_id=1055),
+        # Components are destroyed with the purchase, and restored by the undo
+        item(300, "PURCHASED", 1036),
+        item(400, "DESTROYED", 1036),
+        item(400, "PURCHASED", 3133),
+        undo(410, before_undo_id=3133),
+    ]
+
+    assert items_at(events, 20) == [1055, 2003]
+    assert items_at(events, 25) == [1055]
+    assert items_at(events, 30) == []
+    assert items_at(events, 35) == [1055]
+    assert items_at(events, 400) == [1055, 3133]
+    assert items_at(events, 410) == [1055, 1036]
+
+
+def test_undo_same_timestamp():
+    # Two purchases at the same timestamp, only the second one being undone
+    events = [
+        item(10, "PURCHASED", 1055),
+        item(10, "PURCHASED", 2003),
+        undo(12, before_undo_id=2003),
+    ]
+
+    assert items_at(events, 12) == [1055]
+
+
+def test_undo_components_after_purchase():
+    events = [
+        item(10, "PURCHASED", 1036),
+        item(10, "PURCHASED", 1037),
+        item(60, "PURCHASED", 3133),
+        item(60, "DESTROYED", 1036),
+        item(60, "DESTROYED", 1037),
+        undo(65, before_undo_id=3133),
+    ]
+
+    assert items_at(events, 60) == [3133]
+    assert sorted(items_at(events, 65)) == [1036, 1037]
+
+
+def test_undo_older_event():
+    events = [
+        item(10, "PURCHASED", 1055),
+        item(20, "SOLD", 1055),
+        item(30, "PURCHASED", 2003),
+        # Reverts the sale, not the latest purchase
+        undo(40, after_undo_id=1055),
+        undo(50, before_undo_id=2003),
+        # The sale was already undone
+        undo(60, after_undo_id=1055),
+    ]
+
+    assert items_at(events, 40) == [2003, 1055]
+    assert items_at(events, 50) == [1055]
+    assert items_at(events, 60) == [1055]
+
+
+def test_undo_without_ids():
+    events = [
+        item(10, "PURCHASED", 1055),
+        item(20, "PURCHASED", 2003),
+        item(30, "UNDO"),
+    ]
+
+    assert items_at(events, 30) == [1055]
+
+
+def test_unmatched_undo_is_ignored():
+    events = [
+        undo(5, before_undo_id=1055),
+        item(10, "PURCHASED", 1055),
+        undo(15, before_undo_id=2003),
+    ]
+
+    assert items_at(events, 15) == [1055]
+
+
+def test_checkpoints(lol_game):
+    for player in (p for team in lol_game.teams for p in team.players):
+        index = PlayerStateIndex(player, checkpoint_interval=3)
+        reference = PlayerStateIndex(player, checkpoint_interval=10**6)
+
+        assert len(index.checkpoints) > 1
+
+        for timestamp in range(0, int(lol_game.duration) + 60, 15):
+            assert index.items_at(timestamp) == reference.items_at(timestamp)
+
+
+def test_skills():
+    player = LolGamePlayer(
+        skillsLevelUpEvents=[
+            skill(90, 2),
+            skill(30, 1),
+            skill(150, 1),
+            skill(600, 4, "EVOLVE"),
+            skill(610, 4, "EVOLVE"),
+            skill(700, 5),
+        ]
+    )
+    index = PlayerStateIndex(player)
+
+    assert index.skills_at(0) == ({1: 0, 2: 0, 3: 0, 4: 0}, [])
+    assert index.skills_at(90) == ({1: 1, 2: 1, 3: 0, 4: 0}, [])
+    assert index.skills_at(1000) == ({1: 2, 2: 1, 3: 0, 4: 0}, [4])
+
+
+def test_levels():
+    from_level_ups = PlayerStateIndex(LolGamePlayer(levelUpEvents=[200, 100]))
+
+    assert from_level_ups.level_at(0) == 1
+    assert from_level_ups.level_at(100) == 2
+    assert from_level_ups.level_at(500) == 3
+
+    from_snapshots = PlayerStateIndex(
+        LolGamePlayer(
+            snapshots=[
+                LolGamePlayerSnapshot(timestamp=60, level=1),
+                LolGamePlayerSnapshot(timestamp=120, level=None),
+                LolGamePlayerSnapshot(timestamp=180, level=4),
+            ]
+        )
+    )
+
+    assert from_snapshots.level_at(0) is None
+    assert from_snapshots.level_at(150) == 1
+    assert from_snapshots.level_at(180) == 4
+
+
+def test_state_at():
+    player = LolGamePlayer(
+        itemsEvents=[item(10, "PURCHASED", 1055)],
+        skillsLevelUpEvents=[skill(30, 1)],
+        levelUpEvents=[100],
+    )
+
+    assert player.state_at(120) == PlayerState(
+        timestamp=120,
+        level=2,
+        items=[1055],
+        skillsLevels={1: 1, 2: 0, 3: 0, 4: 0},
+        evolvedSlots=[],
+    )
+
+
+def test_state_index_cache():
+    player = LolGamePlayer(itemsEvents=[item(10, "PURCHASED", 1055)])
+    index = get_state_index(player)
+
+    assert get_state_index(player) is index
+
+    player.itemsEvents.append(item(20, "PURCHASED", 2003))
+    assert player.state_at(30).items == [1055, 2003]
+
+    # Sorted timestamps are kept by the index
+    player.itemsEvents[1].timestamp = 40
+    assert player.state_at(30).items == [1055, 2003]
+
+    player.invalidate_state_index()
+    assert player.state_at(30).items == [1055]
+
+
+def test_sample_players_states(lol_game):
+    sampled = sample_players_states(lol_game, interval=60)
+    players = [p for team in lol_game.teams for p in team.players]
+
+    assert sampled.timestamp[0] == 0
+    assert sampled.timestamp[-1] <= lol_game.duration
+    assert sampled.playerId.tolist() == [p.id for p in players]
+    assert sampled.level.shape == (len(players), len(sampled.timestamp))
+    assert sampled.skillsLevels.shape == sampled.level.shape + (4,)
+
+    for row, player in enumerate(players):
+        for column, timestamp in enumerate(sampled.timestamp):
+            state = player.state_at(timestamp)
+            items = sampled.items[row, column]
+
+            assert items[: len(state.items)].tolist() == state.items
+            assert not items[len(state.items) :].any()
+            assert sampled.skillsLevels[row, column].tolist() == [
+                state.skillsLevels[slot] for slot in (1, 2, 3, 4)
+            ]
+
+            if state.level is None:
+                assert numpy.isnan(sampled.level[row, column])
+            else:
+                assert sampled.level[row, column] == state.level
+
+
+def test_sample_players_states_range():
+    lol_game = LolGame(
+        duration=100,
+        teams=LolGameTeams(BLUE=LolGameTeam(players=[LolGamePlayer(id=1)])),
+    )
+
+    assert sample_players_states(lol_game, 30).timestamp.tolist() == [0, 30, 60, 90]
+    assert sample_players_states(lol_game, 30, 10, 70).timestamp.tolist() == [
+        10,
+        40,
+        70,
+    ]
+    assert sample_players_states(lol_game, 30).items.shape == (1, 4, 0)
+
+
+def test_missing_numpy(monkeypatch):
+    monkeypatch.setattr(player_state, "numpy", None)
+
+    with pytest.raises(ImportError, match=r"lol_dto\[numpy\]"):
+        sample_players_states(LolGame())
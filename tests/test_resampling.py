@@ -0,0 +1,174 @@
+import numpy
+import pytest
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGamePlayer,
+    LolGamePlayerSnapshot,
+    Position,
+)
+from lol_dto.utilities import to_dict
+from lol_dto.utilities.resampling import (
+    CARRIED_FIELDS,
+    INTERPOLATED_FIELDS,
+    resample,
+    resample_game,
+    resample_games,
+    resample_player,
+    resample_snapshots,
+    to_snapshots,
+)
+from benchmarks.synthetic_game import make_game
+
+
+def reference_resample(row: "numpy.ndarray", timestamps) -> dict:
+    """
+    Resamples a single row of snapshots field by field with numpy.interp
+    """
+    source_timestamps = row["timestamp"][~numpy.isnan(row["timestamp"])]
+    first = source_timestamps.min(initial=numpy.inf)
+    result = {}
+
+    for name in CARRIED_FIELDS + INTERPOLATED_FIELDS:
+        valid = ~numpy.isnan(row[name]) & ~numpy.isnan(row["timestamp"])
+        x, y = row["timestamp"][valid], row[name][valid]
+        values = []
+
+        for timestamp in timestamps:
+            if timestamp < first or not (x <= timestamp).any():
+                values.append(numpy.nan)
+            elif name in CARRIED_FIELDS:
+                values.append(y[x <= timestamp][-1])
+            else:
+                values.append(numpy.interp(timestamp, x, y, right=numpy.nan))
+
+        result[name] = values
+
+    return result
+
+
+def assert_resampled(resampled: "numpy.ndarray", row: "numpy.ndarray"):
+    expected = reference_resample(row, resampled["timestamp"])
+
+    for name, values in expected.items():
+        numpy.testing.assert_allclose(resampled[name], values, err_msg=name)
+
+
+def test_resample_player(lol_game):
+    player = lol_game.teams.BLUE.players[0]
+    resampled = resample_player(player, interval=45, start=10)
+
+    assert resampled["timestamp"][0] == 10
+    assert resampled["timestamp"][1] == 55
+    assert resampled["timestamp"][-1] <= player.snapshots[-1].timestamp
+    assert_resampled(resampled, player.snapshots_array())
+
+
+def test_resample_same_timestamps(lol_game):
+    player = lol_game.teams.RED.players[3]
+    array = player.snapshots_array()
+
+    resampled = resample(array, timestamps=array["timestamp"])
+
+    for name in CARRIED_FIELDS + INTERPOLATED_FIELDS:
+        numpy.testing.assert_array_equal(resampled[name], array[name])
+
+
+def test_missing_values():
+    snapshots = [
+        LolGamePlayerSnapshot(timestamp=0, totalGold=None, level=1, isAlive=True),
+        LolGamePlayerSnapshot(timestamp=60, totalGold=600, level=None),
+        LolGamePlayerSnapshot(timestamp=120, totalGold=None, level=3),
+        LolGamePlayerSnapshot(timestamp=180, totalGold=1800, level=4),
+        LolGamePlayerSnapshot(timestamp=240, totalGold=None, level=None),
+    ]
+    array = LolGamePlayer(snapshots=snapshots).snapshots_array()
+
+    resampled = resample(array, interval=30)
+
+    assert_resampled(resampled, array)
+    numpy.testing.assert_array_equal(
+        resampled["totalGold"],
+        [numpy.nan, numpy.nan, 600, 900, 1200, 1500, 1800, numpy.nan, numpy.nan],
+    )
+    numpy.testing.assert_array_equal(resampled["level"], [1, 1, 1, 1, 3, 3, 4, 4, 4])
+
+
+def test_resample_game_unaligned_rows(lol_game):
+    # Players get different snapshots timestamps
+    for index, player in enumerate(p for team in lol_game.teams for p in team.players):
+        for snapshot in player.snapshots:
+            snapshot.timestamp += index
+
+        del player.snapshots[index]
+
+    array = lol_game.timeline_arrays()
+    resampled = resample_game(lol_game, interval=50)
+
+    assert resampled.shape[0] == 10
+    assert resampled["playerId"][:, 0].tolist() == array["playerId"][:, 0].tolist()
+
+    for resampled_row, row in zip(resampled, array):
+        assert_resampled(resampled_row, row)
+
+
+def test_resample_games():
+    lol_games = [make_game(20, seed=0), make_game(30, seed=1)]
+    lol_games[0].teams.RED.players.pop()
+
+    resampled = resample_games(lol_games, interval=90)
+
+    assert resampled.shape[:2] == (2, 10)
+    assert resampled["timestamp"][0, 0, -1] == resampled["timestamp"][1, 0, -1]
+
+    end = resampled["timestamp"][0, 0, -1]
+
+    for game_resampled, lol_game in zip(resampled, lol_games):
+        expected = resample_game(lol_game, interval=90, end=end)
+
+        for name in CARRIED_FIELDS + INTERPOLATED_FIELDS + ("playerId",):
+            numpy.testing.assert_array_equal(
+                game_resampled[: len(expected)][name], expected[name]
+            )
+
+    # Missing players are NaN
+    assert numpy.isnan(resampled["totalGold"][0, 9]).all()
+
+
+def test_empty_arrays():
+    assert resample_game(LolGame(), end=120).shape == (0, 3)
+    assert resample_player(LolGamePlayer()).shape == (1,)
+    assert resample_games([]).shape == (0, 0, 1)
+
+
+def test_to_snapshots():
+    snapshots = [
+        LolGamePlayerSnapshot(timestamp=0, position=Position(x=0, y=0), totalGold=0),
+        LolGamePlayerSnapshot(
+            timestamp=60, position=Position(x=100, y=301), totalGold=601, isAlive=True
+        ),
+    ]
+    snapshots[1].championStats.health = 500
+
+    resampled = resample_snapshots(LolGamePlayer(snapshots=snapshots), interval=30)
+
+    assert [s.timestamp for s in resampled] == [0, 30, 60]
+    assert resampled[1].position == Position(x=50, y=150)
+    assert resampled[1].totalGold == 300
+    assert resampled[1].championStats.health is None
+    assert resampled[1].isAlive is None
+    assert resampled[2].isAlive is True
+    assert to_dict(resampled[2]) == to_dict(snapshots[1])
+
+
+def test_to_snapshots_round_trip(lol_game):
+    player = lol_game.teams.BLUE.players[0]
+
+    assert to_snapshots(player.snapshots_array()) == player.snapshots
+
+
+def test_missing_numpy(monkeypatch):
+    monkeypatch.setattr("lol_dto.utilities.timeline.numpy", None)
+
+    with pytest.raises(ImportError, match=r"lol_dto\[numpy\]"):
+        resample_game(LolGame())
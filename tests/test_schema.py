@@ -0,0 +1,155 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+from lol_dto.classes.game import LolGame
+from lol_dto.utilities import schema, to_dict
+from lol_dto.utilities.class_tree import get_classes
+from lol_dto.utilities.load_json import SOURCES_CLASSES
+from lol_dto.classes.sources.riot_lol_api import RiotGameSource
+
+
+@pytest.fixture(autouse=True)
+def clear_codecs():
+    schema._codecs.clear()
+    yield
+    schema._codecs.clear()
+
+
+def test_codec_round_trip(lol_game, game_dict):
+    codec = schema.get_codec()
+
+    assert codec.encode(lol_game) == game_dict
+    assert codec.encode(lol_game, remove_empty=False) == to_dict(
+        lol_game, remove_empty=False
+    )
+    assert to_dict(codec.decode(game_dict)) == game_dict
+
+
+def test_codec_is_not_cached_on_disk_by_default(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOL_DTO_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    schema.get_codec()
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_codec_disk_cache(tmp_path, lol_game, game_dict):
+    codec = schema.get_codec(cache_dir=str(tmp_path))
+    filename = tmp_path / schema._get_cache_filename("", codec.fingerprint)
+
+    assert filename.read_text() == codec.source
+
+    schema._codecs.clear()
+    cached_codec = schema.get_codec(cache_dir=str(tmp_path))
+
+    assert cached_codec.source == codec.source
+    assert cached_codec.encode(lol_game) == game_dict
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda source: source[: len(source) // 2],
+        lambda source: source[: source.rindex("\ndef ")],
+        lambda source: "not python(",
+        lambda source: source.replace(schema.get_schema_fingerprint(), "0" * 16),
+        lambda source: source.replace("import serialize", "import _serialize"),
+        # Code that still runs but is not the generated code
+        lambda source: source.replace("output = {}", "output = {'patch': '1.1'}"),
+        lambda source: source.replace(f"Python {schema._PYTHON_VERSION}", "Python 3.0"),
+    ],
+)
+def test_corrupted_disk_cache_is_regenerated(tmp_path, lol_game, game_dict, corrupt):
+    codec = schema.get_codec(cache_dir=str(tmp_path))
+    filename = tmp_path / schema._get_cache_filename("", codec.fingerprint)
+    filename.write_text(corrupt(codec.source))
+
+    schema._codecs.clear()
+    codec = schema.get_codec(cache_dir=str(tmp_path))
+
+    assert codec.encode(lol_game) == game_dict
+    assert to_dict(codec.decode(game_dict)) == game_dict
+    assert filename.read_text() == codec.source
+
+
+def test_disk_cache_is_per_python_version(tmp_path, monkeypatch):
+    codec = schema.get_codec(cache_dir=str(tmp_path))
+    filename = schema._get_cache_filename(str(tmp_path), codec.fingerprint)
+
+    schema._codecs.clear()
+    monkeypatch.setattr(schema, "_PYTHON_VERSION", "3.0")
+    other_codec = schema.get_codec(cache_dir=str(tmp_path))
+
+    assert other_codec.fingerprint == codec.fingerprint
+    assert "on Python 3.0" in other_codec.source
+    assert (tmp_path / f"codec_{codec.fingerprint}_py30.py").exists()
+    assert "on Python 3.0" not in open(filename).read()
+
+
+def test_fingerprint_is_the_same_in_all_processes():
+    statement = (
+        "from lol_dto.utilities.schema import *; print(get_schema_fingerprint())"
+    )
+    fingerprints = {
+        subprocess.run(
+            [sys.executable, "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for _ in range(2)
+    }
+
+    assert fingerprints == {schema.get_schema_fingerprint()}
+
+
+def test_generated_source_only_imports_public_functions():
+    source = schema.generate_codec_source(LolGame)
+
+    for line in source.splitlines():
+        if line.startswith("from lol_dto.utilities"):
+            assert " import _" not in line
+
+
+def test_versioned_round_trip(tmp_path, lol_game, game_dict):
+    filename = str(tmp_path / "game.json")
+
+    schema.dump_json_versioned(lol_game, filename)
+    loaded = schema.load_json_versioned(filename)
+
+    assert to_dict(loaded) == game_dict
+    assert schema.to_versioned_dict(lol_game)[schema.SCHEMA_VERSION_KEY] == (
+        schema.get_schema_fingerprint()
+    )
+
+
+def test_migrations(game_dict, monkeypatch):
+    monkeypatch.setattr(schema, "MIGRATIONS", {})
+    fingerprint = schema.get_schema_fingerprint()
+
+    schema.register_migration("v1", "v2", lambda d: {**d, "duration": 1})
+    schema.register_migration("v2", fingerprint, lambda d: {**d, "patch": "1.1"})
+
+    lol_game = schema.from_versioned_dict(
+        {**game_dict, schema.SCHEMA_VERSION_KEY: "v1"}
+    )
+
+    assert lol_game.duration == 1
+    assert lol_game.patch == "1.1"
+
+    # Unknown versions fall back to from_dict
+    lol_game = schema.from_versioned_dict({**game_dict, schema.SCHEMA_VERSION_KEY: "?"})
+    assert to_dict(lol_game) == game_dict
+
+
+def test_get_classes():
+    classes = get_classes(LolGame)
+
+    assert classes[0] is LolGame
+    assert len(classes) == len(set(classes))
+    assert RiotGameSource not in classes
+    assert RiotGameSource in get_classes(LolGame, SOURCES_CLASSES)
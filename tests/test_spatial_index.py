@@ -0,0 +1,171 @@
+import sys
+
+import pytest
+
+from lol_dto.classes.game import (
+    LolGameKill,
+    LolGamePlayerSnapshot,
+    LolGamePlayerWardEvent,
+    Position,
+)
+from lol_dto.utilities.spatial_index import (
+    MAP_MAX,
+    MAP_MIN,
+    MAP_REGIONS,
+    CircleRegion,
+    RectangleRegion,
+    SpatialIndex,
+    heatmap,
+)
+from benchmarks.synthetic_game import make_game
+
+
+@pytest.fixture(scope="module")
+def games():
+    return [make_game(seed=seed) for seed in range(2)]
+
+
+@pytest.fixture(scope="module", params=[250, 500, 4000])
+def index(request, games):
+    return SpatialIndex.from_games(games, cell_size=request.param)
+
+
+def get_positions(games) -> list:
+    """
+    Returns (x, y, item) for every event and snapshot with a position, without the index
+    """
+    positions = []
+
+    for lol_game in games:
+        for indexed_event in lol_game.event_index:
+            position = getattr(indexed_event.event, "position", None)
+            if position is not None:
+                positions.append((position.x, position.y, indexed_event.event))
+
+        for team in lol_game.teams:
+            for player in team.players:
+                for snapshot in player.snapshots:
+                    positions.append(
+                        (snapshot.position.x, snapshot.position.y, snapshot)
+                    )
+
+    return positions
+
+
+def ids(items) -> list:
+    return sorted(id(item) for item in items)
+
+
+def test_all_positions_are_indexed(index, games):
+    positions = get_positions(games)
+
+    assert len(index) == len(positions)
+    assert ids(p.item for p in index) == ids(item for _, _, item in positions)
+
+
+@pytest.mark.parametrize(
+    "bbox", [(0, 0, 1000, 1000), (4000, 2000, 9000, 12000), (MAP_MIN, MAP_MIN, 0, 0)]
+)
+def test_in_bbox(index, games, bbox):
+    x_min, y_min, x_max, y_max = bbox
+    expected = [
+        item
+        for x, y, item in get_positions(games)
+        if x_min <= x <= x_max and y_min <= y <= y_max
+    ]
+
+    assert ids(p.item for p in index.in_bbox(*bbox)) == ids(expected)
+
+
+def test_in_radius(index, games):
+    expected = [
+        item
+        for x, y, item in get_positions(games)
+        if (x - 7000) ** 2 + (y - 7000) ** 2 <= 2500**2
+    ]
+
+    assert expected
+    assert ids(p.item for p in index.in_radius(7000, 7000, 2500)) == ids(expected)
+
+
+@pytest.mark.parametrize("name", list(MAP_REGIONS))
+def test_in_region(index, games, name):
+    region = MAP_REGIONS[name]
+    expected = [item for x, y, item in get_positions(games) if region.contains(x, y)]
+
+    assert ids(p.item for p in index.in_region(name)) == ids(expected)
+
+
+def test_in_region_custom_region(index, games):
+    region = RectangleRegion(1000, 1000, 5000, 5000)
+
+    assert ids(p.item for p in index.in_region(region)) == ids(
+        p.item for p in index.in_bbox(1000, 1000, 5000, 5000)
+    )
+
+
+def test_item_class(index, games):
+    expected = [
+        item
+        for x, y, item in get_positions(games)
+        if isinstance(item, LolGameKill) and x <= 7000
+    ]
+
+    assert expected
+    assert ids(
+        p.item for p in index.in_bbox(MAP_MIN, MAP_MIN, 7000, MAP_MAX, LolGameKill)
+    ) == ids(expected)
+    # Synthetic wards events have no position
+    assert index.in_radius(7000, 7000, 10000, LolGamePlayerWardEvent) == []
+
+
+def test_add():
+    index = SpatialIndex()
+    snapshot = LolGamePlayerSnapshot(timestamp=0, position=Position(x=100, y=200))
+
+    index.add(snapshot, player_id=3)
+    index.add(LolGamePlayerSnapshot(timestamp=0))
+    index.add(LolGamePlayerSnapshot(timestamp=0, position=Position(x=None, y=1)))
+
+    assert len(index) == 1
+    assert index.in_radius(100, 200, 0) == [(100, 200, snapshot, 3, None)]
+    assert index.in_bbox(0, 0, 99, 1000) == []
+
+
+def test_events_and_snapshots_options(games):
+    events = SpatialIndex.from_games(games, snapshots=False)
+    snapshots = SpatialIndex.from_games(games, events=False)
+
+    assert len(events) + len(snapshots) == len(get_positions(games))
+    assert all(isinstance(p.item, LolGamePlayerSnapshot) for p in snapshots)
+
+
+def test_circle_region():
+    region = CircleRegion(0, 0, 5)
+
+    assert region.contains(3, 4)
+    assert not region.contains(4, 4)
+    assert region.bbox == (-5, -5, 5, 5)
+
+
+def test_heatmap(index, games):
+    counts = index.heatmap(bins=16)
+
+    assert counts.shape == (16, 16)
+    assert counts.sum() == len(index)
+
+    kills = index.heatmap(bins=16, item_class=LolGameKill)
+    assert kills.sum() == sum(len(g.kills) for g in games)
+
+
+def test_heatmap_bins():
+    counts = heatmap([MAP_MIN, MAP_MAX, MAP_MAX], [MAP_MIN, MAP_MAX, MAP_MAX], 2)
+
+    assert counts.tolist() == [[1, 0], [0, 2]]
+
+
+def test_heatmap_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ImportError, match=r"lol_dto\[numpy\]"):
+        heatmap([0], [0])
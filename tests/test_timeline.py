@@ -0,0 +1,80 @@
+import math
+
+import numpy
+import pytest
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGamePlayer,
+)
+from lol_dto.utilities import timeline
+from lol_dto.utilities.timeline import TIMELINE_FIELDS
+
+
+def test_snapshots_array(small_game):
+    player = small_game.teams.BLUE.players[0]
+    player.snapshots[1].championStats.health = 300
+    player.snapshots[1].damageStats.totalDamageDone = 1000
+
+    array = player.snapshots_array()
+
+    assert array.shape == (2,)
+    assert list(array.dtype.names) == TIMELINE_FIELDS
+    assert list(array["timestamp"]) == [60, 120]
+    assert list(array["totalGold"]) == [500, 800]
+    assert array["positionX"][0] == 10 and array["positionY"][0] == 20
+    assert array["health"][0] == 300 and array["totalDamageDone"][0] == 1000
+
+    # Missing values are NaN and booleans are 0 or 1
+    assert math.isnan(array["positionX"][1])
+    assert math.isnan(array["health"][1])
+    assert math.isnan(array["isAlive"][0])
+    assert array["isAlive"][1] == 0
+
+
+def test_snapshots_array_matches_objects(lol_game):
+    player = lol_game.teams.RED.players[2]
+    array = player.snapshots_array()
+
+    assert len(array) == len(player.snapshots)
+
+    for row, snapshot in zip(array, player.snapshots):
+        assert row["timestamp"] == snapshot.timestamp
+        assert row["totalGold"] == snapshot.totalGold
+        assert row["positionX"] == snapshot.position.x
+        assert row["level"] == snapshot.level
+
+
+def test_timeline_arrays(small_game):
+    array = small_game.timeline_arrays()
+
+    assert array.shape == (2, 3)
+    assert "playerId" in array.dtype.names
+    assert list(array["playerId"][:, 0]) == [1, 6]
+
+    # Both rows share the union of timestamps, with NaN where a player has no snapshot
+    assert array["timestamp"].tolist() == [[60, 90, 120]] * 2
+    assert array["totalGold"][0, [0, 2]].tolist() == [500, 800]
+    assert math.isnan(array["totalGold"][0, 1])
+    assert array["totalGold"][1, 1] == 600
+    assert numpy.isnan(array["totalGold"][1, [0, 2]]).all()
+
+
+def test_timeline_arrays_players_order(lol_game):
+    array = lol_game.timeline_arrays()
+    players = [p for team in lol_game.teams for p in team.players]
+
+    assert array.shape[0] == len(players)
+    assert array["playerId"][:, 0].tolist() == [p.id for p in players]
+
+
+def test_empty_game():
+    assert timeline.timeline_arrays(LolGame()).shape == (0, 0)
+    assert timeline.snapshots_array(LolGamePlayer()).shape == (0,)
+
+
+def test_missing_numpy(monkeypatch):
+    monkeypatch.setattr(timeline, "numpy", None)
+
+    with pytest.raises(ImportError, match=r"lol_dto\[numpy\]"):
+        timeline.timeline_arrays(LolGame())
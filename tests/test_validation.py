@@ -0,0 +1,228 @@
+import pytest
+
+from lol_dto.classes.game import (
+    LolGame,
+    LolGameKill,
+    LolGamePlayer,
+    LolGamePlayerSnapshot,
+    LolGameTeamEpicMonsterKill,
+    LolPickBan,
+    Position,
+)
+from lol_dto.utilities import from_dict
+from lol_dto.utilities.validation import (
+    ENUMS,
+    ValidationIssue,
+    get_validator,
+    register_enum,
+    validate_game,
+    validate_games,
+)
+from benchmarks.synthetic_game import make_game
+from benchmarks.validation import reflection_validate
+
+
+def get_issues(lol_game) -> list:
+    return [(issue.path, issue.code) for issue in validate_game(lol_game)]
+
+
+def test_valid_game(lol_game, game_dict):
+    assert validate_game(lol_game) == []
+    assert validate_game(from_dict(game_dict, compact=True)) == []
+    assert validate_game(from_dict(game_dict, lazy=True)) == []
+    assert validate_game(LolGame()) == []
+
+
+def test_types(lol_game):
+    lol_game.duration = "long"
+    lol_game.teams.BLUE.players[0].championId = 1.5
+    lol_game.teams.RED.players[1].snapshots[2].isAlive = 1
+    lol_game.kills[0].assistsIds = lol_game.kills[0].killerId
+    lol_game.picksBans = None
+    lol_game.teams.RED.bans = "157"
+    lol_game.teams.RED.players[2].snapshots[3] = Position(x=0, y=0)
+
+    assert sorted(get_issues(lol_game)) == [
+        ("duration", "type"),
+        ("kills[0].assistsIds", "type"),
+        ("teams.BLUE.players[0].championId", "type"),
+        ("teams.RED.bans", "type"),
+        ("teams.RED.players[1].snapshots[2].isAlive", "type"),
+        ("teams.RED.players[2].snapshots[3]", "type"),
+    ]
+
+
+def test_subclasses_and_ints_are_accepted(lol_game):
+    class CustomPickBan(LolPickBan):
+        pass
+
+    lol_game.picksBans[0] = CustomPickBan(championId=1, isBan=True, team="BLUE")
+    lol_game.duration = int(lol_game.duration)
+    lol_game.kills[0].timestamp = int(lol_game.kills[0].timestamp)
+
+    assert validate_game(lol_game) == []
+
+
+def test_missing_required_field(lol_game):
+    lol_game.teams.BLUE.players[0].snapshots[1].timestamp = None
+
+    assert get_issues(lol_game) == [
+        ("teams.BLUE.players[0].snapshots[1].timestamp", "missing")
+    ]
+
+
+def test_enums(lol_game):
+    lol_game.winner = "PURPLE"
+    lol_game.teams.BLUE.players[0].role = "ADC"
+    lol_game.teams.RED.epicMonstersKills.append(
+        LolGameTeamEpicMonsterKill(timestamp=lol_game.duration, type="NASHOR")
+    )
+
+    issues = validate_game(lol_game)
+
+    assert [(i.path, i.code) for i in issues] == [
+        ("winner", "value"),
+        ("teams.BLUE.players[0].role", "value"),
+        (
+            f"teams.RED.epicMonstersKills[{len(lol_game.teams.RED.epicMonstersKills) - 1}].type",
+            "value",
+        ),
+    ]
+    assert issues[0].message == "'PURPLE' is not one of ['BLUE', 'RED']"
+
+
+def test_register_enum(lol_game):
+    kill = lol_game.teams.BLUE.epicMonstersKills[0]
+    kill.type = "ATAKHAN"
+    values = ENUMS[LolGameTeamEpicMonsterKill]["type"]
+
+    try:
+        register_enum(LolGameTeamEpicMonsterKill, "type", values + ("ATAKHAN",))
+        assert validate_game(lol_game) == []
+
+        register_enum(LolGameTeamEpicMonsterKill, "type", None)
+        assert validate_game(lol_game) == []
+    finally:
+        register_enum(LolGameTeamEpicMonsterKill, "type", values)
+
+    assert get_issues(lol_game) == [("teams.BLUE.epicMonstersKills[0].type", "value")]
+
+
+def test_references(lol_game):
+    lol_game.kills[0].killerId = 42
+    lol_game.kills[1].assistsIds = [lol_game.teams.BLUE.players[0].id, 43]
+
+    assert get_issues(lol_game) == [
+        ("kills[0].killerId", "reference"),
+        ("kills[1].assistsIds[1]", "reference"),
+    ]
+
+
+def test_duplicate_players_ids():
+    lol_game = LolGame()
+    lol_game.teams.BLUE.players = [LolGamePlayer(id=1), LolGamePlayer(id=2)]
+    lol_game.teams.RED.players = [LolGamePlayer(id=1), LolGamePlayer()]
+
+    assert get_issues(lol_game) == [("teams.RED.players[0]", "duplicate")]
+
+
+def test_references_without_players():
+    lol_game = LolGame(kills=[LolGameKill(timestamp=10, killerId=42)])
+
+    assert validate_game(lol_game) == []
+
+
+def test_timestamps(lol_game):
+    player = lol_game.teams.BLUE.players[2]
+    player.itemsEvents[0].timestamp = -1
+    player.wardsEvents[-1].timestamp = lol_game.duration + 0.5
+    player.skillsLevelUpEvents[-1].timestamp = lol_game.duration + 2
+    lol_game.kills[1].timestamp = lol_game.kills[2].timestamp + 1
+    player.levelUpEvents = [120, 60]
+
+    assert sorted(get_issues(lol_game)) == [
+        ("kills[2]", "order"),
+        ("teams.BLUE.players[2].itemsEvents[0].timestamp", "timestamp"),
+        ("teams.BLUE.players[2].levelUpEvents[1]", "order"),
+        (
+            f"teams.BLUE.players[2].skillsLevelUpEvents[{len(player.skillsLevelUpEvents) - 1}].timestamp",
+            "timestamp",
+        ),
+    ]
+
+
+def test_unsorted_snapshots(lol_game):
+    player = lol_game.teams.BLUE.players[0]
+    player.snapshots.reverse()
+
+    assert validate_game(lol_game) == []
+
+    player.snapshots[0].timestamp = -1
+
+    assert get_issues(lol_game) == [
+        ("teams.BLUE.players[0].snapshots[0].timestamp", "timestamp")
+    ]
+
+
+def test_positions(lol_game):
+    snapshot = lol_game.teams.RED.players[0].snapshots[4]
+    snapshot.position = Position(x=-500, y=100)
+    lol_game.kills[0].position = Position(x=14870, y=-120)
+
+    issues = validate_game(lol_game)
+
+    assert [(i.path, i.code) for i in issues] == [
+        ("teams.RED.players[0].snapshots[4].position", "position")
+    ]
+    assert issues[0].message == "(-500, 100) is outside of the map"
+
+
+def test_validate_games(lol_game):
+    invalid_game = LolGame(winner="PURPLE")
+
+    def games():
+        yield lol_game
+        yield invalid_game
+        yield lol_game
+
+    reports = list(validate_games(games()))
+
+    assert [(r.index, r.ok) for r in reports] == [(0, True), (1, False), (2, True)]
+    assert reports[1].issues == [
+        ValidationIssue("winner", "value", "'PURPLE' is not one of ['BLUE', 'RED']")
+    ]
+
+    assert [r.index for r in validate_games(games(), only_invalid=True)] == [1]
+
+
+def test_validator_is_cached():
+    validator = get_validator()
+
+    assert get_validator() is validator
+    assert validator.source.startswith("# Generated by lol_dto.utilities.validation")
+    assert get_validator(LolGamePlayer).cls is LolGamePlayer
+
+
+def test_other_class():
+    player = LolGamePlayer(role="ADC", snapshots=[LolGamePlayerSnapshot(timestamp=-1)])
+
+    assert [(i.path, i.code) for i in validate_game(player, LolGamePlayer)] == [
+        ("role", "value"),
+        ("snapshots[0].timestamp", "timestamp"),
+    ]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_same_issues_as_reflection(seed):
+    lol_game = make_game(seed=seed)
+    player_ids = {p.id for team in lol_game.teams for p in team.players}
+
+    lol_game.teams.BLUE.players[seed].role = "ADC"
+    lol_game.kills[seed].victimId = 99
+    lol_game.teams.RED.players[seed].snapshots[seed].totalGold = "1000"
+
+    expected = reflection_validate(lol_game, "", player_ids, [])
+
+    assert sorted(("." + i.path, i.code) for i in validate_game(lol_game)) == sorted(
+        expected
+    )